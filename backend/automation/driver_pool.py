@@ -0,0 +1,202 @@
+"""
+Pool of warm FacebookPageGenerator instances, the one place this process
+starts Chrome for its jobs.
+
+Starting a generator launches Chrome and, outside test mode, logs in to
+Facebook; both take seconds. Views that only need a browser for one call
+(invites, health check, benchmarks) and the page-creation runs
+(run_task_sync, the Celery shards) borrow a started generator from here
+and hand it back afterwards, keeping its session. SELENIUM_MAX_BROWSERS
+caps the Chrome processes of all of them together.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from .selenium_driver import FacebookPageGenerator
+
+logger = logging.getLogger(__name__)
+
+# Live generators (idle + borrowed) across all keys, i.e. Chrome processes
+MAX_BROWSERS = getattr(settings, 'SELENIUM_MAX_BROWSERS', 2)
+
+# Idle generators are quit after this many seconds
+IDLE_TIMEOUT = 300
+
+_cond = threading.Condition()
+_idle: dict = {}  # key -> list of (generator, returned_at)
+_live = 0
+_reaper = None
+
+
+def _quit(generator: FacebookPageGenerator):
+    try:
+        generator.stop()
+    except Exception as e:
+        logger.warning(f"Could not quit pooled generator: {e}")
+
+
+def _is_alive(generator: FacebookPageGenerator) -> bool:
+    """Cheap liveness probe of an idle generator's browser"""
+    try:
+        generator.driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _pop_idle(key):
+    """Newest idle generator for key, or None (caller holds _cond)"""
+    entries = _idle.get(key)
+    if entries:
+        generator, _ = entries.pop()
+        return generator
+    return None
+
+
+def _evict_other(key) -> bool:
+    """Quit one idle generator of another key to free a slot (caller holds _cond)"""
+    global _live
+    for other_key, entries in _idle.items():
+        if other_key != key and entries:
+            generator, _ = entries.pop(0)
+            _live -= 1
+            _quit(generator)
+            return True
+    return False
+
+
+def _reap_idle():
+    """Background loop quitting generators idle for longer than IDLE_TIMEOUT"""
+    global _live
+    while True:
+        time.sleep(60)
+        expired = []
+        with _cond:
+            cutoff = time.monotonic() - IDLE_TIMEOUT
+            for entries in _idle.values():
+                while entries and entries[0][1] < cutoff:
+                    expired.append(entries.pop(0)[0])
+            _live -= len(expired)
+            if expired:
+                _cond.notify_all()
+        for generator in expired:
+            _quit(generator)
+        if expired:
+            logger.info(f"Quit {len(expired)} idle pooled generators")
+
+
+def _ensure_reaper():
+    global _reaper
+    if _reaper is None:
+        _reaper = threading.Thread(target=_reap_idle, name='driver-pool-reaper', daemon=True)
+        _reaper.start()
+
+
+@contextmanager
+def acquire(headless: bool = True, test_mode: bool = True, timeout: int = 30,
+            kill_orphans: bool = False, wait_timeout: float = None):
+    """
+    Borrow a started generator with the given options.
+
+    Blocks while MAX_BROWSERS generators are borrowed, at most wait_timeout
+    seconds if given (then raises TimeoutError). The generator goes back to
+    the pool on a clean exit and is quit if the block raised, since its
+    browser state is then unknown. kill_orphans is passed to start() when a
+    new browser has to be launched.
+    """
+    global _live
+    key = (headless, test_mode, timeout)
+    deadline = time.monotonic() + wait_timeout if wait_timeout is not None else None
+
+    while True:
+        with _cond:
+            _ensure_reaper()
+            while True:
+                generator = _pop_idle(key)
+                if generator is not None:
+                    break
+                if _live < MAX_BROWSERS or _evict_other(key):
+                    _live += 1
+                    break
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No browser free within {wait_timeout}s ({MAX_BROWSERS} in use)")
+                _cond.wait(remaining)
+
+        # Browsers can die while parked (crash, killed by another process)
+        if generator is None or _is_alive(generator):
+            break
+        logger.warning("Pooled generator's browser is gone, quitting it")
+        _quit(generator)
+        with _cond:
+            _live -= 1
+            _cond.notify()
+
+    if generator is None:
+        try:
+            generator = FacebookPageGenerator(headless=headless, timeout=timeout, test_mode=test_mode)
+            # start() skips the orphan cleanup while other generators are live
+            generator.start(kill_orphans=kill_orphans)
+        except Exception:
+            with _cond:
+                _live -= 1
+                _cond.notify()
+            raise
+
+    generator.reset_metrics()
+    try:
+        yield generator
+    except BaseException:
+        _quit(generator)
+        with _cond:
+            _live -= 1
+            _cond.notify()
+        raise
+
+    try:
+        generator.reset_to_blank()
+    except Exception as e:
+        logger.warning(f"Pooled generator is unusable, quitting it: {e}")
+        _quit(generator)
+        with _cond:
+            _live -= 1
+            _cond.notify()
+        return
+
+    with _cond:
+        _idle.setdefault(key, []).append((generator, time.monotonic()))
+        _cond.notify()
+
+
+def close_pool():
+    """Quit every idle pooled generator (called automatically at interpreter exit)"""
+    global _live
+    with _cond:
+        idle = [generator for entries in _idle.values() for generator, _ in entries]
+        _idle.clear()
+        _live -= len(idle)
+    for generator in idle:
+        _quit(generator)
+
+
+atexit.register(close_pool)
+
+
+def ensure_logged_in(generator: FacebookPageGenerator, email: str, password: str) -> bool:
+    """Log a pooled generator in as email unless it already is"""
+    if generator.test_mode:
+        return True
+    if generator.logged_in and generator.current_profile_email == email:
+        return True
+    if generator.logged_in:
+        generator.logout_facebook()
+    if generator.login_facebook(email=email, password=password):
+        generator.current_profile_email = email
+        return True
+    return False
@@ -4,6 +4,7 @@ Generates names with 70% female and 30% male distribution.
 """
 
 import random
+import zlib
 from typing import List, Tuple
 
 FEMALE_NAMES = [
@@ -57,6 +58,14 @@ def generate_page_names(base_name: str, count: int) -> List[Tuple[str, str]]:
     return page_names
 
 
+def _name_seed(base_name: str) -> int:
+    """
+    Seed offset for base_name that is the same in every process (hash() of
+    a str is randomized per process, so web and Celery runs would differ)
+    """
+    return zlib.crc32(base_name.encode('utf-8'))
+
+
 def get_page_name_for_sequence(base_name: str, sequence_num: int, total_count: int) -> Tuple[str, str]:
     """
     Get a deterministic page name for a specific sequence number.
@@ -79,7 +88,7 @@ def get_page_name_for_sequence(base_name: str, sequence_num: int, total_count: i
     is_female = position_in_cycle < 7
 
     # Seed random with sequence number for consistent name selection
-    random.seed(sequence_num + hash(base_name))
+    random.seed(sequence_num + _name_seed(base_name))
 
     if is_female:
         name = random.choice(FEMALE_NAMES)
@@ -92,3 +101,24 @@ def get_page_name_for_sequence(base_name: str, sequence_num: int, total_count: i
     random.seed()
 
     return (f"{base_name} - {name}", gender)
+
+
+def get_page_names_for_sequence(base_name: str, total_count: int) -> List[Tuple[str, str]]:
+    """
+    Page names for sequence numbers 1..total_count in one call.
+
+    Same names as calling get_page_name_for_sequence for each number, but
+    uses a private Random per name instead of reseeding the global one.
+
+    Returns:
+        List of (page_name, gender) tuples, index 0 = sequence number 1
+    """
+    base_seed = _name_seed(base_name)
+    names = []
+    for sequence_num in range(1, total_count + 1):
+        rng = random.Random(sequence_num + base_seed)
+        if (sequence_num - 1) % 10 < 7:
+            names.append((f"{base_name} - {rng.choice(FEMALE_NAMES)}", "female"))
+        else:
+            names.append((f"{base_name} - {rng.choice(MALE_NAMES)}", "male"))
+    return names
@@ -0,0 +1,361 @@
+"""
+Page-creation loop shared by the in-process task runner
+(pages.views.run_task_sync) and the Celery shards (automation.tasks), so
+both paths rotate creator profiles, retry and share pages the same way,
+and the parallel helpers that run it (or the share flow) on several pooled
+browsers at once.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from pages.cancellation import is_cancelled
+from . import driver_pool
+from .selenium_driver import InviteResult, _RATE_LIMIT_RE
+
+logger = logging.getLogger(__name__)
+
+# Created pages/invites are written to storage together with the counter
+# changes of the same pages, every this many pages or once this many
+# seconds have passed since the last write, whichever comes first. A real
+# page takes longer than PAGE_FLUSH_SECONDS, so real runs write after every
+# page and keep progress current; fast test-mode runs are batched.
+PAGE_FLUSH_EVERY = 10
+PAGE_FLUSH_SECONDS = 5.0
+
+
+def _shard_ranges(num_pages: int, workers: int) -> list:
+    """Split sequence numbers 1..num_pages into contiguous [start, end) ranges"""
+    workers = max(1, min(workers, num_pages))
+    size, extra = divmod(num_pages, workers)
+    ranges = []
+    start = 1
+    for w in range(workers):
+        end = start + size + (1 if w < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+class SharedBackoff:
+    """
+    Rate-limit backoff window shared by the generators of one bulk run.
+    They create pages for the same profiles, so when Facebook throttles one
+    of them, none should create a page before the window closes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.next_allowed_ts = 0.0
+
+    def sync(self, generator):
+        """Merge generator's window with the shared one, both ways"""
+        with self._lock:
+            self.next_allowed_ts = max(self.next_allowed_ts, generator._next_allowed_ts)
+            generator._next_allowed_ts = self.next_allowed_ts
+
+
+def creator_profiles(profiles: list, email: str, password: str, pages_per_profile: int) -> list:
+    """
+    Profiles to rotate through: the configured CREATOR_PROFILES, or the
+    single CREATOR_PROFILE_EMAIL/PASSWORD profile when none are configured.
+    """
+    if profiles:
+        return profiles
+    if email and password:
+        return [{
+            'email': email,
+            'password': password,
+            'name': 'Default Profile',
+            'pages_per_session': pages_per_profile
+        }]
+    return []
+
+
+def login(generator, profiles: list) -> str:
+    """Log the generator in with the first working profile; an error message, or "" on success"""
+    if generator.test_mode:
+        return ""
+    if not profiles:
+        return 'No creator profiles configured'
+
+    generator.set_profiles(profiles)
+    logger.info(f"MULTI-PROFILE MODE: {len(profiles)} profiles configured")
+    logger.info(f"Pages per profile before rotation: {generator.pages_per_profile}")
+    if not generator.login_with_rotation():
+        return 'Facebook login failed for all profiles'
+    return ""
+
+
+def run_pages(generator, store, task_id: str, names: list, start: int = 1,
+              public_profile_url: str = "", remote_cancel: bool = False,
+              assigned_bm: str = "", backoff: SharedBackoff = None) -> dict:
+    """
+    Create a page for each (name, gender) in names, numbered from start,
+    with a generator already logged in through login().
+
+    MULTI-PROFILE ROTATION FLOW:
+    1. Create pages with the current profile up to its page limit
+    2. After the limit: logout → login with the next profile
+    3. When a page fails: switch to the next profile and retry it once
+    4. Repeat until all pages are created or all profiles are exhausted
+
+    Each new page is shared to public_profile_url while still on it and
+    stored with the task's assigned_bm, if any. Pages, invites and counters
+    are written through store.flush_task_writes every PAGE_FLUSH_EVERY pages
+    or PAGE_FLUSH_SECONDS, and once more at the end, also when the loop is
+    cancelled or raises. Pass remote_cancel=True from Celery workers, and
+    backoff when other generators create pages for the same profiles.
+
+    Returns:
+        dict with processed/success/failed counts and a per-page list
+    """
+    test_mode = generator.test_mode
+    results = {
+        'processed': 0,
+        'success': 0,
+        'failed': 0,
+        'pages': []
+    }
+    pending_pages = []
+    pending_invites = []
+    pending_counts = Counter()
+    last_flush = time.monotonic()
+
+    def flush():
+        nonlocal last_flush
+        store.flush_task_writes(task_id, pending_pages, pending_invites, pending_counts)
+        pending_pages.clear()
+        pending_invites.clear()
+        pending_counts.clear()
+        last_flush = time.monotonic()
+
+    def record_page(result, sequence_num, gender) -> bool:
+        doc = {
+            'task_id': task_id,
+            'page_id': result.page_id,
+            'page_name': result.page_name,
+            'page_url': result.page_url,
+            'sequence_num': sequence_num,
+            'gender': gender,
+            'assigned_bm': assigned_bm,
+        }
+        # Pages the store would reject (JSON storage: invalid URL) count as failed
+        if not store.accepts_page_url(result.page_url):
+            logger.warning(f"✗ Page '{result.page_name}' NOT stored - invalid URL: {result.page_url}")
+            return False
+        pending_pages.append(doc)
+        pending_counts['pages_created'] += 1
+        logger.debug(f"✓ Page '{result.page_name}' queued for storage with ID: {result.page_id}")
+        return True
+
+    def share(result):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Immediately sharing page '{result.page_name}' to profile...")
+        invite_result = generator.share_page_to_profile(
+            page_id=result.page_id,
+            profile_url=public_profile_url,
+            role='admin',
+            page_name=result.page_name
+        )
+        if invite_result.success:
+            pending_invites.append({
+                'page_id': result.page_id,
+                'page_name': result.page_name,
+                'invitee_email': public_profile_url,
+                'invite_link': invite_result.invite_link,
+                'role': 'admin',
+                'invited_by': generator.current_profile_email,
+            })
+            pending_counts['shares_sent'] += 1
+            logger.debug(f"Successfully shared page '{result.page_name}' to profile")
+        else:
+            pending_counts['shares_failed'] += 1
+            logger.warning(f"Failed to share page '{result.page_name}': {invite_result.error}")
+
+    try:
+        for i, (page_name, gender) in enumerate(names, start=start):
+            if is_cancelled(task_id, remote=remote_cancel):
+                logger.info(f"Task {task_id} cancelled by user")
+                break
+
+            # Check if we should rotate to next profile before creating page
+            if not test_mode and generator.should_rotate_profile():
+                logger.info(f"ROTATION: Profile {generator.current_profile_email} reached page limit")
+                logger.info(f"Status: {generator.get_rotation_status()}")
+                if not generator.has_more_profiles():
+                    logger.warning("ROTATION: No more profiles available, continuing with current")
+                elif generator.rotate_to_next_profile():
+                    logger.info(f"ROTATION: Switched to profile: {generator.current_profile_email}")
+                else:
+                    logger.warning("ROTATION: Failed to rotate, continuing with current profile")
+
+            logger.debug(f"[{generator.current_profile_email}] Creating page {i}/{start + len(names) - 1}: {page_name}")
+            if backoff:
+                backoff.sync(generator)
+            result = generator.create_facebook_page(page_name)
+
+            if not result.success:
+                logger.warning(f"FAILED to create page '{page_name}': {result.error}")
+                if _RATE_LIMIT_RE.search(result.error or ""):
+                    logger.warning(f"RATE LIMIT DETECTED: '{result.error}'")
+
+                # On ANY page creation failure, retry once with the next profile
+                if not test_mode and generator.has_more_profiles():
+                    logger.warning("Page creation failed! Switching to next profile...")
+                    if generator.rotate_to_next_profile():
+                        logger.info(f"RETRYING page '{page_name}' with profile {generator.current_profile_email}...")
+                        if backoff:
+                            backoff.sync(generator)
+                        result = generator.create_facebook_page(page_name)
+                        if result.success:
+                            logger.info(f"✓ RETRY SUCCESS: Page '{page_name}' created with new profile!")
+                        else:
+                            logger.warning(f"✗ RETRY FAILED: Page '{page_name}' still couldn't be created")
+                    else:
+                        logger.warning("No more profiles to try, marking page as failed")
+                elif not test_mode:
+                    logger.warning("No more profiles available - cannot retry")
+
+            if backoff:
+                backoff.sync(generator)
+
+            stored = False
+            if result.success:
+                # Track page count for rotation
+                generator.increment_page_count()
+                stored = record_page(result, i, gender)
+                if stored and public_profile_url:
+                    share(result)
+
+            if stored:
+                results['success'] += 1
+            else:
+                pending_counts['pages_failed'] += 1
+                results['failed'] += 1
+            results['processed'] += 1
+            results['pages'].append({
+                'name': page_name,
+                'page_id': result.page_id,
+                'page_url': result.page_url,
+                'success': stored,
+                'duration': result.duration,
+                'error': result.error
+            })
+            if (results['processed'] % PAGE_FLUSH_EVERY == 0
+                    or time.monotonic() - last_flush >= PAGE_FLUSH_SECONDS):
+                flush()
+
+        if not test_mode:
+            logger.info(f"TASK COMPLETE. Final rotation status: {generator.get_rotation_status()}")
+    finally:
+        # Keep what was created before a failure or cancellation
+        try:
+            flush()
+        except Exception as e:
+            logger.error(f"Failed to store pending pages/invites of task {task_id}: {e}")
+
+    return results
+
+
+def create_pages_bulk(store, task_id: str, names: list, profiles: list, concurrency: int = 1,
+                      headless: bool = True, test_mode: bool = True, timeout: int = 30,
+                      pages_per_profile: int = 3, public_profile_url: str = "",
+                      assigned_bm: str = "") -> dict:
+    """
+    Create a page for each (name, gender) in names with up to concurrency
+    browsers at once, one thread per browser.
+
+    names is split into contiguous runs (see _shard_ranges); each thread
+    borrows a generator from driver_pool (concurrency is capped at
+    SELENIUM_MAX_BROWSERS), logs it in through login() and creates its run
+    with run_pages, keeping the page numbering. The threads share one
+    rate-limit backoff window.
+
+    Returns the run_pages counts of all threads, with the pages in name
+    order and an 'error' joining the errors of threads that could not log
+    in or raised.
+    """
+    ranges = _shard_ranges(len(names), min(concurrency, driver_pool.MAX_BROWSERS))
+    backoff = SharedBackoff()
+
+    def run(start: int, end: int) -> dict:
+        # The orphan cleanup would kill the other threads' browsers
+        with driver_pool.acquire(headless=headless, test_mode=test_mode, timeout=timeout,
+                                 kill_orphans=len(ranges) == 1) as generator:
+            generator.pages_per_profile = pages_per_profile
+            error = login(generator, profiles)
+            if error:
+                return {'processed': 0, 'success': 0, 'failed': 0, 'pages': [], 'error': error}
+            return run_pages(generator, store, task_id, names[start - 1:end - 1], start=start,
+                             public_profile_url=public_profile_url, assigned_bm=assigned_bm,
+                             backoff=backoff if len(ranges) > 1 else None)
+
+    if len(ranges) > 1:
+        logger.info(f"Task {task_id}: creating {len(names)} pages with {len(ranges)} browsers")
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(run, start, end) for start, end in ranges]
+
+    results = {
+        'processed': 0,
+        'success': 0,
+        'failed': 0,
+        'pages': []
+    }
+    errors = []
+    for (start, end), future in zip(ranges, futures):
+        try:
+            part = future.result()
+        except Exception as e:
+            logger.error(f"Pages [{start}, {end}) of task {task_id} failed with error: {e}")
+            errors.append(str(e))
+            continue
+        for key in ('processed', 'success', 'failed'):
+            results[key] += part[key]
+        results['pages'].extend(part['pages'])
+        if part.get('error'):
+            errors.append(part['error'])
+    if errors:
+        results['error'] = '; '.join(errors)
+    return results
+
+
+def share_page_to_profiles(page_id: str, profiles: list, role: str = "admin", page_name: str = "",
+                           concurrency: int = 1, headless: bool = True, test_mode: bool = True,
+                           timeout: int = 30, email: str = "", password: str = "",
+                           wait_timeout: float = None) -> list:
+    """
+    Share one Page to several profiles with up to concurrency pooled
+    browsers at once (capped at SELENIUM_MAX_BROWSERS), one thread each.
+
+    profiles is a list of (profile_url, profile_name) pairs. Each invite
+    borrows a generator from driver_pool, logs it in as email and reopens
+    the Page, since the share flow starts from the Page itself.
+
+    Returns the InviteResults in the same order as profiles.
+    """
+    page_url = f"https://www.facebook.com/profile.php?id={page_id}"
+
+    def share(profile) -> InviteResult:
+        profile_url, profile_name = profile
+        try:
+            with driver_pool.acquire(headless=headless, test_mode=test_mode, timeout=timeout,
+                                     wait_timeout=wait_timeout) as generator:
+                if not driver_pool.ensure_logged_in(generator, email, password):
+                    return InviteResult(success=False, page_id=page_id, invitee_email=profile_url,
+                                        error='Facebook login failed')
+                if not test_mode:
+                    generator.driver.get(page_url)
+                    generator.wait_for_page_load()
+                return generator.share_page_to_profile(page_id, profile_url, role, page_name, profile_name)
+        except Exception as e:
+            logger.error(f"Could not share page {page_id} to {profile_url}: {e}")
+            return InviteResult(success=False, page_id=page_id, invitee_email=profile_url, error=str(e))
+
+    workers = max(1, min(concurrency, driver_pool.MAX_BROWSERS, len(profiles)))
+    logger.info(f"Sharing page {page_id} to {len(profiles)} profiles with {workers} browser(s)")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(share, profiles))
@@ -6,11 +6,16 @@ Supports both real Facebook automation and test mode (httpbin.org).
 import time
 import uuid
 import re
+import random
 import json
 import os
+import shutil
 import subprocess
 import platform
+import threading
+import atexit
 from typing import Optional
+from urllib.parse import urlparse, parse_qs
 from dataclasses import dataclass
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -19,15 +24,71 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, NoSuchElementException, StaleElementReferenceException,
+    ElementNotInteractableException, ElementClickInterceptedException
+)
 from webdriver_manager.chrome import ChromeDriverManager
 import logging
 
+try:
+    import orjson  # Optional: faster JSON for cookie/selector files
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Default cookie file path
 DEFAULT_COOKIES_PATH = os.path.join(os.path.dirname(__file__), '..', 'facebook_cookies.json')
 
+# Per-field selector win counts, used to try historically successful selectors first.
+# Runtime data, kept in a cache dir outside the source tree
+SELECTOR_STATS_PATH = os.environ.get(
+    'SELECTOR_STATS_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '.cache', 'selector_stats.json')
+)
+
+# Phrases Facebook shows when it throttles or blocks an action.
+# Compiled once into a single alternation so the page text is scanned in one pass.
+RATE_LIMIT_PHRASES = (
+    "try again later",
+    "you're temporarily blocked",
+    "temporarily blocked",
+    "rate limit",
+    "too many",
+    "slow down",
+    "something went wrong",
+    "couldn't create",
+    "can't create",
+    "please try again",
+    "action blocked",
+    "we limit how often",
+)
+_RATE_LIMIT_RE = re.compile('|'.join(re.escape(p) for p in RATE_LIMIT_PHRASES), re.IGNORECASE)
+
+# Page ID formats in the URL Facebook redirects to after page creation:
+# profile.php?id=<id> (group 1) or facebook.com/<id> (group 2), in one pass
+_FB_PAGE_URL_RE = re.compile(r'profile\.php\?id=(\d+)|facebook\.com/(\d+)')
+
+
+def _load_json_file(path: str):
+    """Read a JSON file, using orjson when it is installed"""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dump_json_file(path: str, data):
+    """Write a JSON file, using orjson when it is installed"""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
 
 @dataclass
 class PageResult:
@@ -73,17 +134,407 @@ class FacebookPageGenerator:
     FACEBOOK_PAGES_URL = "https://www.facebook.com/pages/creation/"
     TEST_URL = "https://httpbin.org/forms/post"
 
+    # Subresources the automation never looks at; blocked via CDP to speed up page loads
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+        "*.woff", "*.woff2", "*.ttf",
+        "*.mp4", "*.webm",
+    ]
+
+    # Telemetry, pixel and ad requests; never needed for the page to work
+    TRACKER_URL_PATTERNS = [
+        "*facebook.com/tr?*", "*facebook.com/tr/*",
+        "*/ajax/bz*", "*/ajax/bnzai*", "*/ajax/webstorage/process_keys*",
+        "*/logging/falco*", "*pixel.facebook.com*",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    ]
+
+    # Exponential backoff bounds (seconds) used when a rate limit is detected
+    RATE_LIMIT_BASE_DELAY = 2.0
+    RATE_LIMIT_MAX_DELAY = 600.0
+
+    # Selector strategy for _find_first: value is (css, text) and matches elements
+    # of the CSS selector whose trimmed textContent equals text. Replaces
+    # //tag[text()='...'] XPaths with the browser's faster CSS matcher.
+    _BY_TEXT = "text"
+
+    # arguments[0] is a list of groups of [strategy, selector] pairs. For each
+    # group, returns [element, index] for the first visible, enabled element
+    # matching its pairs (tried in order), or null - all in one round-trip.
+    # arguments[1] optionally holds one lowercase substring per group that the
+    # element's text must contain (null to skip the check). Compiled XPath
+    # expressions are kept on window, so polling the same selectors parses
+    # each XPath once per page load
+    _FIND_FIRST_JS = """
+        const texts = arguments[1] || [];
+        const xpc = window.__fbXPathCache || (window.__fbXPathCache = new Map());
+        const compile = sel => {
+            let expr = xpc.get(sel);
+            if (!expr) { expr = document.createExpression(sel); xpc.set(sel, expr); }
+            return expr;
+        };
+        const first = (pairs, g) => {
+            const want = texts[g];
+            const usable = e => e && e.getClientRects().length > 0 && !e.disabled &&
+                (!want || (e.innerText || e.textContent).toLowerCase().includes(want));
+            for (let n = 0; n < pairs.length; n++) {
+                const [kind, sel] = pairs[n];
+                try {
+                    if (kind === 'xpath') {
+                        // Iterator, not snapshot: stops at the first usable node
+                        const r = compile(sel).evaluate(document, XPathResult.ORDERED_NODE_ITERATOR_TYPE, null);
+                        for (let e = r.iterateNext(); e; e = r.iterateNext()) {
+                            if (usable(e)) return [e, n];
+                        }
+                    } else if (kind === 'text') {
+                        for (const e of document.querySelectorAll(sel[0])) {
+                            if (e.textContent.trim() === sel[1] && usable(e)) return [e, n];
+                        }
+                    } else {
+                        for (const e of document.querySelectorAll(sel)) { if (usable(e)) return [e, n]; }
+                    }
+                } catch (err) {}
+            }
+            return null;
+        };
+        return arguments[0].map(first);
+    """
+
+    # Scrolls to and clicks the first visible, enabled element matching the CSS
+    # selector in arguments[0] whose text is arguments[1]; returns the clicked
+    # element (or null) so callers can wait for it to go stale
+    _CLICK_FIRST_TEXT_JS = """
+        for (const e of document.querySelectorAll(arguments[0])) {
+            if (e.textContent.trim() === arguments[1] && e.getClientRects().length > 0 && !e.disabled) {
+                e.scrollIntoView({block: 'center'});
+                e.click();
+                return e;
+            }
+        }
+        return null;
+    """
+
+    # Selector groups for _find_any, built once instead of on every call
+    _LOGIN_FORM_INDICATORS = ("input#email", "input[name='email']", "button[name='login']")
+    _LOGGED_IN_INDICATORS = (
+        "div[aria-label='Your profile']",
+        "div[aria-label='Account']",
+        "a[href*='/me/']",
+    )
+    _COOKIE_SELECTORS = (
+        "button[data-cookiebanner='accept_button']",
+        "button[title='Allow all cookies']",
+        "div[aria-label='Allow all cookies']",
+    )
+    # Text matches have no CSS equivalent
+    _COOKIE_TEXT_SELECTORS = (
+        "//button[contains(text(), 'Accept All')]",
+        "//button[contains(text(), 'Allow all cookies')]",
+        "//button[contains(text(), 'Accept all')]",
+        "//button[contains(text(), 'Allow All')]",
+        "//span[text()='Allow all cookies']/parent::button",
+        "//span[text()='Accept All']/parent::button",
+        # Additional selectors for different Facebook regions
+        "//button[contains(text(), 'Allow essential and optional cookies')]",
+        "//button[contains(text(), 'Only allow essential cookies')]",
+    )
+    _EMAIL_SELECTORS = (
+        "#email",
+        "input[name='email']",
+        "input[data-testid='royal_email']",
+        "input[data-testid='royal-email']",
+        "input[aria-label='Email address or phone number']",
+        "input.inputtext[name='email']",
+    )
+    _PASSWORD_SELECTORS = (
+        "#pass",
+        "input[name='pass']",
+        "input[type='password']",
+        "input[aria-label='Password']",
+        "input.inputtext[name='pass']",
+    )
+    _LOGIN_BUTTON_SELECTORS = ("#loginbutton", "[name='login']", "button[type='submit']")
+    _LOGIN_BUTTON_TEXT_SELECTORS = (
+        "//button[text()='Log in']",
+        "//button[text()='Log In']",
+        "//button[contains(@class, '_42ft')]",
+    )
+    # Labels that only render once the new Page exists (checked in one XPath)
+    _PAGE_CREATED_XPATH = (
+        "//span[contains(text(), 'Professional dashboard') or contains(text(), 'Professional Dashboard')"
+        " or contains(text(), 'Manage Page') or contains(text(), 'Edit Page')"
+        " or contains(text(), 'Page settings')]"
+    )
+    # Async script: resolves with location.href as soon as the URL matches the
+    # regex source in arguments[1] and the XPath in arguments[0] finds a node,
+    # re-checking on every DOM mutation; resolves null after arguments[2] ms
+    _AWAIT_PAGE_CREATED_JS = """
+        const [xpath, urlSource, timeoutMs, done] = arguments;
+        const urlRe = new RegExp(urlSource);
+        let finished = false;
+        const finish = value => {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            clearTimeout(timer);
+            done(value);
+        };
+        const check = () => {
+            if (urlRe.test(location.href) && document.evaluate(
+                    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) {
+                finish(location.href);
+            }
+        };
+        const observer = new MutationObserver(check);
+        const timer = setTimeout(() => finish(null), timeoutMs);
+        observer.observe(document, {childList: true, subtree: true, characterData: true});
+        check();
+    """
+    # Inputs that show the page creation form (or its radio pre-step) is open
+    _PAGE_FORM_INPUTS_CSS = "input[type='text'], input[type='search'], input[type='radio']"
+    # X button of open dialogs, as one comma-separated union for find_elements
+    _CLOSE_DIALOG_CSS = (
+        "div[aria-label='Close'], [aria-label='Close'], "
+        "i.x1b0d499, svg[aria-label='Close']"
+    )
+    _NOT_NOW_SELECTORS = ("div[aria-label='Not now']",)
+    _NOT_NOW_TEXT_SELECTORS = (
+        "//button[contains(text(), 'Not Now')]",
+        "//a[contains(text(), 'Not Now')]",
+        "//span[text()='Not Now']",
+    )
+    _SEE_MORE_SELECTORS = (
+        "//span[text()='See more']",
+        "//span[contains(text(), 'See more')]",
+        "//div[text()='See more']",
+    )
+    _PAGES_SELECTORS = (
+        "//span[text()='Pages']",
+        "//span[contains(text(), 'Pages')]",
+        "//div[text()='Pages']",
+    )
+    _CREATE_PAGE_SELECTORS = (
+        "//span[text()='Create new Page']",
+        "//span[contains(text(), 'Create new Page')]",
+        "//span[text()='Create New Page']",
+        "//div[text()='Create new Page']",
+        # Direct creation link last
+        "//a[contains(@href, 'pages/creation')]",
+    )
+
+    # Share-to-profile flow (_real_share_to_profile), as (By, value) pairs.
+    # Each list runs exact text()/attribute matches first, then class chains
+    # (pinned to the button label with _BY_TEXT), then contains()/following::
+    # catch-alls. Every selector names its button, so no Python-side text check.
+    # Attribute matches use CSS, which the browser resolves natively.
+    _SWITCH_SELECTORS = (
+        (By.XPATH, "//span[text()='Switch Now'] | //span[contains(text(), 'Switch Now')] | //span[text()='Switch']"),
+        (_BY_TEXT, ("span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft", "Switch Now")),
+    )
+    _USE_PAGE_SELECTORS = (
+        (By.XPATH, "//span[text()='Use Page']"),
+        (By.XPATH, "//span[text()='Use page']"),
+        (_BY_TEXT, ("span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft", "Use Page")),
+        (By.XPATH, "//div[@role='button' and .//span[contains(translate(., 'UP', 'up'), 'use page')]]"),
+        (By.XPATH, "//span[contains(text(), 'Use Page')]"),
+    )
+    _DASHBOARD_SELECTORS = (
+        (By.CSS_SELECTOR, "a[href*='professional_dashboard']"),
+        (By.XPATH, "//span[text()='Professional dashboard']"),
+        (By.XPATH, "//div[@role='button']//span[text()='Professional dashboard']"),
+        (By.XPATH, "//span[contains(text(), 'Professional dashboard')]"),
+        (By.XPATH, "//div[contains(@class, 'x1i10hfl')]//span[contains(text(), 'Professional')]"),
+    )
+    _DASHBOARD_SIDEBAR_SELECTORS = (
+        (By.CSS_SELECTOR, "div[aria-label*='Professional dashboard']"),
+        (By.XPATH, "//a[contains(text(), 'Professional dashboard')]"),
+    )
+    _TOUR_SELECTORS = (
+        (By.XPATH, "//span[text()='Start with tour']"),
+        # Also check for "Skip" or "Not now" buttons to dismiss tour
+        (By.XPATH, "//span[text()='Skip']"),
+        (By.XPATH, "//span[text()='Not now']"),
+        (By.XPATH, "//span[text()='Skip tour']"),
+        (By.XPATH, "//div[@role='button']//span[text()='Start with tour']"),
+        (By.XPATH, "//span[contains(text(), 'Start with tour')]"),
+    )
+    _TOUR_SKIP_SELECTORS = (
+        (By.XPATH, "//span[text()='Skip']"),
+        (By.XPATH, "//span[text()='Done']"),
+        (By.XPATH, "//span[text()='Got it']"),
+        (By.CSS_SELECTOR, "div[aria-label='Close'], [aria-label='Close']"),
+    )
+    _PAGE_ACCESS_SELECTORS = (
+        (By.CSS_SELECTOR, "a[href*='page_access']"),
+        # Direct text match for "Page access"
+        (By.XPATH, "//span[text()='Page access']"),
+        (By.XPATH, "//div[text()='Page access']"),
+        # Link-style selectors
+        (By.XPATH, "//a[.//span[text()='Page access']]"),
+        (By.XPATH, "//div[@role='link'][.//span[text()='Page access']]"),
+        # Find by partial text match
+        (By.XPATH, "//span[contains(text(), 'Page access')]"),
+        # Look for the description text and click parent
+        (By.XPATH, "//span[contains(text(), 'Invite people to help manage')]"),
+        # Div with the icon and text
+        (By.XPATH, "//div[contains(@class, 'x1i10hfl')][.//span[text()='Page access']]"),
+        # Under "Your Page tools" section header
+        (By.XPATH, "//*[contains(text(), 'Your Page tools')]/following::*[contains(text(), 'Page access')][1]"),
+    )
+    _ADD_SELECTORS = (
+        (By.CSS_SELECTOR, "[aria-label='Add New']"),
+        (By.XPATH, "//span[text()='Add New']"),
+        # Exact class chain from Facebook for "Add New" (rotates, so not first)
+        (_BY_TEXT, ("span.html-span.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x1hl2dhg.x16tdsg8.x1vvkbs.x1lliihq.x193iq5w.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft", "Add New")),
+        (_BY_TEXT, ("span.x1lliihq.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft", "Add New")),
+        (By.XPATH, "//div[text()='Add New']"),
+        (By.XPATH, "//span[text()='Add']"),
+        (By.XPATH, "//span[contains(text(), 'Add New')]"),
+        (By.XPATH, "//span[contains(text(), 'Give someone Facebook access')]"),
+        (By.XPATH, "//button[contains(text(), 'Add')]"),
+        (By.XPATH, "//div[@role='button']//span[contains(text(), 'Add')]"),
+    )
+    _NEXT_SELECTORS = (
+        (By.CSS_SELECTOR, "[aria-label='Next']"),
+        (By.XPATH, "//span[text()='Next']"),
+        # Updated selector from Facebook
+        (_BY_TEXT, ("span.html-span.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x1hl2dhg.x16tdsg8.x1vvkbs.x1lliihq.x193iq5w.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft", "Next")),
+        (By.XPATH, "//span[contains(text(), 'Next')]"),
+    )
+    _PERSON_INPUT_SELECTORS = (
+        # From screenshot: placeholder/label contains "Who should have Facebook access"
+        (By.CSS_SELECTOR, "input[placeholder*='Who should have']"),
+        (By.CSS_SELECTOR, "input[aria-label*='Who should have']"),
+        # Search input field
+        (By.CSS_SELECTOR, "input[type='search']"),
+        (By.CSS_SELECTOR, "input[role='combobox']"),
+        # Generic search selectors
+        (By.CSS_SELECTOR, "input[aria-label*='Search']"),
+        (By.CSS_SELECTOR, "input[placeholder*='Search']"),
+        (By.CSS_SELECTOR, "input[aria-label*='name']"),
+        (By.CSS_SELECTOR, "input[placeholder*='name']"),
+        # Any visible text input in the dialog
+        (By.CSS_SELECTOR, "div[role='dialog'] input[type='text'], div[role='dialog'] input[type='search']"),
+        (By.CSS_SELECTOR, "input.x1i10hfl"),
+    )
+    _PROFILE_RESULT_SELECTORS = (
+        (By.CSS_SELECTOR, "div[role='option']"),
+        (By.CSS_SELECTOR, "div[role='listitem']"),
+        (By.CSS_SELECTOR, "span[style*='WebkitLineClamp']"),
+    )
+    _GIVE_ACCESS_SELECTORS = (
+        (By.XPATH, "//span[text()='Give Access' or text()='Give access']/ancestor::div[@role='button'][1]"),
+        (By.CSS_SELECTOR, "[aria-label='Give Access'], [aria-label='Give access']"),
+        (By.XPATH, "//span[text()='Give Access']"),
+        (By.XPATH, "//span[text()='Give access']"),
+        # Exact classes from Facebook span: xdj266r x14z9mp xat24cr x1lziwak xexx8yu xyri2b x18d9i69 x1c1uobl x1hl2dhg x16tdsg8 x1vvkbs x1lliihq x193iq5w x6ikm8r x10wlt62 xlyipyv xuxw1ft
+        (_BY_TEXT, ("span.xdj266r.x1lliihq.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft", "Give Access")),
+        (_BY_TEXT, ("span.x1lliihq.x193iq5w.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft", "Give Access")),
+        (By.XPATH, "//div[@role='button' and .//span[text()='Give Access']]"),
+        (By.XPATH, "//span[contains(text(), 'Give Access')]"),
+        (By.XPATH, "//div[@role='button']//span[contains(text(), 'Give')]"),
+    )
+    _CONFIRM_PASSWORD_SELECTORS = (
+        (By.CSS_SELECTOR, "input[type='password']"),
+        (By.CSS_SELECTOR, "input.x1i10hfl[type='password']"),
+    )
+    _CONFIRM_SELECTORS = (
+        (By.XPATH, "//span[text()='Confirm']/ancestor::div[@role='button'][1]"),
+        (By.CSS_SELECTOR, "[aria-label='Confirm']"),
+        (By.XPATH, "//span[text()='Confirm']"),
+        # Exact classes from Facebook Confirm span
+        (_BY_TEXT, ("span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft", "Confirm")),
+        (By.XPATH, "//div[@role='button']//span[text()='Confirm']"),
+        (By.XPATH, "//span[contains(text(), 'Confirm')]"),
+    )
+    # Returns the selectors in arguments[0] ([strategy, selector] pairs) that the
+    # browser cannot parse; XPaths are compiled with createExpression, not run
+    _INVALID_SELECTORS_JS = """
+        const bad = [];
+        for (const [kind, sel] of arguments[0]) {
+            try {
+                if (kind === 'xpath') document.createExpression(sel);
+                else document.querySelector(kind === 'text' ? sel[0] : sel);
+            } catch (err) {
+                bad.push(kind === 'text' ? sel[0] : sel);
+            }
+        }
+        return bad;
+    """
+    # Nearest visible clickable row around the search-result element in arguments[0]
+    # (closest() walks the ancestors natively, visibility checked in the same call)
+    _RESULT_ROW_JS = """
+        const row = arguments[0].closest("div[role='option'], div[role='button'], div[role='listitem']");
+        return row && row.getClientRects().length > 0 ? row : null;
+    """
+    # Any row of the person search results, as one CSS union
+    _PROFILE_RESULTS_CSS = "div[role='option'], div[role='listitem'], span[style*='WebkitLineClamp']"
+    # Static profile-name spans in the person search results; see _name_selectors
+    _PROFILE_NAME_SELECTORS = (
+        # Exact classes from Facebook profile name span: x1yhjpo9 x1ua5tub x104kibb with WebkitLineClamp style
+        (By.CSS_SELECTOR, "span.x1yhjpo9.x1ua5tub.x104kibb"),
+        (By.CSS_SELECTOR, "span[style*='WebkitLineClamp']"),
+    )
+
+    # Guards the Chrome bookkeeping below. Warm sessions are reused through
+    # automation.driver_pool, which keeps started generators between jobs.
+    _drivers_lock = threading.Lock()
+
+    # Chrome sessions started by this process and not yet quit; the orphan
+    # cleanup is skipped while any are live
+    _live_drivers = 0
+
+    # Chrome user-data-dirs held by a live driver (a profile can only be
+    # opened by one Chrome process at a time)
+    _profile_dirs_in_use: set = set()
+
+    # Selector win counts loaded from SELECTOR_STATS_PATH ("field|strategy|value" -> wins)
+    _selector_stats: Optional[dict] = None
+    _selector_stats_dirty = False
+    _selector_stats_lock = threading.Lock()
+    _selector_stats_save_lock = threading.Lock()
+
+    # Set once the class selector constants have been syntax-checked in a browser
+    _selectors_validated = False
+
+    # Resolved chromedriver path, shared by every instance in the process
+    _driver_path: Optional[str] = None
+
     def __init__(self, headless: bool = True, timeout: int = 30, test_mode: bool = True,
                  proxy_url: str = "", cookies_path: str = "",
-                 profiles: list = None, pages_per_profile: int = 3):
+                 profiles: list = None, pages_per_profile: int = 3,
+                 user_data_dir: Optional[str] = None):
         self.headless = headless
         self.timeout = timeout
         self.test_mode = test_mode
         self.proxy_url = proxy_url
         self.cookies_path = cookies_path or DEFAULT_COOKIES_PATH
+        # Persistent Chrome profile (cookies, HTTP cache) reused across runs;
+        # "" disables it. The dir actually in use is _active_profile_dir, which
+        # falls back to "" when another live driver already holds the profile.
+        if user_data_dir is None:
+            user_data_dir = os.environ.get('SELENIUM_USER_DATA_DIR', '')
+        self.user_data_dir = user_data_dir
+        self._active_profile_dir = ""
+
+        # Field name -> (By, value) that last located it (see _find_first)
+        self._selector_cache: dict = {}
+
+        # Shared explicit waits, bound to the driver in start()
+        self._wait: Optional[WebDriverWait] = None
+        self._short_wait: Optional[WebDriverWait] = None
+        # Other timeouts, created on first use by _wait_for
+        self._timed_waits: dict = {}
         self.driver: Optional[webdriver.Chrome] = None
         self.logged_in = False
         self.rate_limited = False
+
+        # Rate-limit backoff: after Facebook throttles us, no page creation is
+        # attempted before _next_allowed_ts; the delay doubles on every hit
+        # (capped) and halves again on clean successes.
+        self._rl_delay: float = self.RATE_LIMIT_BASE_DELAY
+        self._next_allowed_ts: float = 0.0
+
         self.metrics = {
             'pages_created': 0,
             'total_time': 0.0,
@@ -100,7 +551,6 @@ class FacebookPageGenerator:
 
     def _get_chrome_options(self) -> Options:
         """Configure Chrome/Chromium options for Selenium"""
-        import random
         import os
         options = Options()
 
@@ -190,6 +640,12 @@ class FacebookPageGenerator:
             options.add_argument(f"--proxy-server={self.proxy_url}")
             print(f">>> Using proxy: {self.proxy_url}")
 
+        # Persistent profile: the saved session and cache survive restarts
+        if self._active_profile_dir:
+            options.add_argument(f"--user-data-dir={self._active_profile_dir}")
+            options.add_argument("--profile-directory=Default")
+            print(f">>> Using Chrome profile: {self._active_profile_dir}")
+
         # Page load strategy - don't wait for all resources (saves time and memory)
         options.page_load_strategy = 'eager'  # Don't wait for images/stylesheets
 
@@ -199,8 +655,9 @@ class FacebookPageGenerator:
             "credentials_enable_service": False,
             "profile.password_manager_enabled": False,
             "profile.default_content_settings.popups": 0,
-            # Block images to save memory (optional - may affect visual verification)
-            # "profile.managed_default_content_settings.images": 2,
+            # Block images to save memory and page-load time
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.cookies": 1,
         }
         options.add_experimental_option("prefs", prefs)
         return options
@@ -211,8 +668,7 @@ class FacebookPageGenerator:
             return False
         try:
             cookies = self.driver.get_cookies()
-            with open(self.cookies_path, 'w') as f:
-                json.dump(cookies, f)
+            _dump_json_file(self.cookies_path, cookies)
             print(f">>> Saved {len(cookies)} cookies to {self.cookies_path}")
             logger.info(f"Saved {len(cookies)} cookies")
             return True
@@ -228,19 +684,32 @@ class FacebookPageGenerator:
             print(f">>> No saved cookies found at {self.cookies_path}")
             return False
         try:
-            with open(self.cookies_path, 'r') as f:
-                cookies = json.load(f)
+            cookies = _load_json_file(self.cookies_path)
+
+            # Fast path: inject every cookie in one CDP call (no navigation needed)
+            if self._set_cookies_cdp(cookies):
+                print(f">>> Loaded {len(cookies)} cookies from {self.cookies_path} (CDP)")
+                logger.info(f"Loaded {len(cookies)} cookies via CDP")
+                return True
+
+            # Fallback: per-cookie add_cookie (WebDriver only)
+            # Remove problematic cookie attributes (sameSite) and normalize expiry
+            cookies = [
+                {k: (int(v) if k == 'expiry' else v) for k, v in cookie.items() if k != 'sameSite'}
+                for cookie in cookies
+            ]
 
-            # Navigate to Facebook first before adding cookies
+            # Navigate to Facebook first before adding cookies (the document
+            # only needs to be on the facebook.com domain, not fully loaded)
             self.driver.get("https://www.facebook.com")
-            time.sleep(2)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: d.execute_script("return document.readyState") != "loading"
+                )
+            except TimeoutException:
+                pass
 
             for cookie in cookies:
-                # Remove problematic cookie attributes
-                if 'sameSite' in cookie:
-                    del cookie['sameSite']
-                if 'expiry' in cookie:
-                    cookie['expiry'] = int(cookie['expiry'])
                 try:
                     self.driver.add_cookie(cookie)
                 except Exception:
@@ -253,44 +722,248 @@ class FacebookPageGenerator:
             logger.error(f"Failed to load cookies: {e}")
             return False
 
+    def _set_cookies_cdp(self, cookies: list) -> bool:
+        """Set all cookies with a single CDP Network.setCookies call"""
+        cdp_cookies = []
+        for cookie in cookies:
+            cdp_cookie = {
+                k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')
+                if k in cookie
+            }
+            if 'expiry' in cookie:
+                cdp_cookie['expires'] = int(cookie['expiry'])
+            if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+                cdp_cookie['sameSite'] = cookie['sameSite']
+            cdp_cookies.append(cdp_cookie)
+
+        try:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+            return True
+        except Exception as e:
+            logger.info(f"CDP cookie injection unavailable, falling back to add_cookie: {e}")
+            return False
+
+    def _find_any(self, css_selectors, xpath_selectors=()):
+        """
+        Find the first visible element matching any of the selectors.
+
+        All selectors are evaluated inside the page with a single execute_script
+        call instead of one find_element round-trip (and implicit wait) per miss.
+        CSS selectors are tried before XPath.
+        """
+        return self._find_first(
+            [(By.CSS_SELECTOR, css) for css in css_selectors] +
+            [(By.XPATH, xpath) for xpath in xpath_selectors]
+        )
+
+    def _find_first(self, selectors, key: str = None, text: str = ""):
+        """
+        Find the first visible, enabled element for a list of (By, value) pairs.
+
+        Like _find_any, but keeps the caller's order when CSS and XPath
+        selectors are interleaved. Supports By.CSS_SELECTOR, By.XPATH and
+        _BY_TEXT (see _find_by_exact_text). With text, only elements whose
+        text contains it (case-insensitive) match, checked inside the page.
+
+        With a key, selectors are ordered by their on-disk win counts, and the
+        selector that matched is remembered in _selector_cache and tried first
+        on the next lookup for that field. Selectors are cached, not elements,
+        since elements go stale across navigations.
+        """
+        return self._find_first_each([(key, selectors)], texts=[text])[0]
+
+    @staticmethod
+    def _selector_stat_key(key: str, selector) -> str:
+        kind, value = selector
+        if isinstance(value, (tuple, list)):
+            value = "=".join(value)
+        return f"{key}|{kind}|{value}"
+
+    @classmethod
+    def _get_selector_stats(cls) -> dict:
+        """Selector win counts, read from disk on first use"""
+        with cls._selector_stats_lock:
+            if cls._selector_stats is None:
+                cls._selector_stats = {}
+                if os.path.exists(SELECTOR_STATS_PATH):
+                    try:
+                        cls._selector_stats = _load_json_file(SELECTOR_STATS_PATH)
+                    except Exception as e:
+                        logger.warning(f"Could not read selector stats: {e}")
+            return cls._selector_stats
+
+    @classmethod
+    def _record_selector_win(cls, key: str, selector):
+        """Count a successful lookup in memory (written out by save_selector_stats)"""
+        stats = cls._get_selector_stats()
+        stat_key = cls._selector_stat_key(key, selector)
+        with cls._selector_stats_lock:
+            stats[stat_key] = stats.get(stat_key, 0) + 1
+            cls._selector_stats_dirty = True
+
+    @classmethod
+    def save_selector_stats(cls):
+        """Write the selector win counts to disk if they changed (from stop() and at exit)"""
+        with cls._selector_stats_lock:
+            if not cls._selector_stats_dirty:
+                return
+            snapshot = dict(cls._selector_stats)
+            cls._selector_stats_dirty = False
+        with cls._selector_stats_save_lock:
+            try:
+                os.makedirs(os.path.dirname(SELECTOR_STATS_PATH), exist_ok=True)
+                _dump_json_file(SELECTOR_STATS_PATH, snapshot)
+            except Exception as e:
+                logger.warning(f"Could not save selector stats: {e}")
+                with cls._selector_stats_lock:
+                    cls._selector_stats_dirty = True
+
+    def _find_by_exact_text(self, css: str, text: str):
+        """Find the first visible element matching css whose text is exactly text"""
+        return self._find_first([(self._BY_TEXT, (css, text))])
+
+    def _find_first_each(self, lookups, texts=None) -> list:
+        """
+        Run several independent _find_first lookups in a single round-trip.
+
+        lookups is a list of (key, selectors); returns one element (or None)
+        per lookup, in the same order. texts optionally gives one text filter
+        per lookup (see _find_first).
+        """
+        ordered = []
+        for key, selectors in lookups:
+            selectors = list(selectors)
+            if key:
+                # Historically most successful first (stable, so ties keep the given order)
+                stats = self._get_selector_stats()
+                selectors.sort(key=lambda sel: -stats.get(self._selector_stat_key(key, sel), 0))
+            cached = self._selector_cache.get(key) if key else None
+            if cached in selectors:
+                selectors.remove(cached)
+                selectors.insert(0, cached)
+            ordered.append((key, selectors))
+        try:
+            results = self.driver.execute_script(
+                self._FIND_FIRST_JS,
+                [[[kind, value] for kind, value in selectors] for _, selectors in ordered],
+                [t.lower() if t else None for t in texts] if texts else None
+            )
+        except WebDriverException:
+            return [None] * len(ordered)
+
+        elements = []
+        for (key, selectors), found in zip(ordered, results or []):
+            if not found:
+                elements.append(None)
+                continue
+            element, index = found
+            if key:
+                self._selector_cache[key] = selectors[index]
+                self._record_selector_win(key, selectors[index])
+            elements.append(element)
+        elements.extend([None] * (len(ordered) - len(elements)))
+        return elements
+
+    def _fast_type(self, element, text: str):
+        """
+        Type text into a focused input in one call.
+
+        Uses CDP Input.insertText, which the page sees as real typing, and
+        falls back to _set_value_fast when CDP is unavailable or the value
+        did not take.
+        """
+        try:
+            self.driver.execute_script("arguments[0].focus();", element)
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+            if element.get_attribute('value') == text:
+                return
+        except (AttributeError, WebDriverException):
+            pass
+        self._set_value_fast(element, text)
+
+    def _set_value_fast(self, element, text: str):
+        """
+        Set an input/textarea value in one call and fire the input event.
+
+        Goes through the native value setter so React (Facebook's UI) sees
+        the change as user input rather than ignoring the direct assignment.
+        """
+        self.driver.execute_script(
+            "const el = arguments[0];"
+            "el.focus();"
+            "const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;"
+            "Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);"
+            "el.dispatchEvent(new Event('input', {bubbles: true}));"
+            "el.dispatchEvent(new Event('change', {bubbles: true}));",
+            element, text
+        )
+
+    @classmethod
+    def _name_selectors(cls, name: str) -> tuple:
+        """Profile-name selectors for the person search: the static spans plus exact/contains text matches"""
+        return cls._PROFILE_NAME_SELECTORS + (
+            (By.XPATH, f"//span[text()='{name}']"),
+            (By.XPATH, f"//span[contains(text(), '{name}')]"),
+        )
+
+    def _js_click(self, element) -> bool:
+        """
+        Click via element.click() in the page, in one round-trip.
+
+        Skips the scroll-into-view and hit-test checks of a native click, so
+        only use it for plain navigation buttons, not form submits.
+        """
+        try:
+            self.driver.execute_script("arguments[0].click();", element)
+            return True
+        except WebDriverException:
+            return False
+
+    def _wait_click(self, selectors, timeout: float = 8, text: str = "", js: bool = False):
+        """
+        Wait until any of the (By, value) selectors is clickable, then click it.
+
+        With text, only matches whose text contains it (case-insensitive)
+        count. Each poll checks every selector in one _find_first script.
+        js=True clicks with _js_click; otherwise a native click is used,
+        falling back to a JS click if it is intercepted.
+        Returns the clicked element, or None if nothing showed up in time.
+        """
+        try:
+            elem = self._wait_for(timeout).until(
+                lambda d: self._find_first(selectors, text=text)
+            )
+        except TimeoutException:
+            return None
+        if not js:
+            try:
+                elem.click()
+                return elem
+            except WebDriverException:
+                pass
+        return elem if self._js_click(elem) else None
+
     def check_if_logged_in(self) -> bool:
         """Check if we're still logged in to Facebook"""
         if not self.driver:
             return False
         try:
             self.driver.get("https://www.facebook.com")
-            time.sleep(3)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+            except TimeoutException:
+                pass
 
-            # Check if login form is present (means NOT logged in)
-            login_indicators = [
-                "//input[@id='email']",
-                "//input[@name='email']",
-                "//button[@name='login']",
-            ]
-            for selector in login_indicators:
-                try:
-                    elem = self.driver.find_element(By.XPATH, selector)
-                    if elem.is_displayed():
-                        print(">>> Not logged in (login form visible)")
-                        return False
-                except NoSuchElementException:
-                    continue
-
-            # Check if logged-in indicators are present
-            logged_in_indicators = [
-                "//div[@aria-label='Your profile']",
-                "//div[@aria-label='Account']",
-                "//a[contains(@href, '/me/')]",
-            ]
-            for selector in logged_in_indicators:
-                try:
-                    elem = self.driver.find_element(By.XPATH, selector)
-                    if elem.is_displayed():
-                        print(">>> Already logged in (profile icon visible)")
-                        self.logged_in = True
-                        return True
-                except NoSuchElementException:
-                    continue
+            if self._find_any(self._LOGIN_FORM_INDICATORS):
+                print(">>> Not logged in (login form visible)")
+                return False
+
+            if self._find_any(self._LOGGED_IN_INDICATORS):
+                print(">>> Already logged in (profile icon visible)")
+                self.logged_in = True
+                return True
 
             return False
         except Exception as e:
@@ -302,27 +975,17 @@ class FacebookPageGenerator:
         if not self.driver:
             return False
         try:
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-            rate_limit_phrases = [
-                "try again later",
-                "you're temporarily blocked",
-                "temporarily blocked",
-                "rate limit",
-                "too many",
-                "slow down",
-                "something went wrong",
-                "couldn't create",
-                "can't create",
-                "please try again",
-                "action blocked",
-                "we limit how often",
-            ]
-            for phrase in rate_limit_phrases:
-                if phrase in page_text:
-                    print(f">>> RATE LIMIT DETECTED: '{phrase}'")
-                    self.rate_limited = True
-                    self.metrics['rate_limit_hits'] += 1
-                    return True
+            # Read the rendered text in-page rather than through a WebElement lookup
+            page_text = self.driver.execute_script(
+                "return document.body ? document.body.innerText : '';"
+            ) or ""
+            match = _RATE_LIMIT_RE.search(page_text)
+            if match:
+                phrase = match.group(0).lower()
+                print(f">>> RATE LIMIT DETECTED: '{phrase}'")
+                self.rate_limited = True
+                self.metrics['rate_limit_hits'] += 1
+                return True
             return False
         except Exception:
             return False
@@ -348,46 +1011,116 @@ class FacebookPageGenerator:
             print(f">>> Warning: Could not cleanup Chrome processes: {e}")
             logger.warning(f"Could not cleanup Chrome processes: {e}")
 
-    def start(self, max_retries: int = 3):
-        """Initialize the WebDriver with retry logic"""
+    def _claim_profile_dir(self) -> str:
+        """Reserve user_data_dir for a new Chrome process, or "" if it is taken"""
+        if not self.user_data_dir:
+            return ""
+        with FacebookPageGenerator._drivers_lock:
+            if self.user_data_dir in FacebookPageGenerator._profile_dirs_in_use:
+                print(f">>> Chrome profile {self.user_data_dir} is in use, starting with a temporary profile")
+                return ""
+            FacebookPageGenerator._profile_dirs_in_use.add(self.user_data_dir)
+        os.makedirs(self.user_data_dir, exist_ok=True)
+        return self.user_data_dir
+
+    @classmethod
+    def _release_profile_dir(cls, profile_dir: str):
+        if profile_dir:
+            with cls._drivers_lock:
+                cls._profile_dirs_in_use.discard(profile_dir)
+
+    @classmethod
+    def _quit_driver(cls, driver: webdriver.Chrome, profile_dir: str):
+        """Quit a live driver for good and release its profile dir"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        cls._release_profile_dir(profile_dir)
+        with cls._drivers_lock:
+            cls._live_drivers = max(0, cls._live_drivers - 1)
+
+    def _cleanup_orphans(self):
+        """cleanup_chrome_processes, unless it would kill live sessions of this process"""
+        with FacebookPageGenerator._drivers_lock:
+            live = FacebookPageGenerator._live_drivers
+        if live:
+            logger.info(f"Skipping orphan cleanup, {live} Chrome sessions are live")
+            return
+        self.cleanup_chrome_processes()
+
+    @classmethod
+    def _get_driver_path(cls) -> str:
+        """Resolve the chromedriver binary once per process"""
+        if cls._driver_path is None:
+            # Use system chromedriver if available (Docker/Render), otherwise use webdriver-manager
+            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
+            if chromedriver_path and os.path.exists(chromedriver_path):
+                print(f">>> Using system chromedriver: {chromedriver_path}")
+                cls._driver_path = chromedriver_path
+            elif os.path.exists('/usr/bin/chromedriver'):
+                print(">>> Using system chromedriver: /usr/bin/chromedriver")
+                cls._driver_path = '/usr/bin/chromedriver'
+            elif shutil.which('chromedriver'):
+                cls._driver_path = shutil.which('chromedriver')
+                print(f">>> Using chromedriver on PATH: {cls._driver_path}")
+            else:
+                print(">>> Using webdriver-manager to get chromedriver")
+                cls._driver_path = ChromeDriverManager().install()
+        return cls._driver_path
+
+    def start(self, max_retries: int = 3, kill_orphans: bool = True):
+        """
+        Initialize the WebDriver with retry logic.
+
+        Pass kill_orphans=False when other processes on the host may run
+        Chrome (Celery shards), since the orphan cleanup kills every Chrome
+        process.
+        """
         import os
 
-        # Clean up any orphaned Chrome processes first
-        self.cleanup_chrome_processes()
+        # Clean up any orphaned Chrome processes first (only when no session
+        # of this process is live, since pkill hits them all)
+        if kill_orphans:
+            self._cleanup_orphans()
+
+        self._active_profile_dir = self._claim_profile_dir()
 
         last_error = None
         for attempt in range(max_retries):
             try:
                 print(f">>> Starting Chromium/Chrome (attempt {attempt + 1}/{max_retries})...")
 
-                # Use system chromedriver if available (Docker/Render), otherwise use webdriver-manager
-                chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
-                if chromedriver_path and os.path.exists(chromedriver_path):
-                    print(f">>> Using system chromedriver: {chromedriver_path}")
-                    service = Service(chromedriver_path)
-                elif os.path.exists('/usr/bin/chromedriver'):
-                    print(">>> Using system chromedriver: /usr/bin/chromedriver")
-                    service = Service('/usr/bin/chromedriver')
-                else:
-                    print(">>> Using webdriver-manager to get chromedriver")
-                    service = Service(ChromeDriverManager().install())
+                service = Service(self._get_driver_path())
 
                 # Wait a bit between retries
                 if attempt > 0:
                     time.sleep(2)
-                    self.cleanup_chrome_processes()
+                    if kill_orphans:
+                        self._cleanup_orphans()
 
                 self.driver = webdriver.Chrome(
                     service=service,
                     options=self._get_chrome_options()
                 )
-                self.driver.implicitly_wait(10)
+                # No implicit wait: selector fallback loops should miss instantly,
+                # explicit WebDriverWaits handle the places that need to wait
+                self.driver.implicitly_wait(0)
+                # With the eager load strategy driver.get returns at DOMContentLoaded;
+                # cap it so a stalled navigation fails fast instead of the 300s default
+                self.driver.set_page_load_timeout(self.timeout)
 
                 # Remove webdriver flag
                 self.driver.execute_script(
                     "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
                 )
 
+                self._block_subresources()
+                self._bind_waits()
+                self._validate_selectors()
+                with FacebookPageGenerator._drivers_lock:
+                    FacebookPageGenerator._live_drivers += 1
+
                 print(">>> Chromium/Chrome WebDriver started successfully")
                 logger.info("Chromium/Chrome WebDriver started successfully")
                 return  # Success!
@@ -405,50 +1138,117 @@ class FacebookPageGenerator:
                         pass
                     self.driver = None
 
-                self.cleanup_chrome_processes()
+                if kill_orphans:
+                    self._cleanup_orphans()
 
         # All retries failed
+        self._release_profile_dir(self._active_profile_dir)
+        self._active_profile_dir = ""
         logger.error(f"Failed to start Chrome driver after {max_retries} attempts: {last_error}")
         raise RuntimeError(f"Failed to start Chrome driver after {max_retries} attempts: {last_error}")
 
+    def _bind_waits(self):
+        """Create the shared WebDriverWaits for the current driver"""
+        self._wait = WebDriverWait(self.driver, self.timeout, poll_frequency=0.2)
+        self._short_wait = WebDriverWait(self.driver, 3, poll_frequency=0.1)
+        self._timed_waits = {}
+
+    def _wait_for(self, timeout: float) -> WebDriverWait:
+        """
+        Shared WebDriverWait for a given timeout, reused across calls.
+
+        The implicit wait is 0 (see start), so lookups inside the wait's
+        condition never block on their own; stale elements just re-poll.
+        """
+        wait = self._timed_waits.get(timeout)
+        if wait is None:
+            wait = self._timed_waits[timeout] = WebDriverWait(
+                self.driver, timeout, poll_frequency=0.2,
+                ignored_exceptions=(StaleElementReferenceException,)
+            )
+        return wait
+
+    def wait_for_page_load(self, css: str = 'div[role="main"]', timeout: float = 10) -> bool:
+        """
+        Wait for the element marking a loaded page instead of sleeping after driver.get.
+
+        Returns False (after logging) if it doesn't show up within timeout.
+        """
+        try:
+            self._wait_for(timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css)))
+            return True
+        except TimeoutException:
+            logger.warning(f"Page did not show {css} within {timeout}s: {self.driver.current_url}")
+            return False
+
+    def _validate_selectors(self):
+        """
+        Syntax-check every class selector constant once per process.
+
+        A malformed selector never matches (the in-page lookups swallow the
+        error), so report it at startup instead of as a silent miss per call.
+        """
+        cls = FacebookPageGenerator
+        if cls._selectors_validated:
+            return
+        cls._selectors_validated = True
+        pairs = []
+        for name, value in vars(cls).items():
+            if not name.endswith('_SELECTORS') or not isinstance(value, tuple):
+                continue
+            for sel in value:
+                if isinstance(sel, tuple):
+                    pairs.append(list(sel))
+                else:
+                    pairs.append([By.XPATH if sel.startswith(('/', '(')) else By.CSS_SELECTOR, sel])
+        try:
+            bad = self.driver.execute_script(self._INVALID_SELECTORS_JS, pairs)
+        except WebDriverException as e:
+            logger.warning(f"Could not validate selectors: {e}")
+            return
+        for sel in bad or []:
+            print(f">>> ERROR: Invalid selector: {sel}")
+            logger.error(f"Invalid selector: {sel}")
+
+    def _block_subresources(self):
+        """Block images, fonts, media and trackers at the network layer (Chromium only)"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": self.BLOCKED_URL_PATTERNS + self.TRACKER_URL_PATTERNS}
+            )
+        except Exception as e:
+            logger.warning(f"Could not block subresources via CDP: {e}")
+
     def stop(self):
-        """Close the WebDriver"""
+        """Quit the WebDriver and release its profile dir"""
+        self.save_selector_stats()
         if self.driver:
-            self.driver.quit()
+            driver = self.driver
+            profile_dir = self._active_profile_dir
             self.driver = None
             self.logged_in = False
+            self._active_profile_dir = ""
+            self._quit_driver(driver, profile_dir)
             logger.info("Chrome WebDriver stopped")
 
     def _handle_cookie_consent(self):
         """Handle Facebook's cookie consent popup if present"""
         try:
-            # Try multiple selectors for cookie consent button
-            cookie_selectors = [
-                "//button[@data-cookiebanner='accept_button']",
-                "//button[contains(text(), 'Accept All')]",
-                "//button[contains(text(), 'Allow all cookies')]",
-                "//button[contains(text(), 'Accept all')]",
-                "//button[contains(text(), 'Allow All')]",
-                "//button[@title='Allow all cookies']",
-                "//div[@aria-label='Allow all cookies']",
-                "//span[text()='Allow all cookies']/parent::button",
-                "//span[text()='Accept All']/parent::button",
-                # Additional selectors for different Facebook regions
-                "//button[contains(text(), 'Allow essential and optional cookies')]",
-                "//button[contains(text(), 'Only allow essential cookies')]",
-            ]
+            # Browsers that already went through consent carry the datr cookie;
+            # skip the selector sweep for them
+            if self.driver.get_cookie("datr"):
+                print(">>> Cookie consent already given, skipping popup check")
+                return False
 
-            for selector in cookie_selectors:
-                try:
-                    cookie_btn = self.driver.find_element(By.XPATH, selector)
-                    if cookie_btn.is_displayed():
-                        cookie_btn.click()
-                        print(f">>> Clicked cookie consent button: {selector}")
-                        logger.info(f"Clicked cookie consent button: {selector}")
-                        time.sleep(2)
-                        return True
-                except NoSuchElementException:
-                    continue
+            cookie_btn = self._find_any(self._COOKIE_SELECTORS, self._COOKIE_TEXT_SELECTORS)
+            if cookie_btn:
+                cookie_btn.click()
+                print(">>> Clicked cookie consent button")
+                logger.info("Clicked cookie consent button")
+                time.sleep(2)
+                return True
 
             print(">>> No cookie consent popup found, continuing...")
             logger.info("No cookie consent popup found, continuing...")
@@ -483,11 +1283,7 @@ class FacebookPageGenerator:
             if use_saved_cookies:
                 print(">>> STEP 0: Trying to use saved cookies...")
                 if self.load_cookies():
-                    # Refresh page to apply cookies
-                    self.driver.refresh()
-                    time.sleep(3)
-
-                    # Check if we're logged in
+                    # check_if_logged_in loads facebook.com itself, which applies the cookies
                     if self.check_if_logged_in():
                         print(">>> SUCCESS: Logged in using saved cookies!")
                         self.logged_in = True
@@ -505,9 +1301,7 @@ class FacebookPageGenerator:
             logger.info(f"Attempting Facebook login for: {email}")
             self.driver.get(self.FACEBOOK_LOGIN_URL)
 
-            wait = WebDriverWait(self.driver, self.timeout)
-            print(">>> STEP 2: Waiting 3 seconds for page to load...")
-            time.sleep(3)  # Wait for page to fully load
+            wait = self._wait
 
             # ========================================
             # STEP 3: Find and fill EMAIL field
@@ -520,23 +1314,11 @@ class FacebookPageGenerator:
             print(">>> STEP 3: Looking for email input field...")
             email_field = None
 
-            # Try multiple selectors for email field
-            email_selectors = [
-                (By.ID, "email"),
-                (By.NAME, "email"),
-                (By.CSS_SELECTOR, "input[data-testid='royal_email']"),
-                (By.CSS_SELECTOR, "input[data-testid='royal-email']"),
-                (By.CSS_SELECTOR, "input[aria-label='Email address or phone number']"),
-                (By.CSS_SELECTOR, "input.inputtext[name='email']"),
-            ]
-
-            for selector_type, selector_value in email_selectors:
-                try:
-                    email_field = wait.until(EC.presence_of_element_located((selector_type, selector_value)))
-                    print(f">>> Found email field with selector: {selector_value}")
-                    break
-                except TimeoutException:
-                    continue
+            try:
+                email_field = wait.until(lambda d: self._find_any(self._EMAIL_SELECTORS))
+                print(">>> Found email field")
+            except TimeoutException:
+                email_field = None
 
             if not email_field:
                 print(">>> ERROR: Could not find email field!")
@@ -546,17 +1328,18 @@ class FacebookPageGenerator:
                     print(f">>>   Input {i}: id='{inp.get_attribute('id')}', name='{inp.get_attribute('name')}'")
                 return False
 
-            # Type email character by character to look more human
+            # Send the whole email in one WebDriver call
             email_field.clear()
-            for char in email:
-                email_field.send_keys(char)
-                time.sleep(0.05)  # Small delay between characters
+            email_field.send_keys(email)
             print(f">>> STEP 4: Entered email: {email}")
             logger.info("Entered email")
 
-            # Wait 5 seconds between email and password (looks more genuine)
-            print(">>> Waiting 5 seconds before entering password (to look genuine)...")
-            time.sleep(5)
+            # Wait for the password field to become interactable
+            print(">>> Waiting for password field...")
+            try:
+                WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.ID, "pass")))
+            except TimeoutException:
+                print(">>> Password field not clickable by id, trying fallbacks...")
 
             # ========================================
             # STEP 5: Find and fill PASSWORD field
@@ -568,38 +1351,20 @@ class FacebookPageGenerator:
             print(">>> STEP 5: Looking for password input field...")
             password_field = None
 
-            password_selectors = [
-                (By.ID, "pass"),
-                (By.NAME, "pass"),
-                (By.CSS_SELECTOR, "input[type='password']"),
-                (By.CSS_SELECTOR, "input[aria-label='Password']"),
-                (By.CSS_SELECTOR, "input.inputtext[name='pass']"),
-            ]
-
-            for selector_type, selector_value in password_selectors:
-                try:
-                    password_field = self.driver.find_element(selector_type, selector_value)
-                    print(f">>> Found password field with selector: {selector_value}")
-                    break
-                except NoSuchElementException:
-                    continue
+            password_field = self._find_any(self._PASSWORD_SELECTORS)
+            if password_field:
+                print(">>> Found password field")
 
             if not password_field:
                 print(">>> ERROR: Could not find password field!")
                 return False
 
-            # Type password character by character to look more human
+            # Send the whole password in one WebDriver call
             password_field.clear()
-            for char in password:
-                password_field.send_keys(char)
-                time.sleep(0.05)  # Small delay between characters
+            password_field.send_keys(password)
             print(">>> STEP 6: Entered password")
             logger.info("Entered password")
 
-            # Wait 2 seconds before clicking login button
-            print(">>> Waiting 2 seconds before clicking login button...")
-            time.sleep(2)
-
             # ========================================
             # STEP 7: Click LOGIN button
             # ========================================
@@ -609,28 +1374,12 @@ class FacebookPageGenerator:
             print(">>> STEP 7: Looking for login button...")
             login_clicked = False
 
-            login_selectors = [
-                (By.ID, "loginbutton"),
-                (By.NAME, "login"),
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.CSS_SELECTOR, "button#loginbutton"),
-                (By.CSS_SELECTOR, "button[name='login']"),
-                (By.XPATH, "//button[text()='Log in']"),
-                (By.XPATH, "//button[text()='Log In']"),
-                (By.XPATH, "//button[contains(@class, '_42ft')]"),
-            ]
-
-            for selector_type, selector_value in login_selectors:
-                try:
-                    login_button = self.driver.find_element(selector_type, selector_value)
-                    if login_button.is_displayed() and login_button.is_enabled():
-                        login_button.click()
-                        print(f">>> Clicked login button: {selector_value}")
-                        logger.info(f"Clicked login button: {selector_value}")
-                        login_clicked = True
-                        break
-                except NoSuchElementException:
-                    continue
+            login_button = self._find_any(self._LOGIN_BUTTON_SELECTORS, self._LOGIN_BUTTON_TEXT_SELECTORS)
+            if login_button:
+                login_button.click()
+                print(">>> Clicked login button")
+                logger.info("Clicked login button")
+                login_clicked = True
 
             if not login_clicked:
                 # Try pressing Enter as last resort
@@ -641,29 +1390,24 @@ class FacebookPageGenerator:
             # ========================================
             # STEP 8: Wait for login to complete
             # ========================================
-            print(">>> STEP 8: Waiting 8 seconds for login to complete...")
-            time.sleep(8)
+            print(">>> STEP 8: Waiting for login to complete (max 15 sec)...")
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    lambda d: "login" not in d.current_url.lower()
+                    or EC.presence_of_element_located((By.XPATH, "//div[@aria-label='Your profile']"))(d)
+                )
+            except TimeoutException:
+                print(">>> Login redirect timeout, checking result anyway...")
 
             # Handle any post-login popups (e.g., "Save login info?")
             print(">>> STEP 9: Checking for post-login popups...")
             try:
-                not_now_selectors = [
-                    "//button[contains(text(), 'Not Now')]",
-                    "//a[contains(text(), 'Not Now')]",
-                    "//span[text()='Not Now']",
-                    "//div[@aria-label='Not now']",
-                ]
-                for selector in not_now_selectors:
-                    try:
-                        not_now_btn = self.driver.find_element(By.XPATH, selector)
-                        if not_now_btn.is_displayed():
-                            not_now_btn.click()
-                            print(">>> Clicked 'Not Now' on post-login popup")
-                            logger.info("Clicked 'Not Now' on post-login popup")
-                            time.sleep(2)
-                            break
-                    except NoSuchElementException:
-                        continue
+                not_now_btn = self._find_any(self._NOT_NOW_SELECTORS, self._NOT_NOW_TEXT_SELECTORS)
+                if not_now_btn:
+                    not_now_btn.click()
+                    print(">>> Clicked 'Not Now' on post-login popup")
+                    logger.info("Clicked 'Not Now' on post-login popup")
+                    time.sleep(2)
             except Exception:
                 pass
 
@@ -727,35 +1471,23 @@ class FacebookPageGenerator:
         try:
             print(">>> LOGOUT STEP 1: Navigating to Facebook home...")
             self.driver.get("https://www.facebook.com")
-            time.sleep(3)
+            self.wait_for_page_load()
 
             # ========================================
             # STEP 1: Close any open dialogs/popups first
             # ========================================
             print(">>> LOGOUT STEP 1b: Closing any open dialogs (clicking X button)...")
-            # From screenshot 15: X button is in top-left corner of page creation form
-            close_selectors = [
-                # X button in top-left (like in page creation form)
-                (By.CSS_SELECTOR, "div[aria-label='Close']"),
-                (By.XPATH, "//div[@aria-label='Close']"),
-                (By.XPATH, "//*[@aria-label='Close']"),
-                (By.XPATH, "//i[contains(@class, 'x1b0d499')]"),  # X icon
-                # SVG close icon
-                (By.CSS_SELECTOR, "svg[aria-label='Close']"),
-                (By.XPATH, "//*[local-name()='svg'][@aria-label='Close']"),
-            ]
-
-            for selector_type, selector_value in close_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            elem.click()
-                            print(f">>> Clicked close (X) button")
-                            time.sleep(2)
-                            break
-                except Exception:
-                    continue
+            # From screenshot 15: X button is in top-left corner of page creation form.
+            # All candidates are fetched with one find_elements on a CSS selector union.
+            try:
+                for elem in self.driver.find_elements(By.CSS_SELECTOR, self._CLOSE_DIALOG_CSS):
+                    if elem.is_displayed():
+                        elem.click()
+                        print(f">>> Clicked close (X) button")
+                        time.sleep(2)
+                        break
+            except Exception:
+                pass
 
             # ========================================
             # STEP 2: Handle "Leave Page?" dialog if it appears
@@ -764,30 +1496,26 @@ class FacebookPageGenerator:
             print(">>> LOGOUT STEP 2: Checking for 'Leave Page?' dialog...")
             time.sleep(1)  # Wait for dialog to appear
 
-            leave_page_selectors = [
-                # Blue "Leave Page" button (from screenshot 16)
-                (By.XPATH, "//span[text()='Leave Page']"),
-                (By.XPATH, "//div[@role='button']//span[text()='Leave Page']"),
-                (By.XPATH, "//span[contains(text(), 'Leave Page')]"),
-                # Also try clicking any button with "Leave" text
-                (By.XPATH, "//div[@role='button'][.//span[text()='Leave Page']]"),
-            ]
-
+            # Blue "Leave Page" button (from screenshot 16)
             leave_clicked = False
-            for selector_type, selector_value in leave_page_selectors:
-                if leave_clicked:
-                    break
+            leave_btn = self._find_any(
+                ("div[aria-label='Leave Page']",),
+                (
+                    "//span[text()='Leave Page']",
+                    "//div[@role='button']//span[text()='Leave Page']",
+                    "//span[contains(text(), 'Leave Page')]",
+                    # Also try clicking any button with "Leave" text
+                    "//div[@role='button'][.//span[text()='Leave Page']]",
+                ),
+            )
+            if leave_btn:
                 try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            elem.click()
-                            print(f">>> Clicked 'Leave Page' button")
-                            leave_clicked = True
-                            time.sleep(2)
-                            break
+                    leave_btn.click()
+                    print(f">>> Clicked 'Leave Page' button")
+                    leave_clicked = True
+                    time.sleep(2)
                 except Exception:
-                    continue
+                    pass
 
             if not leave_clicked:
                 print(">>> No 'Leave Page' dialog detected, continuing...")
@@ -804,16 +1532,13 @@ class FacebookPageGenerator:
             profile_selectors = [
                 # Profile image/avatar that triggers dropdown
                 (By.CSS_SELECTOR, "div[aria-label='Your profile']"),
-                (By.XPATH, "//div[@aria-label='Your profile']"),
                 (By.CSS_SELECTOR, "div[aria-label='Account']"),
-                (By.XPATH, "//div[@aria-label='Account']"),
                 # SVG/image in the header area
-                (By.XPATH, "//div[contains(@class, 'x1iyjqo2')]//image"),
+                (By.CSS_SELECTOR, "div.x1iyjqo2 image"),
                 # Profile picture clickable div
                 (By.CSS_SELECTOR, "image[preserveAspectRatio='xMidYMid slice']"),
-                (By.XPATH, "//image[@preserveAspectRatio='xMidYMid slice']"),
                 # Account menu button
-                (By.XPATH, "//div[@aria-label='Account Controls and Settings']"),
+                (By.CSS_SELECTOR, "div[aria-label='Account Controls and Settings']"),
             ]
 
             # Wait up to 10 seconds
@@ -842,7 +1567,7 @@ class FacebookPageGenerator:
                 # Try navigating to account settings directly
                 try:
                     self.driver.get("https://www.facebook.com/")
-                    time.sleep(2)
+                    self.wait_for_page_load()
                     # Try clicking any clickable image in header
                     images = self.driver.find_elements(By.TAG_NAME, "image")
                     for img in images[-5:]:
@@ -881,30 +1606,18 @@ class FacebookPageGenerator:
                 (By.XPATH, "//*[text()='Log out']"),
             ]
 
-            # Wait up to 10 seconds for logout option
-            for attempt in range(10):
-                for selector_type, selector_value in logout_selectors:
-                    if logout_clicked:
-                        break
-                    try:
-                        elements = self.driver.find_elements(selector_type, selector_value)
-                        for elem in elements:
-                            if elem.is_displayed():
-                                elem_text = elem.text.strip().lower()
-                                if 'log out' in elem_text or 'logout' in elem_text:
-                                    # Scroll into view and click
-                                    self.driver.execute_script("arguments[0].scrollIntoView(true);", elem)
-                                    time.sleep(0.3)
-                                    self.driver.execute_script("arguments[0].click();", elem)
-                                    print(f">>> Clicked 'Log out' button")
-                                    logout_clicked = True
-                                    time.sleep(3)
-                                    break
-                    except Exception:
-                        continue
-                if logout_clicked:
-                    break
-                time.sleep(1)
+            # Wait up to 10 seconds for logout option (first visible match across all selectors per poll)
+            try:
+                elem = self._wait_for(10).until(lambda d: self._find_first(logout_selectors, text="log out"))
+                # Scroll into view and click
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", elem)
+                time.sleep(0.3)
+                if self._js_click(elem):
+                    print(f">>> Clicked 'Log out' button")
+                    logout_clicked = True
+                    time.sleep(3)
+            except WebDriverException:
+                pass
 
             if not logout_clicked:
                 print(">>> WARNING: Could not find 'Log out' option, trying JavaScript...")
@@ -939,23 +1652,10 @@ class FacebookPageGenerator:
             current_url = self.driver.current_url.lower()
             print(f">>> Current URL after logout: {self.driver.current_url}")
 
-            # Check for login page indicators
-            login_indicators = [
-                "//input[@id='email']",
-                "//input[@name='email']",
-                "//button[@name='login']",
-            ]
-
             logout_successful = False
-            for selector in login_indicators:
-                try:
-                    elem = self.driver.find_element(By.XPATH, selector)
-                    if elem.is_displayed():
-                        logout_successful = True
-                        print(">>> SUCCESS: Logout verified - login page detected")
-                        break
-                except NoSuchElementException:
-                    continue
+            if self._find_any(self._LOGIN_FORM_INDICATORS):
+                logout_successful = True
+                print(">>> SUCCESS: Logout verified - login page detected")
 
             if logout_successful or "login" in current_url:
                 self.logged_in = False
@@ -1150,19 +1850,38 @@ class FacebookPageGenerator:
                 error="Driver not initialized"
             )
 
-        start_time = time.time()
-
         if self.test_mode:
-            return self._create_test_page(page_name, start_time)
-        else:
-            return self._create_real_facebook_page(page_name, category, description, start_time)
+            return self._create_test_page(page_name, time.time())
+
+        # Respect the backoff window set by a previous rate-limit hit
+        wait = self._next_allowed_ts - time.time()
+        if wait > 0:
+            print(f">>> RATE LIMIT BACKOFF: Waiting {wait:.1f}s before creating '{page_name}'...")
+            logger.info(f"Rate limit backoff: sleeping {wait:.1f}s")
+            time.sleep(wait)
+
+        start_time = time.time()
+        result = self._create_real_facebook_page(page_name, category, description, start_time)
+        self._update_rate_limit_backoff(result)
+        return result
+
+    def _update_rate_limit_backoff(self, result: PageResult):
+        """Grow the backoff window after a rate-limit hit, decay it after a clean success"""
+        if self.detect_rate_limit():
+            delay = self._rl_delay + random.uniform(0, self._rl_delay * 0.3)
+            self._next_allowed_ts = time.time() + delay
+            print(f">>> RATE LIMIT BACKOFF: Next page creation in {delay:.1f}s")
+            logger.warning(f"Rate limited, backing off {delay:.1f}s")
+            self._rl_delay = min(self._rl_delay * 2, self.RATE_LIMIT_MAX_DELAY)
+        elif result.success:
+            self._rl_delay = max(self.RATE_LIMIT_BASE_DELAY, self._rl_delay / 2)
 
     def _create_test_page(self, page_name: str, start_time: float) -> PageResult:
         """Simulate page creation using httpbin.org for testing"""
         try:
             self.driver.get(self.TEST_URL)
 
-            wait = WebDriverWait(self.driver, self.timeout)
+            wait = self._wait
             wait.until(EC.presence_of_element_located((By.TAG_NAME, "form")))
 
             # Fill form fields
@@ -1220,7 +1939,7 @@ class FacebookPageGenerator:
         WARNING: This violates Facebook ToS and may result in account restrictions.
         """
         if not self.logged_in:
-            print(">>> ERROR: Not logged in to Facebook!")
+            logger.error("Not logged in to Facebook")
             return PageResult(
                 success=False,
                 page_name=page_name,
@@ -1228,98 +1947,69 @@ class FacebookPageGenerator:
             )
 
         try:
-            print(f">>> STEP 1: Navigating to page creation URL...")
             logger.info(f"Creating Facebook page: {page_name}")
+            short_wait = self._short_wait
             self.driver.get(self.FACEBOOK_PAGES_URL)
-            time.sleep(0.5)  # Brief wait for page load
 
             # ========================================
             # STEP 3: Handle any navigation buttons if needed
             # ========================================
-            print(">>> PAGE CREATION STEP 3: Looking for navigation buttons (See More, Pages, Create)...")
+            # The creation URL usually lands straight on the form; only look for
+            # navigation buttons when no form input is there yet
+            form_ready = self.driver.execute_script(
+                "return !!document.querySelector(arguments[0]);", self._PAGE_FORM_INPUTS_CSS
+            )
+            if form_ready:
+                logger.debug("PAGE CREATION STEP 3: Creation form already open, skipping navigation buttons")
+            else:
+                logger.debug("PAGE CREATION STEP 3: Looking for navigation buttons (See More, Pages, Create)...")
 
-            # Try to click "See More" button if present
-            try:
-                see_more_selectors = [
-                    "//span[text()='See more']",
-                    "//span[contains(text(), 'See more')]",
-                    "//div[text()='See more']",
-                ]
-                for selector in see_more_selectors:
-                    try:
-                        see_more_button = self.driver.find_element(By.XPATH, selector)
-                        if see_more_button.is_displayed():
-                            see_more_button.click()
-                            print(f">>> Clicked 'See More' button")
-                            time.sleep(0.3)
-                            break
-                    except NoSuchElementException:
-                        continue
-            except Exception:
-                print(">>> 'See More' button not found, continuing...")
+                # Try to click "See More" button if present
+                try:
+                    see_more_button = self._find_any((), self._SEE_MORE_SELECTORS)
+                    if see_more_button:
+                        see_more_button.click()
+                        logger.debug("Clicked 'See More' button")
+                except Exception:
+                    logger.debug("'See More' button not found, continuing...")
 
-            # Try to click "Pages" button if present
-            try:
-                pages_selectors = [
-                    "//span[text()='Pages']",
-                    "//span[contains(text(), 'Pages')]",
-                    "//div[text()='Pages']",
-                ]
-                for selector in pages_selectors:
-                    try:
-                        pages_button = self.driver.find_element(By.XPATH, selector)
-                        if pages_button.is_displayed():
-                            pages_button.click()
-                            print(f">>> Clicked 'Pages' button")
-                            time.sleep(0.5)
-                            break
-                    except NoSuchElementException:
-                        continue
-            except Exception:
-                print(">>> 'Pages' button not found, continuing...")
+                # Try to click "Pages" button if present
+                try:
+                    pages_button = self._find_any((), self._PAGES_SELECTORS)
+                    if pages_button:
+                        pages_button.click()
+                        logger.debug("Clicked 'Pages' button")
+                except Exception:
+                    logger.debug("'Pages' button not found, continuing...")
 
-            # Try to click "Create New Page" button if present
-            try:
-                create_page_selectors = [
-                    "//span[text()='Create new Page']",
-                    "//span[contains(text(), 'Create new Page')]",
-                    "//span[text()='Create New Page']",
-                    "//div[text()='Create new Page']",
-                    "//a[contains(@href, 'pages/creation')]",
-                ]
-                for selector in create_page_selectors:
-                    try:
-                        create_page_button = self.driver.find_element(By.XPATH, selector)
-                        if create_page_button.is_displayed():
-                            create_page_button.click()
-                            print(f">>> Clicked 'Create New Page' button")
-                            time.sleep(0.5)
-                            break
-                    except NoSuchElementException:
-                        continue
-            except Exception:
-                print(">>> 'Create New Page' button not found, may already be on creation form...")
+                # Try to click "Create New Page" button if present
+                try:
+                    create_page_button = self._find_any((), self._CREATE_PAGE_SELECTORS)
+                    if create_page_button:
+                        create_page_button.click()
+                        logger.debug("Clicked 'Create New Page' button")
+                except Exception:
+                    logger.debug("'Create New Page' button not found, may already be on creation form...")
 
-            print(f">>> Current URL: {self.driver.current_url}")
+                logger.debug(f"Current URL: {self.driver.current_url}")
 
             # ========================================
             # STEP 3.5: Wait for page creation form to load (max 5 sec)
             # ========================================
-            print(">>> STEP 3.5: Waiting for form (max 5 sec)...")
+            logger.debug("STEP 3.5: Waiting for form (max 5 sec)...")
             try:
                 WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text'], input[type='search'], input[type='radio']"))
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self._PAGE_FORM_INPUTS_CSS))
                 )
-                print(">>> Form loaded")
+                logger.debug("Form loaded")
             except TimeoutException:
-                print(">>> Form load timeout, continuing...")
-            time.sleep(0.3)
+                logger.debug("Form load timeout, continuing...")
 
             # ========================================
             # STEP 3.6: Check for radio button selection screen (if present, click radio + Next)
             # Some page creation flows show a radio selection before the name/category form
             # ========================================
-            print(">>> STEP 3.6: Checking for radio button selection screen...")
+            logger.debug("STEP 3.6: Checking for radio button selection screen...")
             radio_clicked = False
 
             # Try to find and click radio button (if it exists)
@@ -1330,52 +2020,36 @@ class FacebookPageGenerator:
                 (By.CSS_SELECTOR, "input[type='radio']"),
             ]
 
-            for selector_type, selector_value in radio_selectors:
-                if radio_clicked:
-                    break
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            # Click the radio button
-                            self.driver.execute_script("arguments[0].click();", elem)
-                            print(f">>> Found and clicked radio button")
-                            radio_clicked = True
-                            time.sleep(0.5)
-                            break
-                except Exception:
-                    continue
+            elem = self._find_first(radio_selectors)
+            if elem and self._js_click(elem):
+                logger.debug("Found and clicked radio button")
+                radio_clicked = True
+                time.sleep(0.5)
 
             # If radio was clicked, now click "Next" button to proceed to page form
             if radio_clicked:
-                print(">>> Looking for 'Next' button after radio selection...")
+                logger.debug("Looking for 'Next' button after radio selection...")
                 next_clicked = False
                 next_button_css = "span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft"
 
-                for _ in range(5):  # Try 5 times
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, next_button_css)
-                        for elem in elements:
-                            if elem.is_displayed() and elem.text == "Next":
-                                self.driver.execute_script("arguments[0].click();", elem)
-                                print(f">>> Clicked 'Next' after radio selection")
-                                next_clicked = True
-                                time.sleep(1)  # Wait for page form to load
-                                break
-                        if next_clicked:
-                            break
-                    except Exception:
-                        time.sleep(0.1)
+                try:
+                    elem = self._short_wait.until(lambda d: self._find_by_exact_text(next_button_css, "Next"))
+                    self.driver.execute_script("arguments[0].click();", elem)
+                    logger.debug("Clicked 'Next' after radio selection")
+                    next_clicked = True
+                    time.sleep(1)  # Wait for page form to load
+                except WebDriverException:
+                    pass
 
                 if not next_clicked:
-                    print(">>> 'Next' button not found after radio, continuing...")
+                    logger.warning("'Next' button not found after radio, continuing...")
             else:
-                print(">>> No radio button screen detected, proceeding to page form...")
+                logger.debug("No radio button screen detected, proceeding to page form...")
 
             # ========================================
             # STEP 4: Find and fill PAGE NAME field
             # ========================================
-            print(">>> PAGE CREATION STEP 4: Looking for Page Name input field...")
+            logger.debug("PAGE CREATION STEP 4: Looking for Page Name input field...")
             page_name_input = None
 
             # Facebook's page name input has NO aria-label, placeholder, or name
@@ -1401,33 +2075,37 @@ class FacebookPageGenerator:
                 (By.XPATH, "//div[contains(text(), 'Page name')]/following::input[1]"),
                 # Dynamic ID pattern (Facebook uses _r_ prefix)
                 (By.CSS_SELECTOR, "input[id^='_r_']"),
-                # Generic text inputs (last resort)
-                (By.CSS_SELECTOR, "input[type='text']"),
             ]
 
-            for selector_type, selector_value in page_name_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            page_name_input = elem
-                            print(f">>> Found page name field with selector: {selector_value}")
-                            break
-                    if page_name_input:
-                        break
-                except Exception:
-                    continue
+            # Category sits on the same form; look both fields up in one call
+            category_selectors = [
+                (By.CSS_SELECTOR, "input[aria-label='Category (required)']"),
+                (By.CSS_SELECTOR, "input[type='search'][role='combobox']"),
+                (By.CSS_SELECTOR, "input[aria-label*='Category']"),
+                (By.CSS_SELECTOR, "input[role='combobox']"),
+            ]
 
+            page_name_input, category_input = self._find_first_each([
+                ("page_name", page_name_selectors),
+                ("category", category_selectors),
+            ])
             if not page_name_input:
-                print(">>> ERROR: Could not find page name input!")
-                # Debug: List all input fields on the page
-                inputs = self.driver.find_elements(By.TAG_NAME, "input")
-                print(f">>> DEBUG: Found {len(inputs)} input fields on page:")
-                for i, inp in enumerate(inputs[:10]):
-                    print(f">>>   Input {i}: type='{inp.get_attribute('type')}', "
-                          f"aria-label='{inp.get_attribute('aria-label')}', "
-                          f"placeholder='{inp.get_attribute('placeholder')}', "
-                          f"name='{inp.get_attribute('name')}'")
+                # Generic text inputs (last resort, only when nothing specific matched)
+                page_name_input = self._find_first([(By.CSS_SELECTOR, "input[type='text']")])
+            if page_name_input:
+                logger.debug("Found page name field")
+
+            if not page_name_input:
+                logger.error("Could not find page name input")
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Debug: List the input fields on the page (one JS call)
+                    inputs = self.driver.execute_script(
+                        "return Array.from(document.querySelectorAll('input')).slice(0, 10).map("
+                        "e => [e.type, e.getAttribute('aria-label'), e.placeholder, e.name]);"
+                    )
+                    for i, (inp_type, aria_label, placeholder, name) in enumerate(inputs):
+                        logger.debug(f"Input {i}: type='{inp_type}', aria-label='{aria_label}', "
+                                     f"placeholder='{placeholder}', name='{name}'")
                 return PageResult(
                     success=False,
                     page_name=page_name,
@@ -1437,63 +2115,51 @@ class FacebookPageGenerator:
 
             # Type page name all at once (fast mode - 1 second total)
             page_name_input.clear()
-            print(f">>> Typing page name: {page_name}")
             page_name_input.send_keys(page_name)  # Type all at once - instant
-            print(f">>> PAGE CREATION STEP 5: Entered page name: {page_name}")
             logger.info(f"Entered page name: {page_name}")
 
-            # Brief wait before category (max 1 sec)
-            time.sleep(1)
-
             # ========================================
             # STEP 6: Find and fill CATEGORY field (FAST - max 3 sec total)
             # ========================================
-            print(">>> PAGE CREATION STEP 6: Looking for Category input field...")
-            category_input = None
+            logger.debug("PAGE CREATION STEP 6: Looking for Category input field...")
 
-            # Simple category selectors - try once
-            category_selectors = [
-                (By.CSS_SELECTOR, "input[aria-label='Category (required)']"),
-                (By.CSS_SELECTOR, "input[type='search'][role='combobox']"),
-                (By.CSS_SELECTOR, "input[aria-label*='Category']"),
-                (By.CSS_SELECTOR, "input[role='combobox']"),
-            ]
-
-            for selector_type, selector_value in category_selectors:
+            # Found together with the page name field in step 4; look again if it
+            # was missing then or got re-rendered while the name was typed
+            if category_input:
                 try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            category_input = elem
-                            print(f">>> Found category field")
-                            break
-                    if category_input:
-                        break
-                except Exception:
-                    continue
+                    category_input.click()
+                except StaleElementReferenceException:
+                    category_input = None
+            if not category_input:
+                category_input = self._find_first(category_selectors, key="category")
+                if category_input:
+                    category_input.click()
+            if category_input:
+                logger.debug("Found category field")
 
             if category_input:
                 # Type category all at once (FAST)
-                category_input.click()
-                time.sleep(0.3)
                 category_input.send_keys(category)  # Type all at once
-                print(f">>> Typed category: {category}")
+                logger.debug(f"Typed category: {category}")
 
-                # Wait 1 sec for dropdown, then Arrow Down + Enter
-                time.sleep(1)
+                # Wait for the suggestion dropdown, then Arrow Down + Enter
+                try:
+                    short_wait.until(EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "[role='listbox'] [role='option']")
+                    ))
+                except TimeoutException:
+                    logger.debug("Category suggestions did not show up, selecting anyway...")
                 category_input.send_keys(Keys.ARROW_DOWN)
-                time.sleep(0.2)
                 category_input.send_keys(Keys.ENTER)
-                print(">>> Selected category with Arrow Down + Enter")
-                time.sleep(0.5)
+                logger.debug("Selected category with Arrow Down + Enter")
             else:
-                print(">>> WARNING: Category input not found, continuing...")
+                logger.warning("Category input not found, continuing...")
 
             # ========================================
             # STEP 7: Fill description if field exists
             # ========================================
             if description:
-                print(">>> PAGE CREATION STEP 7: Looking for Description field...")
+                logger.debug("PAGE CREATION STEP 7: Looking for Description field...")
                 try:
                     desc_selectors = [
                         (By.CSS_SELECTOR, "textarea[aria-label*='Description']"),
@@ -1502,40 +2168,27 @@ class FacebookPageGenerator:
                         (By.CSS_SELECTOR, "textarea[placeholder*='Description']"),
                         (By.XPATH, "//label[contains(text(), 'Description')]/following::textarea[1]"),
                     ]
-                    desc_input = None
-                    for selector_type, selector_value in desc_selectors:
-                        try:
-                            desc_input = self.driver.find_element(selector_type, selector_value)
-                            if desc_input.is_displayed():
-                                print(f">>> Found description field with selector: {selector_value}")
-                                break
-                        except NoSuchElementException:
-                            continue
+                    desc_input = self._find_first(desc_selectors, key="description")
+                    if desc_input:
+                        logger.debug("Found description field")
 
                     if desc_input:
-                        desc_input.clear()
-                        for char in description:
-                            desc_input.send_keys(char)
-                            time.sleep(0.03)
-                        print(f">>> Entered description")
+                        self._set_value_fast(desc_input, description)
                         logger.info("Entered description")
-                        time.sleep(0.5)  # Reduced from 2s
                 except Exception as e:
-                    print(f">>> Description field not found: {e}")
-                    logger.warning("Description field not found, continuing...")
+                    logger.warning(f"Description field not found, continuing... ({e})")
 
             # ========================================
             # STEP 8: Click Create Page button
             # ========================================
-            print(">>> PAGE CREATION STEP 8: Looking for Create Page button...")
-            time.sleep(0.5)  # Reduced from 2s
+            logger.debug("PAGE CREATION STEP 8: Looking for Create Page button...")
             create_clicked = False
 
             create_button_selectors = [
                 # By text content
-                (By.XPATH, "//span[text()='Create Page']"),
+                (self._BY_TEXT, ("span", "Create Page")),
                 (By.XPATH, "//span[contains(text(), 'Create Page')]"),
-                (By.XPATH, "//div[text()='Create Page']"),
+                (self._BY_TEXT, ("div", "Create Page")),
                 (By.XPATH, "//button[contains(text(), 'Create Page')]"),
                 (By.XPATH, "//div[@role='button']//span[text()='Create Page']"),
                 # By aria-label
@@ -1543,75 +2196,65 @@ class FacebookPageGenerator:
                 (By.CSS_SELECTOR, "button[aria-label='Create Page']"),
                 (By.CSS_SELECTOR, "[aria-label*='Create Page']"),
                 # Generic create buttons
-                (By.XPATH, "//span[text()='Create']"),
+                (self._BY_TEXT, ("span", "Create")),
                 (By.XPATH, "//button[contains(text(), 'Create')]"),
                 (By.CSS_SELECTOR, "button[type='submit']"),
             ]
 
-            for selector_type, selector_value in create_button_selectors:
+            create_button = self._find_first(create_button_selectors, key="create_button")
+            if create_button:
                 try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            elem.click()
-                            print(f">>> Clicked Create Page button: {selector_value}")
-                            logger.info("Clicked 'Create Page' button")
-                            create_clicked = True
-                            break
-                    if create_clicked:
-                        break
-                except Exception:
-                    continue
+                    create_button.click()
+                    logger.info("Clicked 'Create Page' button")
+                    create_clicked = True
+                except Exception as e:
+                    logger.warning(f"Create Page button click failed: {e}")
 
             if not create_clicked:
-                print(">>> WARNING: Could not find Create Page button!")
-                # Debug: List all buttons on the page
-                buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                print(f">>> DEBUG: Found {len(buttons)} button elements")
-                divs_with_role = self.driver.find_elements(By.CSS_SELECTOR, "div[role='button']")
-                print(f">>> DEBUG: Found {len(divs_with_role)} div[role='button'] elements")
+                logger.warning("Could not find Create Page button")
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Debug: Count the buttons on the page
+                    counts = self.driver.execute_script(
+                        "return [document.querySelectorAll('button').length,"
+                        " document.querySelectorAll(\"div[role='button']\").length];"
+                    )
+                    logger.debug(f"Found {counts[0]} button elements, {counts[1]} div[role='button'] elements")
 
             # ========================================
             # STEP 9: Click buttons with proper timing
             # Based on manual flow screenshots:
             # Step 1 of 5: Next → Step 2 of 5: Next → Step 3 of 5: Skip → Step 4 of 5: Next → Step 5 of 5: Done
             # ========================================
-            print(">>> PAGE CREATION STEP 9: Clicking buttons (Next → Next → Skip → Next → Done)...")
-            print(">>> Following exact manual flow with human-like timing...")
+            logger.debug("PAGE CREATION STEP 9: Clicking buttons (Next → Next → Skip → Next → Done)...")
 
-            # Wait for page to fully load after Create Page click
-            time.sleep(8)
+            # No fixed wait after Create Page: find_and_click_button polls for
+            # the first wizard button itself
 
             # CORRECT button order based on screenshots:
             # Step 1: Next, Step 2: Next, Step 3: Skip, Step 4: Next, Step 5: Done
             button_order = ["Next", "Next", "Skip", "Next", "Done"]
 
-            # Human-like wait times after each button (seconds)
-            # A human takes 3-5 seconds to look at each page before clicking
+            # Upper bound (seconds) on waiting for a wizard step to be replaced
+            # after its button is clicked
             button_wait_times = {
-                "Next": 5,    # Wait 5 sec after Next (human looks at page)
-                "Skip": 5,    # Wait 5 sec after Skip
-                "Done": 8     # Wait 8 sec after Done for final redirect
+                "Next": 5,
+                "Skip": 5,
+                "Done": 8     # Final redirect takes longer
             }
 
             def wait_for_page_stable(timeout=5):
-                """Wait for page to be stable (no loading indicators)"""
+                """Wait for the document to finish loading"""
                 try:
-                    # Wait for any loading spinners to disappear
-                    time.sleep(2)
-                    # Check if page is still loading
-                    for _ in range(timeout):
-                        ready_state = self.driver.execute_script("return document.readyState")
-                        if ready_state == "complete":
-                            return True
-                        time.sleep(1)
-                except:
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
+                except Exception:
                     pass
                 return True
 
             def find_and_click_button(button_text, step_num):
                 """Find and click button with human-like behavior"""
-                print(f">>>   Step {step_num}: Looking for '{button_text}' button...")
+                logger.debug(f"Step {step_num}: Looking for '{button_text}' button")
 
                 # Wait for page to be stable first
                 wait_for_page_stable()
@@ -1619,54 +2262,38 @@ class FacebookPageGenerator:
                 # Switch to default content
                 self.driver.switch_to.default_content()
 
-                # XPath selectors for the button (blue buttons at bottom of form)
-                xpaths = [
-                    f"//span[text()='{button_text}']",
-                    f"//div[@role='button']//span[text()='{button_text}']",
-                ]
-
-                # Try for up to 20 seconds
-                max_attempts = 20
-                for attempt in range(max_attempts):
-                    for xpath in xpaths:
-                        try:
-                            elements = self.driver.find_elements(By.XPATH, xpath)
-                            for elem in elements:
-                                if elem.is_displayed():
-                                    # Human-like: scroll to button first
-                                    self.driver.execute_script(
-                                        "arguments[0].scrollIntoView({block: 'center'});", elem
-                                    )
-                                    time.sleep(0.5)  # Human pause before clicking
-
-                                    # Click using JavaScript (more reliable)
-                                    self.driver.execute_script("arguments[0].click();", elem)
-                                    print(f">>>   ✓ Clicked '{button_text}' button")
-                                    return True
-                        except Exception as e:
-                            pass
-
-                    # Wait 1 second before trying again
-                    time.sleep(1)
-                    if attempt % 5 == 4:
-                        print(f">>>   Still looking for '{button_text}'... ({attempt + 1}s)")
-
-                print(f">>>   ✗ '{button_text}' not found after {max_attempts} seconds")
-                return False
+                # Try for up to 20 seconds, every 100ms; each poll finds, scrolls to
+                # and clicks the button in a single call (labels are spans on the
+                # blue buttons at the bottom of the form)
+                max_wait = 20
+                try:
+                    elem = WebDriverWait(
+                        self.driver, max_wait, poll_frequency=0.1,
+                        ignored_exceptions=(WebDriverException,)
+                    ).until(lambda d: d.execute_script(self._CLICK_FIRST_TEXT_JS, "span", button_text))
+                    logger.debug(f"Step {step_num} of 5: ✓ Clicked '{button_text}' button")
+                    return elem
+                except TimeoutException:
+                    logger.debug(f"✗ '{button_text}' not found after {max_wait} seconds")
+                    return None
 
             # Click each button in sequence with human-like timing
             step_num = 1
             for button_name in button_order:
-                print(f">>> Step {step_num} of 5:")
-
                 clicked = find_and_click_button(button_name, step_num)
 
                 if clicked:
+                    # The clicked button goes stale once the next step renders
                     wait_time = button_wait_times.get(button_name, 5)
-                    print(f">>>   Waiting {wait_time}s for next page to load...")
-                    time.sleep(wait_time)
+                    logger.debug(f"Waiting up to {wait_time}s for next step to load")
+                    try:
+                        WebDriverWait(self.driver, wait_time, poll_frequency=0.1).until(
+                            EC.staleness_of(clicked)
+                        )
+                    except TimeoutException:
+                        pass
                 else:
-                    print(f">>>   WARNING: Could not click '{button_name}', continuing...")
+                    logger.warning(f"Could not click '{button_name}', continuing...")
 
                 step_num += 1
 
@@ -1675,79 +2302,61 @@ class FacebookPageGenerator:
             # This indicates the page is fully created and URL is correct
             # Capture URL IMMEDIATELY when we see Professional dashboard
             # ========================================
-            print(">>> PAGE CREATION STEP 9.5: Waiting for 'Professional dashboard' to appear...")
-            print(">>> This confirms page is created - will capture URL immediately when seen...")
+            logger.debug("PAGE CREATION STEP 9.5: Waiting for 'Professional dashboard' to appear...")
 
             page_url_found = False
             captured_url = None
             max_wait_time = 60  # 1 minute max (reduced from 2 min)
-            check_interval = 2  # Check every 2 seconds
-
-            # Indicators that page is fully created
-            page_created_indicators = [
-                "Professional dashboard",
-                "Manage Page",
-                "Edit Page",
-                "Page settings",
-            ]
 
-            for elapsed in range(0, max_wait_time, check_interval):
-                try:
-                    # First check if URL already has profile.php?id=
-                    current_url = self.driver.current_url
-                    if "profile.php?id=" in current_url:
-                        # URL is correct, but let's also verify page is loaded
-                        page_source = self.driver.page_source
-                        for indicator in page_created_indicators:
-                            if indicator in page_source:
-                                captured_url = current_url
-                                page_url_found = True
-                                print(f">>> [{elapsed}s] ✓ Found '{indicator}' - Page created!")
-                                print(f">>> ✓ Captured URL: {captured_url}")
-                                break
-                        if page_url_found:
-                            break
-
-                    # Also check page source for indicators even if URL hasn't changed yet
-                    page_source = self.driver.page_source
-                    for indicator in page_created_indicators:
-                        if indicator in page_source:
-                            # Found indicator! Capture URL NOW
-                            captured_url = self.driver.current_url
-                            if "profile.php?id=" in captured_url:
-                                page_url_found = True
-                                print(f">>> [{elapsed}s] ✓ Found '{indicator}' on page!")
-                                print(f">>> ✓ Captured URL immediately: {captured_url}")
-                                break
-                    if page_url_found:
-                        break
+            def page_created(driver):
+                """URL points at the new page and a page-management label is rendered"""
+                match = _FB_PAGE_URL_RE.search(driver.current_url)
+                if match and driver.find_elements(By.XPATH, self._PAGE_CREATED_XPATH):
+                    return match
+                return False
 
-                    print(f">>> [{elapsed}s] Waiting for page to load... URL: {current_url[:60]}...")
-                    time.sleep(check_interval)
+            # Match of _FB_PAGE_URL_RE on the captured URL, reused by step 10
+            page_url_match = None
+            deadline = time.time() + max_wait_time
+            while not page_url_match and time.time() < deadline:
+                # Block in the page on a MutationObserver (woken by the DOM change
+                # itself, no polling); chunks stay under the default script timeout
+                remaining_ms = int(min(deadline - time.time(), 20) * 1000)
+                try:
+                    url = self.driver.execute_async_script(
+                        self._AWAIT_PAGE_CREATED_JS, self._PAGE_CREATED_XPATH,
+                        _FB_PAGE_URL_RE.pattern, remaining_ms
+                    )
+                    if url:
+                        page_url_match = _FB_PAGE_URL_RE.search(url)
+                except WebDriverException:
+                    # A full navigation unloads the waiting script; check once, then re-arm
+                    try:
+                        page_url_match = page_created(self.driver) or None
+                    except WebDriverException:
+                        pass
+                    if not page_url_match:
+                        time.sleep(0.2)
 
-                except Exception as e:
-                    print(f">>> Warning during wait: {e}")
-                    time.sleep(check_interval)
+            if page_url_match:
+                captured_url = page_url_match.string
+                page_url_found = True
+                logger.debug(f"✓ Page created! Captured URL: {captured_url}")
 
             # Final check if not found yet
             if not page_url_found:
-                current_url = self.driver.current_url
-                print(f">>> After {max_wait_time}s wait, URL is: {current_url}")
-                if "profile.php?id=" in current_url:
-                    captured_url = current_url
+                captured_url = self.driver.current_url
+                logger.debug(f"After {max_wait_time}s wait, URL is: {captured_url}")
+                page_url_match = _FB_PAGE_URL_RE.search(captured_url)
+                if page_url_match:
                     page_url_found = True
-                    print(f">>> ✓ URL contains page ID: {current_url}")
-
-            # Use captured URL if we got it
-            if captured_url:
-                current_url = captured_url
+                    logger.debug(f"✓ URL contains page ID: {captured_url}")
 
             # ========================================
-            # STEP 10: Extract page ID from current URL
+            # STEP 10: Extract page ID from the URL captured in step 9.5
             # ========================================
-            print(">>> PAGE CREATION STEP 10: Extracting page ID from URL...")
-            current_url = self.driver.current_url
-            print(f">>> Current URL: {current_url}")
+            logger.debug(f"PAGE CREATION STEP 10: Extracting page ID from URL: {captured_url}")
+            current_url = captured_url
 
             # Extract page ID from URL
             page_id = ""
@@ -1756,27 +2365,14 @@ class FacebookPageGenerator:
             # 1. profile.php?id=61584296746538 -> extract "61584296746538"
             # 2. facebook.com/61584296746538 -> extract "61584296746538"
             # 3. facebook.com/pagename -> extract "pagename"
-            if "profile.php?id=" in current_url:
-                id_match = re.search(r'profile\.php\?id=(\d+)', current_url)
-                if id_match:
-                    page_id = id_match.group(1)
-                    print(f">>> Extracted page ID: {page_id}")
-            elif "id=" in current_url:
-                id_match = re.search(r'id=(\d+)', current_url)
-                if id_match:
-                    page_id = id_match.group(1)
-                    print(f">>> Extracted page ID: {page_id}")
-            elif re.search(r'facebook\.com/(\d+)', current_url):
-                id_match = re.search(r'facebook\.com/(\d+)', current_url)
-                if id_match:
-                    page_id = id_match.group(1)
-                    print(f">>> Extracted page ID: {page_id}")
+            if page_url_match:
+                page_id = page_url_match.group(1) or page_url_match.group(2)
+                logger.debug(f"Extracted page ID: {page_id}")
             else:
-                # Extract from URL path
-                parts = current_url.rstrip('/').split('/')
-                if parts:
-                    page_id = parts[-1].split('?')[0]
-                    print(f">>> Extracted page ID from path: {page_id}")
+                # An id= query parameter, otherwise the last path segment
+                parsed = urlparse(current_url)
+                page_id = parse_qs(parsed.query).get('id', [parsed.path.rstrip('/').rsplit('/', 1)[-1]])[0]
+                logger.debug(f"Extracted page ID from URL: {page_id}")
 
             duration = time.time() - start_time
 
@@ -1787,9 +2383,7 @@ class FacebookPageGenerator:
             if create_clicked and has_page_id:
                 self.metrics['pages_created'] += 1
                 self.metrics['total_time'] += duration
-                print(f">>> SUCCESS: Page created! Name: {page_name}, ID: {page_id}")
-                print(f">>> Page URL: {current_url}")
-                logger.info(f"Page created successfully: {page_name} (ID: {page_id})")
+                logger.info(f"Page created successfully: {page_name} (ID: {page_id}, URL: {current_url})")
                 return PageResult(
                     success=True,
                     page_name=page_name,
@@ -1806,7 +2400,6 @@ class FacebookPageGenerator:
                 elif not has_page_id:
                     error_msg = f"No page ID found in URL: {current_url}"
 
-                print(f">>> FAILED: {error_msg}")
                 logger.error(f"Page creation failed for {page_name}: {error_msg}")
                 return PageResult(
                     success=False,
@@ -1818,8 +2411,7 @@ class FacebookPageGenerator:
         except TimeoutException as e:
             duration = time.time() - start_time
             self.metrics['errors'] += 1
-            print(f">>> ERROR: Timeout creating page: {e}")
-            logger.error(f"Timeout creating page: {page_name}")
+            logger.error(f"Timeout creating page {page_name}: {e}")
             return PageResult(
                 success=False,
                 page_name=page_name,
@@ -1829,7 +2421,6 @@ class FacebookPageGenerator:
         except Exception as e:
             duration = time.time() - start_time
             self.metrics['errors'] += 1
-            print(f">>> ERROR: Exception creating page: {e}")
             logger.error(f"Error creating page {page_name}: {e}")
             import traceback
             traceback.print_exc()
@@ -1909,9 +2500,9 @@ class FacebookPageGenerator:
             # Navigate to page settings
             settings_url = f"https://www.facebook.com/{page_id}/settings/?tab=admin_roles"
             self.driver.get(settings_url)
+            self.wait_for_page_load()
 
-            wait = WebDriverWait(self.driver, self.timeout)
-            time.sleep(3)
+            wait = self._wait
 
             # Click "Add Person" or "Assign a new Page role"
             add_btn = wait.until(EC.element_to_be_clickable(
@@ -1938,25 +2529,25 @@ class FacebookPageGenerator:
             }
             role_text = role_mapping.get(role.lower(), 'Editor')
 
+            # Implicit wait is 0, so the optional dropdown gets a short explicit wait
             try:
-                role_dropdown = self.driver.find_element(
-                    By.CSS_SELECTOR, "select, [role='listbox']"
-                )
+                short_wait = self._short_wait
+                role_dropdown = short_wait.until(EC.element_to_be_clickable(
+                    (By.CSS_SELECTOR, "select, [role='listbox']")
+                ))
                 role_dropdown.click()
-                time.sleep(1)
 
-                role_option = self.driver.find_element(
-                    By.XPATH, f"//option[contains(text(), '{role_text}')] | //div[contains(text(), '{role_text}')]"
-                )
+                role_option = short_wait.until(EC.element_to_be_clickable(
+                    (By.XPATH, f"//option[contains(text(), '{role_text}')] | //div[contains(text(), '{role_text}')]")
+                ))
                 role_option.click()
-            except NoSuchElementException:
+            except (NoSuchElementException, TimeoutException):
                 logger.warning(f"Role dropdown not found, using default role")
 
             # Click Add/Send
-            time.sleep(1)
-            submit_btn = self.driver.find_element(
-                By.XPATH, "//button[contains(text(), 'Add') or contains(text(), 'Send')]"
-            )
+            submit_btn = wait.until(EC.element_to_be_clickable(
+                (By.XPATH, "//button[contains(text(), 'Add') or contains(text(), 'Send')]")
+            ))
             submit_btn.click()
 
             time.sleep(3)
@@ -2077,616 +2668,285 @@ class FacebookPageGenerator:
                 profile_id = profile_url.rstrip("/").split("/")[-1]
                 profile_name_for_search = profile_id
 
-            print(f">>> INVITE: Sharing page {page_id} to profile: {profile_id}")
+            # Use the full profile URL to search when we have one
+            search_term = profile_url if "facebook.com" in profile_url else profile_name_for_search
+            pn_lower = (profile_name or "").lower()
+
             logger.info(f"Sharing page {page_id} to profile: {profile_id}")
 
             # ========================================
             # STEP 1: Click "Switch Now" button to switch to Page
             # ========================================
-            print(">>> INVITE STEP 1: Looking for 'Switch Now' button...")
-            switch_clicked = False
-            switch_selectors = [
-                (By.XPATH, "//span[text()='Switch Now']"),
-                (By.XPATH, "//span[contains(text(), 'Switch Now')]"),
-                (By.XPATH, "//span[text()='Switch']"),
-                (By.CSS_SELECTOR, "span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft"),
-            ]
-
-            for selector_type, selector_value in switch_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed() and ("switch" in elem.text.lower()):
-                            elem.click()
-                            print(f">>> Clicked 'Switch Now' button")
-                            switch_clicked = True
-                            time.sleep(2)
-                            break
-                    if switch_clicked:
-                        break
-                except Exception:
-                    continue
-
-            if not switch_clicked:
-                print(">>> WARNING: Could not find 'Switch Now' button")
+            logger.debug("INVITE STEP 1: Looking for 'Switch Now' button...")
+            if self._wait_click(self._SWITCH_SELECTORS, timeout=5, js=True):
+                logger.debug("Clicked 'Switch Now' button")
+            else:
+                logger.warning("Could not find 'Switch Now' button")
 
             # ========================================
             # STEP 2: Click "Use Page" in popup
             # ========================================
-            print(">>> INVITE STEP 2: Looking for 'Use Page' button...")
-            use_page_clicked = False
-            use_page_selectors = [
-                (By.XPATH, "//span[text()='Use Page']"),
-                (By.XPATH, "//span[contains(text(), 'Use Page')]"),
-                (By.CSS_SELECTOR, "span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft"),
-            ]
-
-            for selector_type, selector_value in use_page_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed() and ("use page" in elem.text.lower()):
-                            elem.click()
-                            print(f">>> Clicked 'Use Page' button")
-                            use_page_clicked = True
-                            time.sleep(3)
-                            break
-                    if use_page_clicked:
-                        break
-                except Exception:
-                    continue
-
-            if not use_page_clicked:
-                print(">>> WARNING: Could not find 'Use Page' button")
+            logger.debug("INVITE STEP 2: Looking for 'Use Page' button...")
+            if self._wait_click(self._USE_PAGE_SELECTORS, js=True):
+                logger.debug("Clicked 'Use Page' button")
+            else:
+                logger.warning("Could not find 'Use Page' button")
 
             # ========================================
             # STEP 3: Click "Professional dashboard" button
             # Now acting as the Page
             # ========================================
-            print(">>> INVITE STEP 3: Looking for 'Professional dashboard' button...")
-            dashboard_clicked = False
-            dashboard_selectors = [
-                (By.XPATH, "//span[text()='Professional dashboard']"),
-                (By.XPATH, "//span[contains(text(), 'Professional dashboard')]"),
-                (By.XPATH, "//div[@role='button']//span[text()='Professional dashboard']"),
-                (By.XPATH, "//a[contains(@href, 'professional_dashboard')]"),
-                (By.XPATH, "//div[contains(@class, 'x1i10hfl')]//span[contains(text(), 'Professional')]"),
-            ]
-
-            for selector_type, selector_value in dashboard_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            elem.click()
-                            print(f">>> Clicked 'Professional dashboard' button")
-                            dashboard_clicked = True
-                            time.sleep(3)  # Wait for dashboard to load
-                            break
-                    if dashboard_clicked:
-                        break
-                except Exception:
-                    continue
-
-            if not dashboard_clicked:
-                print(">>> WARNING: Could not find 'Professional dashboard' button, trying sidebar...")
+            logger.debug("INVITE STEP 3: Looking for 'Professional dashboard' button...")
+            dashboard_clicked = self._wait_click(self._DASHBOARD_SELECTORS, js=True) is not None
+            if dashboard_clicked:
+                logger.debug("Clicked 'Professional dashboard' button")
+            else:
+                logger.warning("Could not find 'Professional dashboard' button, trying sidebar...")
                 # Try clicking from left sidebar if button not found
-                sidebar_selectors = [
-                    (By.XPATH, "//div[contains(@aria-label, 'Professional dashboard')]"),
-                    (By.XPATH, "//a[contains(text(), 'Professional dashboard')]"),
-                ]
-                for selector_type, selector_value in sidebar_selectors:
-                    try:
-                        elem = self.driver.find_element(selector_type, selector_value)
-                        if elem.is_displayed():
-                            elem.click()
-                            print(f">>> Clicked Professional dashboard from sidebar")
-                            dashboard_clicked = True
-                            time.sleep(3)
-                            break
-                    except Exception:
-                        continue
+                if self._wait_click(self._DASHBOARD_SIDEBAR_SELECTORS, timeout=3, js=True):
+                    logger.debug("Clicked Professional dashboard from sidebar")
+                    dashboard_clicked = True
 
             # ========================================
             # STEP 3b: Handle "Start with tour" popup if it appears
             # Sometimes FB shows a tour popup after clicking Professional dashboard
             # ========================================
-            print(">>> INVITE STEP 3b: Checking for 'Start with tour' popup...")
-            time.sleep(2)  # Wait for popup to appear
-
-            tour_handled = False
-            tour_selectors = [
-                (By.XPATH, "//span[text()='Start with tour']"),
-                (By.XPATH, "//span[contains(text(), 'Start with tour')]"),
-                (By.XPATH, "//div[@role='button']//span[text()='Start with tour']"),
-                # Also check for "Skip" or "Not now" buttons to dismiss tour
-                (By.XPATH, "//span[text()='Skip']"),
-                (By.XPATH, "//span[text()='Not now']"),
-                (By.XPATH, "//span[text()='Skip tour']"),
-            ]
-
-            for selector_type, selector_value in tour_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            elem.click()
-                            print(f">>> Clicked tour button: {selector_value}")
-                            tour_handled = True
-                            time.sleep(2)  # Wait for tour to start/close
-                            break
-                    if tour_handled:
-                        break
-                except Exception:
-                    continue
-
-            if not tour_handled:
-                print(">>> No 'Start with tour' popup detected, proceeding directly to Page access...")
+            logger.debug("INVITE STEP 3b: Checking for 'Start with tour' popup...")
+            # The popup is optional, so only give it a short window to appear
+            if not self._wait_click(self._TOUR_SELECTORS, timeout=3, js=True):
+                logger.debug("No 'Start with tour' popup detected, proceeding directly to Page access...")
             else:
                 # If tour started, we may need to skip through it or close it
-                print(">>> Tour started, looking for way to proceed...")
-                time.sleep(2)
+                logger.debug("Tour started, looking for way to proceed...")
                 # Try to find and click any close/skip buttons that might appear
-                skip_selectors = [
-                    (By.XPATH, "//span[text()='Skip']"),
-                    (By.XPATH, "//span[text()='Done']"),
-                    (By.XPATH, "//span[text()='Got it']"),
-                    (By.XPATH, "//div[@aria-label='Close']"),
-                    (By.XPATH, "//*[@aria-label='Close']"),
-                ]
-                for selector_type, selector_value in skip_selectors:
-                    try:
-                        elem = self.driver.find_element(selector_type, selector_value)
-                        if elem.is_displayed():
-                            elem.click()
-                            print(f">>> Clicked to proceed past tour: {selector_value}")
-                            time.sleep(2)
-                            break
-                    except Exception:
-                        continue
+                if self._wait_click(self._TOUR_SKIP_SELECTORS, timeout=3, js=True):
+                    logger.debug("Clicked to proceed past tour")
 
             # ========================================
             # STEP 4: Find "Page access" under "Your Page tools" (right side)
             # From screenshot: Right side shows "Your Page tools" section with "Page access" as first item
             # ========================================
-            print(">>> INVITE STEP 4: Looking for 'Page access' under 'Your Page tools'...")
-            page_access_clicked = False
+            logger.debug("INVITE STEP 4: Looking for 'Page access' under 'Your Page tools'...")
 
             # First scroll down slightly to make sure "Your Page tools" section is visible
             try:
                 self.driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(1)
-            except:
+            except WebDriverException:
                 pass
 
-            page_access_selectors = [
-                # Direct text match for "Page access"
-                (By.XPATH, "//span[text()='Page access']"),
-                (By.XPATH, "//div[text()='Page access']"),
-                # Look for the description text and click parent
-                (By.XPATH, "//span[contains(text(), 'Invite people to help manage')]"),
-                # Link-style selectors
-                (By.XPATH, "//a[.//span[text()='Page access']]"),
-                (By.XPATH, "//div[@role='link'][.//span[text()='Page access']]"),
-                # Div with the icon and text
-                (By.XPATH, "//div[contains(@class, 'x1i10hfl')][.//span[text()='Page access']]"),
-                # Find by partial text match
-                (By.XPATH, "//span[contains(text(), 'Page access')]"),
-                # Under "Your Page tools" section header
-                (By.XPATH, "//*[contains(text(), 'Your Page tools')]/following::*[contains(text(), 'Page access')][1]"),
-            ]
-
             # Wait up to 15 seconds for Page access to appear
-            max_wait = 15
-            start_wait = time.time()
-            while (time.time() - start_wait) < max_wait and not page_access_clicked:
-                for selector_type, selector_value in page_access_selectors:
-                    try:
-                        elements = self.driver.find_elements(selector_type, selector_value)
-                        for elem in elements:
-                            if elem.is_displayed():
-                                elem_text = elem.text.strip()
-                                print(f">>> Found element: '{elem_text}'")
-                                # Click using JavaScript for reliability
-                                self.driver.execute_script("arguments[0].click();", elem)
-                                print(f">>> Clicked 'Page access'")
-                                page_access_clicked = True
-                                time.sleep(3)
-                                break
-                        if page_access_clicked:
-                            break
-                    except Exception as e:
-                        continue
-                if not page_access_clicked:
-                    time.sleep(1)
-
-            if not page_access_clicked:
-                print(">>> WARNING: Could not find 'Page access', trying Settings menu...")
+            page_access_clicked = self._wait_click(self._PAGE_ACCESS_SELECTORS, timeout=15, js=True) is not None
+            if page_access_clicked:
+                logger.debug("Clicked 'Page access'")
+            else:
+                logger.warning("Could not find 'Page access', trying Settings menu...")
                 # Fallback: Try to navigate via Settings
                 try:
                     settings_url = f"https://www.facebook.com/settings/?tab=page_management_access"
                     self.driver.get(settings_url)
-                    time.sleep(3)
-                    print(">>> Navigated to page access settings directly")
-                except:
-                    pass
+                    logger.debug("Navigated to page access settings directly")
+                except WebDriverException as e:
+                    logger.warning(f"Could not open page access settings: {e}")
 
             # ========================================
             # STEP 4b: Switch to new tab (Page access opens in new tab)
             # ========================================
-            print(">>> INVITE STEP 4b: Checking for new tab...")
+            logger.debug("INVITE STEP 4b: Checking for new tab...")
             original_window = self.driver.current_window_handle
-            time.sleep(2)  # Wait for new tab to open
-
-            all_windows = self.driver.window_handles
-            if len(all_windows) > 1:
-                # Switch to the new tab (not the original)
-                for window in all_windows:
-                    if window != original_window:
-                        self.driver.switch_to.window(window)
-                        print(f">>> Switched to new tab (total tabs: {len(all_windows)})")
-                        time.sleep(2)  # Wait for new tab to load
-                        break
+            new_windows = None
+            # Only the Page access link opens a tab; the settings fallback navigates in place
+            if page_access_clicked:
+                try:
+                    new_windows = self._wait_for(5).until(
+                        lambda d: [h for h in d.window_handles if h != original_window]
+                    )
+                except TimeoutException:
+                    pass
+
+            if new_windows:
+                self.driver.switch_to.window(new_windows[0])
+                logger.debug("Switched to new tab")
+                # Let the new tab parse its document before STEP 5 polls it
+                try:
+                    self._wait_for(10).until(
+                        lambda d: d.execute_script("return document.readyState") != "loading"
+                    )
+                except TimeoutException:
+                    pass
             else:
-                print(">>> No new tab detected, continuing on current tab...")
+                logger.debug("No new tab detected, continuing on current tab...")
 
             # ========================================
             # STEP 5: Click "Add New" button
             # ========================================
-            print(">>> INVITE STEP 5: Looking for Add New button...")
-            add_selectors = [
-                # Using exact class from Facebook for "Add New"
-                (By.CSS_SELECTOR, "span.html-span.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x1hl2dhg.x16tdsg8.x1vvkbs.x1lliihq.x193iq5w.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft"),
-                (By.XPATH, "//span[text()='Add New']"),
-                (By.XPATH, "//span[contains(text(), 'Add New')]"),
-                (By.CSS_SELECTOR, "span.x1lliihq.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft"),
-                (By.XPATH, "//div[text()='Add New']"),
-                (By.XPATH, "//span[text()='Add']"),
-                (By.XPATH, "//button[contains(text(), 'Add')]"),
-                (By.XPATH, "//div[@role='button']//span[contains(text(), 'Add')]"),
-                (By.XPATH, "//span[contains(text(), 'Give someone Facebook access')]"),
-            ]
-
-            add_clicked = False
-            for selector in add_selectors:
-                try:
-                    if isinstance(selector, tuple):
-                        elements = self.driver.find_elements(selector[0], selector[1])
-                    else:
-                        elements = self.driver.find_elements(By.XPATH, selector)
-
-                    for add_btn in elements:
-                        if add_btn.is_displayed() and add_btn.is_enabled():
-                            btn_text = add_btn.text.strip().lower()
-                            if "add" in btn_text:
-                                add_btn.click()
-                                print(f">>> Clicked Add button: {add_btn.text}")
-                                add_clicked = True
-                                time.sleep(2)
-                                break
-                    if add_clicked:
-                        break
-                except NoSuchElementException:
-                    continue
-
-            if not add_clicked:
-                print(">>> WARNING: Could not find Add button")
+            logger.debug("INVITE STEP 5: Looking for Add New button...")
+            if self._wait_click(self._ADD_SELECTORS):
+                logger.debug("Clicked Add button")
+            else:
+                logger.warning("Could not find Add button")
 
             # ========================================
             # STEP 6: Click "Next" button (OPTIONAL - only appears for new pages)
             # ========================================
-            print(">>> INVITE STEP 6: Looking for Next button (optional step)...")
-            next_clicked = False
-            next_selectors = [
-                # Updated selector from Facebook
-                (By.CSS_SELECTOR, "span.html-span.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x1hl2dhg.x16tdsg8.x1vvkbs.x1lliihq.x193iq5w.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft"),
-                (By.XPATH, "//span[text()='Next']"),
-                (By.XPATH, "//span[contains(text(), 'Next')]"),
-            ]
-            for selector in next_selectors:
-                try:
-                    if isinstance(selector, tuple):
-                        elements = self.driver.find_elements(selector[0], selector[1])
-                    else:
-                        elements = self.driver.find_elements(By.XPATH, selector)
-
-                    for elem in elements:
-                        if elem.is_displayed() and "next" in elem.text.lower():
-                            elem.click()
-                            print(f">>> Clicked Next button")
-                            next_clicked = True
-                            time.sleep(2)
-                            break
-                    if next_clicked:
-                        break
-                except Exception:
-                    continue
+            logger.debug("INVITE STEP 6: Looking for Next button (optional step)...")
 
-            if not next_clicked:
-                print(">>> Next button not found - skipping (this is normal for older pages)")
+            # The dialog opens on either Next (new pages) or straight on the
+            # person search (older pages); one lookup per poll tells them apart
+            # instead of always spending a full wait on a Next that never comes
+            def next_or_input(driver):
+                found = self._find_first_each([(None, self._NEXT_SELECTORS), (None, self._PERSON_INPUT_SELECTORS)])
+                return found if any(found) else False
+
+            try:
+                next_btn, _ = self._wait_for(8).until(next_or_input)
+            except TimeoutException:
+                next_btn = None
+
+            if next_btn:
+                self._js_click(next_btn)
+                logger.debug("Clicked Next button")
+            else:
+                logger.debug("Next button not found - skipping (this is normal for older pages)")
 
             # ========================================
             # STEP 7: Find input field and paste profile URL
             # From screenshot 11: Input says "Who should have Facebook access to this Page?"
             # ========================================
-            print(">>> INVITE STEP 7: Looking for person search input...")
-            time.sleep(2)  # Wait for modal to fully load
-            person_input = None
-            input_selectors = [
-                # From screenshot: placeholder/label contains "Who should have Facebook access"
-                (By.CSS_SELECTOR, "input[placeholder*='Who should have']"),
-                (By.CSS_SELECTOR, "input[aria-label*='Who should have']"),
-                # Search input field
-                (By.CSS_SELECTOR, "input[type='search']"),
-                (By.CSS_SELECTOR, "input[role='combobox']"),
-                # Generic search selectors
-                (By.CSS_SELECTOR, "input[aria-label*='Search']"),
-                (By.CSS_SELECTOR, "input[placeholder*='Search']"),
-                (By.CSS_SELECTOR, "input[aria-label*='name']"),
-                (By.CSS_SELECTOR, "input[placeholder*='name']"),
-                # Any visible text input in the dialog
-                (By.XPATH, "//div[@role='dialog']//input[@type='text']"),
-                (By.XPATH, "//div[@role='dialog']//input[@type='search']"),
-                (By.XPATH, "//input[contains(@class, 'x1i10hfl')]"),
-            ]
-
-            for selector_type, selector_value in input_selectors:
-                try:
-                    elements = self.driver.find_elements(selector_type, selector_value)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            person_input = elem
-                            print(f">>> Found person input: {selector_value}")
-                            break
-                    if person_input:
-                        break
-                except Exception:
-                    continue
+            logger.debug("INVITE STEP 7: Looking for person search input...")
+            try:
+                person_input = self._wait_for(8).until(
+                    lambda d: self._find_first(self._PERSON_INPUT_SELECTORS)
+                )
+                logger.debug("Found person input")
+            except TimeoutException:
+                person_input = None
 
             if person_input:
                 person_input.clear()
-                time.sleep(1)  # Wait after clearing
 
-                # Use the full profile URL to search
-                search_term = profile_url if "facebook.com" in profile_url else profile_name_for_search
-                print(f">>> Will enter search term: {search_term}")
+                logger.debug(f"Will enter search term: {search_term}")
 
                 # Click the input first
                 person_input.click()
-                time.sleep(1)
 
-                # Type character by character with delay to avoid dropping characters
-                for char in search_term:
-                    person_input.send_keys(char)
-                    time.sleep(0.03)  # 30ms delay between each character
-
-                time.sleep(2)  # Wait 2 seconds after typing
-
-                # Verify what was typed
-                typed_value = person_input.get_attribute('value')
-                print(f">>> Typed value in input: {typed_value}")
-
-                # If characters were dropped, clear and try again slower
-                if typed_value != search_term:
-                    print(f">>> WARNING: Characters dropped! Retrying slower...")
-                    person_input.clear()
-                    time.sleep(1)
-                    person_input.click()
-                    time.sleep(0.5)
-                    # Type even slower on retry
-                    for char in search_term:
-                        person_input.send_keys(char)
-                        time.sleep(0.05)  # 50ms delay on retry
-                    time.sleep(2)
+                # Insert the whole term at once (nothing to drop, unlike per-key typing)
+                self._fast_type(person_input, search_term)
 
-                print(f">>> Entered search term: {search_term}")
-                time.sleep(3)  # Wait for search results to load
+                logger.debug(f"Entered search term: {search_term}")
+
+                # Wait for search results to load
+                try:
+                    self._wait_for(8).until(
+                        lambda d: self._find_first(((By.CSS_SELECTOR, self._PROFILE_RESULTS_CSS),))
+                    )
+                except TimeoutException:
+                    logger.debug("No search results appeared yet")
 
                 # ========================================
                 # STEP 8: Click on the profile result by NAME
                 # ========================================
-                print(f">>> INVITE STEP 8: Looking for profile '{profile_name}' in search results...")
+                logger.debug(f"INVITE STEP 8: Looking for profile '{profile_name}' in search results...")
                 result_clicked = False
 
                 # Strategy 1: Find by profile name using exact Facebook classes
                 if profile_name:
-                    name_selectors = [
-                        # Exact classes from Facebook profile name span: x1yhjpo9 x1ua5tub x104kibb with WebkitLineClamp style
-                        (By.CSS_SELECTOR, "span.x1yhjpo9.x1ua5tub.x104kibb"),
-                        (By.CSS_SELECTOR, "span[style*='WebkitLineClamp']"),
-                        # Exact text match
-                        (By.XPATH, f"//span[text()='{profile_name}']"),
-                        # Contains text match
-                        (By.XPATH, f"//span[contains(text(), '{profile_name}')]"),
-                    ]
-
-                    for selector_type, selector_value in name_selectors:
-                        if result_clicked:
-                            break
+                    elem = self._find_first(self._name_selectors(profile_name), text=pn_lower)
+                    if elem:
+                        # One .text round-trip, read before clicking can detach the element
+                        name_text = elem.text
+                        logger.debug(f"Found profile name: {name_text}")
+                        # Try to click parent first (the clickable row)
                         try:
-                            elements = self.driver.find_elements(selector_type, selector_value)
-                            for elem in elements:
-                                if elem.is_displayed() and profile_name.lower() in elem.text.lower():
-                                    print(f">>> Found profile name: {elem.text}")
-                                    # Try to click parent first (the clickable row)
-                                    try:
-                                        parent = elem.find_element(By.XPATH, "./ancestor::div[@role='option' or @role='button' or @role='listitem'][1]")
-                                        if parent.is_displayed():
-                                            parent.click()
-                                            print(f">>> Clicked parent of '{profile_name}'")
-                                            result_clicked = True
-                                            time.sleep(2)
-                                            break
-                                    except:
-                                        pass
-
-                                    # If no parent, click element directly
-                                    if not result_clicked:
-                                        try:
-                                            elem.click()
-                                            print(f">>> Clicked profile name directly: {elem.text}")
-                                            result_clicked = True
-                                            time.sleep(2)
-                                            break
-                                        except:
-                                            # JavaScript click as fallback
-                                            self.driver.execute_script("arguments[0].click();", elem)
-                                            print(f">>> JS clicked profile: {elem.text}")
-                                            result_clicked = True
-                                            time.sleep(2)
-                                            break
-                        except Exception as e:
-                            print(f">>> Selector {selector_value} failed: {e}")
-                            continue
+                            parent = self.driver.execute_script(self._RESULT_ROW_JS, elem)
+                            if parent:
+                                parent.click()
+                                logger.debug(f"Clicked parent of '{profile_name}'")
+                                result_clicked = True
+                        except (StaleElementReferenceException, ElementNotInteractableException,
+                                ElementClickInterceptedException):
+                            pass
+
+                        # If no parent, click element directly
+                        if not result_clicked:
+                            try:
+                                elem.click()
+                                logger.debug(f"Clicked profile name directly: {name_text}")
+                            except (ElementNotInteractableException, ElementClickInterceptedException):
+                                # JavaScript click as fallback
+                                self._js_click(elem)
+                                logger.debug(f"JS clicked profile: {name_text}")
+                            result_clicked = True
 
                 # Strategy 2: Fallback to generic selectors if name not found
                 if not result_clicked:
-                    print(">>> Profile name not found, trying generic selectors...")
-                    fallback_selectors = [
-                        (By.XPATH, "//div[@role='option']"),
-                        (By.XPATH, "//div[@role='listitem']"),
-                        (By.CSS_SELECTOR, "span[style*='WebkitLineClamp']"),
-                    ]
-
-                    for selector_type, selector_value in fallback_selectors:
-                        if result_clicked:
-                            break
+                    logger.debug("Profile name not found, trying generic selectors...")
+                    result = self._find_first(self._PROFILE_RESULT_SELECTORS)
+                    if result:
                         try:
-                            results = self.driver.find_elements(selector_type, selector_value)
-                            for result in results:
-                                if result.is_displayed():
-                                    result.click()
-                                    print(f">>> Clicked fallback result: {result.text[:50] if result.text else 'profile'}")
-                                    result_clicked = True
-                                    time.sleep(2)
-                                    break
-                        except:
-                            continue
+                            result_text = result.text
+                            result.click()
+                            logger.debug(f"Clicked fallback result: {result_text[:50] if result_text else 'profile'}")
+                            result_clicked = True
+                        except WebDriverException:
+                            pass
 
                 if not result_clicked:
-                    print(">>> WARNING: Could not click search result, trying to proceed anyway...")
+                    logger.warning("Could not click search result, trying to proceed anyway...")
             else:
-                print(">>> WARNING: Could not find person input field")
+                logger.warning("Could not find person input field")
 
             # ========================================
             # STEP 7: Click "Give Access" button
             # ========================================
-            print(">>> INVITE STEP 7: Clicking Give Access button...")
-            time.sleep(2)  # Wait for button to be ready
-            submit_selectors = [
-                # Exact classes from Facebook span: xdj266r x14z9mp xat24cr x1lziwak xexx8yu xyri2b x18d9i69 x1c1uobl x1hl2dhg x16tdsg8 x1vvkbs x1lliihq x193iq5w x6ikm8r x10wlt62 xlyipyv xuxw1ft
-                (By.CSS_SELECTOR, "span.xdj266r.x1lliihq.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft"),
-                (By.CSS_SELECTOR, "span.x1lliihq.x193iq5w.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft"),
-                (By.XPATH, "//span[text()='Give Access']"),
-                (By.XPATH, "//span[contains(text(), 'Give Access')]"),
-                (By.XPATH, "//span[text()='Give access']"),
-                (By.XPATH, "//div[@role='button']//span[contains(text(), 'Give')]"),
-                (By.XPATH, "//div[@role='button' and .//span[text()='Give Access']]"),
-            ]
-
-            submit_clicked = False
-            for selector in submit_selectors:
-                try:
-                    if isinstance(selector, tuple):
-                        elements = self.driver.find_elements(selector[0], selector[1])
-                    else:
-                        elements = self.driver.find_elements(By.XPATH, selector)
-
-                    for submit_btn in elements:
-                        if submit_btn.is_displayed() and submit_btn.is_enabled():
-                            btn_text = submit_btn.text.strip().lower()
-                            if "give" in btn_text or "access" in btn_text:
-                                submit_btn.click()
-                                print(f">>> Clicked Give Access button: {submit_btn.text}")
-                                submit_clicked = True
-                                time.sleep(3)
-                                break
-                    if submit_clicked:
-                        break
-                except NoSuchElementException:
-                    continue
-
-            # ========================================
-            # STEP 8: Enter password for confirmation
-            # ========================================
+            logger.debug("INVITE STEP 7: Clicking Give Access button...")
+            submit_clicked = self._wait_click(self._GIVE_ACCESS_SELECTORS) is not None
             if submit_clicked:
-                print(">>> INVITE STEP 8: Entering password for confirmation...")
-                time.sleep(2)  # Wait for password dialog to appear
+                logger.debug("Clicked Give Access button")
+
+                # ========================================
+                # STEP 8: Enter password for confirmation
+                # ========================================
+                logger.debug("INVITE STEP 8: Entering password for confirmation...")
 
                 from django.conf import settings
                 fb_password = getattr(settings, 'CREATOR_PROFILE_PASSWORD', '')
 
-                password_entered = False
-                password_selectors = [
-                    (By.CSS_SELECTOR, "input[type='password']"),
-                    (By.CSS_SELECTOR, "input.x1i10hfl[type='password']"),
-                    (By.XPATH, "//input[@type='password']"),
-                ]
+                # Wait for whichever comes first: the password prompt, or the
+                # Confirm button when Facebook does not re-ask for the password
+                def password_or_confirm(driver):
+                    found = self._find_first_each([(None, self._CONFIRM_PASSWORD_SELECTORS), (None, self._CONFIRM_SELECTORS)])
+                    return found if any(found) else False
 
-                for selector_type, selector_value in password_selectors:
-                    if password_entered:
-                        break
-                    try:
-                        password_inputs = self.driver.find_elements(selector_type, selector_value)
-                        for pwd_input in password_inputs:
-                            if pwd_input.is_displayed():
-                                pwd_input.clear()
-                                pwd_input.click()
-                                time.sleep(0.5)
-                                # Type password character by character
-                                for char in fb_password:
-                                    pwd_input.send_keys(char)
-                                    time.sleep(0.02)
-                                print(">>> Password entered successfully")
-                                password_entered = True
-                                time.sleep(1)
-                                break
-                    except Exception as e:
-                        print(f">>> Password selector failed: {e}")
-                        continue
+                try:
+                    pwd_input, _ = self._wait_for(8).until(password_or_confirm)
+                except TimeoutException:
+                    pwd_input = None
 
-                if not password_entered:
-                    print(">>> WARNING: Could not find password input field")
+                if pwd_input:
+                    pwd_input.clear()
+                    pwd_input.click()
+                    self._fast_type(pwd_input, fb_password)
+                    logger.debug("Password entered successfully")
+                else:
+                    logger.warning("Could not find password input field")
 
-            # ========================================
-            # STEP 9: Click Confirm button
-            # ========================================
-            if submit_clicked:
-                print(">>> INVITE STEP 9: Clicking Confirm button...")
-                time.sleep(1)
+                # ========================================
+                # STEP 9: Click Confirm button
+                # ========================================
+                logger.debug("INVITE STEP 9: Clicking Confirm button...")
 
-                confirm_clicked = False
-                confirm_selectors = [
-                    # Exact classes from Facebook Confirm span
-                    (By.CSS_SELECTOR, "span.x1lliihq.x6ikm8r.x10wlt62.x1n2onr6.xlyipyv.xuxw1ft"),
-                    (By.XPATH, "//span[text()='Confirm']"),
-                    (By.XPATH, "//span[contains(text(), 'Confirm')]"),
-                    (By.XPATH, "//div[@role='button']//span[text()='Confirm']"),
-                ]
-
-                for selector_type, selector_value in confirm_selectors:
-                    if confirm_clicked:
-                        break
+                confirm_btn = self._wait_click(self._CONFIRM_SELECTORS)
+                if confirm_btn:
+                    logger.debug("Clicked Confirm button")
+                    # Let the dialog close so the request is sent before we move on
                     try:
-                        elements = self.driver.find_elements(selector_type, selector_value)
-                        for elem in elements:
-                            if elem.is_displayed():
-                                elem_text = elem.text.strip().lower()
-                                if 'confirm' in elem_text:
-                                    elem.click()
-                                    print(f">>> Clicked Confirm button")
-                                    confirm_clicked = True
-                                    time.sleep(3)
-                                    break
-                    except Exception as e:
-                        print(f">>> Confirm selector failed: {e}")
-                        continue
-
-                if not confirm_clicked:
-                    print(">>> WARNING: Could not find Confirm button")
+                        self._wait_for(5).until(EC.staleness_of(confirm_btn))
+                    except TimeoutException:
+                        pass
+                else:
+                    logger.warning("Could not find Confirm button")
 
             if submit_clicked:
-                print(f">>> SUCCESS: Page {page_id} shared to profile {profile_url}")
                 logger.info(f"Page {page_id} shared to profile {profile_url}")
 
                 return InviteResult(
@@ -2697,7 +2957,7 @@ class FacebookPageGenerator:
                     role=role
                 )
             else:
-                print(">>> WARNING: Could not confirm invite was sent")
+                logger.warning("Could not confirm invite was sent")
                 # Still return success if we got this far, as invite might have been sent
                 return InviteResult(
                     success=True,
@@ -2708,7 +2968,6 @@ class FacebookPageGenerator:
                 )
 
         except TimeoutException:
-            print(f">>> ERROR: Timeout sharing page to {profile_url}")
             logger.error(f"Timeout sharing page to {profile_url}")
             return InviteResult(
                 success=False,
@@ -2717,7 +2976,6 @@ class FacebookPageGenerator:
                 error="Timeout waiting for page elements"
             )
         except Exception as e:
-            print(f">>> ERROR: Exception sharing page to {profile_url}: {e}")
             logger.error(f"Error sharing page to {profile_url}: {e}")
             import traceback
             traceback.print_exc()
@@ -2744,6 +3002,24 @@ class FacebookPageGenerator:
             )
         }
 
+    def reset_metrics(self):
+        """Zero the counters reported by get_metrics (e.g. for a reused generator)"""
+        self.metrics = {
+            'pages_created': 0,
+            'total_time': 0.0,
+            'errors': 0,
+            'rate_limit_hits': 0,
+        }
+
+    def reset_to_blank(self):
+        """Close extra tabs and park the browser on about:blank, keeping the session"""
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self.driver.get("about:blank")
+
     def __enter__(self):
         self.start()
         return self
@@ -2754,3 +3030,6 @@ class FacebookPageGenerator:
 
 # Alias for backward compatibility
 SeleniumPageGenerator = FacebookPageGenerator
+
+# Keep the selector wins of generators that were never stopped
+atexit.register(FacebookPageGenerator.save_selector_stats)
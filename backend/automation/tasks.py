@@ -5,31 +5,181 @@ Handles async batch processing and stores results in MongoDB.
 
 import time
 import logging
-from celery import shared_task
+from celery import chord, shared_task
 from django.conf import settings
 
+from pages import mongodb
 from pages.mongodb import (
     get_task,
-    update_task_status,
-    increment_task_counter,
-    store_page_details,
+    claim_task,
+    finish_task,
+    finalize_task_counters,
     get_profile,
 )
-from .selenium_driver import FacebookPageGenerator
+from pages.cancellation import clear_cancel
+from .name_generator import get_page_names_for_sequence
+from .page_runner import _shard_ranges, creator_profiles, login, run_pages
+from . import driver_pool
 
 logger = logging.getLogger(__name__)
 
 
+def _merge_metrics(metrics_list: list) -> dict:
+    """Combine get_metrics() dicts from several generators"""
+    merged = {'pages_created': 0, 'total_time': 0.0, 'errors': 0, 'rate_limit_hits': 0}
+    for metrics in metrics_list:
+        for key in merged:
+            merged[key] += metrics.get(key, 0)
+    attempts = merged['pages_created'] + merged['errors']
+    merged['avg_time_per_page'] = (
+        merged['total_time'] / merged['pages_created'] if merged['pages_created'] > 0 else 0
+    )
+    merged['success_rate'] = merged['pages_created'] / attempts * 100 if attempts > 0 else 0
+    return merged
+
+
+def _run_shard(task_id: str, start: int, end: int, base_page_name: str,
+               profile_id: str = None, public_profile_url: str = "",
+               parallel: bool = False, headless: bool = True, test_mode: bool = True,
+               assigned_bm: str = "") -> dict:
+    """
+    Create pages start..end-1 of a task in one browser session with the
+    same loop as the in-process run_task_sync (see page_runner.run_pages).
+
+    parallel=True when other shards may be running on the same host, so
+    starting Chrome must not kill their browsers as orphans.
+    """
+    timeout = getattr(settings, 'SELENIUM_TIMEOUT', 30)
+    pages_per_profile = getattr(settings, 'PAGES_PER_PROFILE', 3)
+
+    # Credentials are looked up here so they never travel through the broker;
+    # tasks without a profile rotate through the configured creator profiles
+    profile = get_profile(profile_id) if profile_id else None
+    if profile:
+        profiles = [profile]
+    else:
+        profiles = creator_profiles(
+            getattr(settings, 'CREATOR_PROFILES', []),
+            getattr(settings, 'CREATOR_PROFILE_EMAIL', ''),
+            getattr(settings, 'CREATOR_PROFILE_PASSWORD', ''),
+            pages_per_profile,
+        )
+
+    results = {
+        'processed': 0,
+        'success': 0,
+        'failed': 0,
+        'pages': []
+    }
+
+    try:
+        with driver_pool.acquire(headless=headless, test_mode=test_mode, timeout=timeout,
+                                 kill_orphans=not parallel) as generator:
+            generator.pages_per_profile = pages_per_profile
+            error = login(generator, profiles)
+            if error:
+                results['error'] = error
+                return results
+
+            # Same names (70% female / 30% male) as the in-process run_task_sync
+            page_names = get_page_names_for_sequence(base_page_name, end - 1)[start - 1:]
+            results = run_pages(generator, mongodb, task_id, page_names, start=start,
+                                public_profile_url=public_profile_url, remote_cancel=True,
+                                assigned_bm=assigned_bm)
+            results['metrics'] = generator.get_metrics()
+
+    except Exception as e:
+        logger.error(f"Shard [{start}, {end}) of task {task_id} failed with error: {e}")
+        results['error'] = str(e)
+
+    return results
+
+
+@shared_task
+def create_page_shard(task_id: str, start: int, end: int, base_page_name: str,
+                      profile_id: str = None, public_profile_url: str = "",
+                      headless: bool = True, test_mode: bool = True,
+                      assigned_bm: str = "") -> dict:
+    """Celery task creating one shard of a task's pages in its own Chrome session"""
+    return _run_shard(task_id, start, end, base_page_name, profile_id,
+                      public_profile_url, parallel=True, headless=headless, test_mode=test_mode,
+                      assigned_bm=assigned_bm)
+
+
+@shared_task
+def finalize_pages_task(shard_results: list, task_id: str, overall_start: float) -> dict:
+    """Merge the shard results of a task and record its final status"""
+    results = {
+        'task_id': task_id,
+        'processed': 0,
+        'success': 0,
+        'failed': 0,
+        'pages': [],
+    }
+    errors = []
+    metrics = []
+    for shard in shard_results:
+        results['processed'] += shard['processed']
+        results['success'] += shard['success']
+        results['failed'] += shard['failed']
+        results['pages'].extend(shard['pages'])
+        if 'metrics' in shard:
+            metrics.append(shard['metrics'])
+        if shard.get('error'):
+            errors.append(shard['error'])
+
+    results['metrics'] = _merge_metrics(metrics)
+    results['total_time'] = time.time() - overall_start
+    if errors:
+        results['error'] = '; '.join(errors)
+
+    final_status = 'completed'
+    if results['success'] == 0 and (results['failed'] > 0 or errors):
+        final_status = 'failed'
+
+    # The shards' $inc updates only drive live progress; record exact totals
+    finalize_task_counters(task_id, pages_created=results['success'], pages_failed=results['failed'])
+    # A cancelled task stays cancelled
+    finish_task(task_id, final_status, error_message=results.get('error'))
+    clear_cancel(task_id)
+
+    logger.info(f"Task {task_id} completed: {results['success']} success, {results['failed']} failed")
+    return results
+
+
+@shared_task
+def fail_pages_task(request, exc, traceback, task_id: str):
+    """
+    Errback of finalize_pages_task. A shard that dies outside _run_shard
+    (worker lost, CELERY_TASK_TIME_LIMIT kill, unserializable result) fails
+    the chord and its callback never runs; end the task here instead.
+    """
+    logger.error(f"Task {task_id}: page shards failed: {exc!r}")
+    # A cancelled task stays cancelled
+    finish_task(task_id, 'failed', error_message=f'Page shards failed: {exc}')
+    clear_cancel(task_id)
+
+
 @shared_task(bind=True, max_retries=3)
-def create_pages_task(self, task_id: str):
+def create_pages_task(self, task_id: str, test_mode: bool = True, headless: bool = None):
     """
     Celery task to create multiple Facebook pages.
 
+    The pages are split into SELENIUM_WORKERS contiguous shards, each run by
+    a create_page_shard task with its own browser; a chord callback
+    (finalize_pages_task) merges the results once every shard is done, and
+    its errback (fail_pages_task) fails the task if a shard is lost.
+    Called directly (not through a worker), the shards run inline.
+
     Args:
         task_id: MongoDB ObjectId of the task document
+        test_mode: Use test site instead of real Facebook (default True;
+            task_start passes SELENIUM_TEST_MODE)
+        headless: Run Chrome headless (default SELENIUM_HEADLESS, else True)
 
     Returns:
-        dict with execution results and metrics
+        dict with execution results and metrics (when run inline), otherwise
+        the number of shards dispatched
     """
     logger.info(f"Starting page creation task: {task_id}")
 
@@ -39,114 +189,41 @@ def create_pages_task(self, task_id: str):
         logger.error(f"Task not found: {task_id}")
         return {'error': f'Task {task_id} not found'}
 
-    # Update task with Celery task ID
-    update_task_status(task_id, 'running', celery_task_id=self.request.id)
-
-    # Get profile credentials
-    profile = get_profile(task['profile_id']) if task.get('profile_id') else None
+    # Record the Celery task ID; a task cancelled while queued is not run
+    if not claim_task(task_id, self.request.id):
+        logger.info(f"Task {task_id} was cancelled before it started")
+        clear_cancel(task_id)
+        return {'task_id': task_id, 'cancelled': True}
 
-    # Configuration
-    headless = getattr(settings, 'SELENIUM_HEADLESS', True)
-    timeout = getattr(settings, 'SELENIUM_TIMEOUT', 30)
-    test_mode = True  # Set to False to use real Facebook (NOT RECOMMENDED)
+    profile_id = task.get('profile_id') or None
+    if headless is None:
+        headless = getattr(settings, 'SELENIUM_HEADLESS', True)
 
+    # Task fields never change during the run; the shards never re-read the task
     num_pages = task['num_pages']
     base_page_name = task['base_page_name']
+    public_profile_url = task.get('public_profile_url', '')
     assigned_bm = task.get('assigned_bm', '')
 
+    workers = getattr(settings, 'SELENIUM_WORKERS', 1)
+    shards = _shard_ranges(num_pages, workers)
     overall_start = time.time()
-    results = {
-        'task_id': task_id,
-        'processed': 0,
-        'success': 0,
-        'failed': 0,
-        'pages': []
-    }
-
-    try:
-        with FacebookPageGenerator(
-            headless=headless,
-            timeout=timeout,
-            test_mode=test_mode
-        ) as generator:
-
-            # Login if credentials provided and not in test mode
-            if profile and not test_mode:
-                login_success = generator.login_facebook(
-                    email=profile['email'],
-                    password=profile['password']
-                )
-                if not login_success:
-                    update_task_status(task_id, 'failed',
-                                       error_message='Facebook login failed')
-                    return {'error': 'Facebook login failed'}
-
-            # Create pages
-            for i in range(1, num_pages + 1):
-                # Check if task was cancelled
-                current_task = get_task(task_id)
-                if current_task and current_task.get('status') == 'cancelled':
-                    logger.info(f"Task {task_id} was cancelled")
-                    break
-
-                page_name = f"{base_page_name}_{i}"
-                logger.info(f"Creating page {i}/{num_pages}: {page_name}")
-
-                # Create the page
-                result = generator.create_facebook_page(
-                    page_name=page_name,
-                    category='Business',
-                    description=f'{page_name} - Auto-generated page'
-                )
-
-                if result.success:
-                    # Store page in MongoDB
-                    store_page_details(
-                        task_id=task_id,
-                        page_id=result.page_id,
-                        page_name=result.page_name,
-                        page_url=result.page_url,
-                        assigned_bm=assigned_bm,
-                        sequence_num=i
-                    )
-                    increment_task_counter(task_id, 'pages_created')
-                    results['success'] += 1
-                else:
-                    increment_task_counter(task_id, 'pages_failed')
-                    results['failed'] += 1
-
-                results['processed'] += 1
-                results['pages'].append({
-                    'name': page_name,
-                    'page_id': result.page_id,
-                    'page_url': result.page_url,
-                    'success': result.success,
-                    'duration': result.duration,
-                    'error': result.error
-                })
-
-            # Get final metrics
-            metrics = generator.get_metrics()
-            results['metrics'] = metrics
 
-    except Exception as e:
-        logger.error(f"Task {task_id} failed with error: {e}")
-        update_task_status(task_id, 'failed', error_message=str(e))
-        results['error'] = str(e)
-        return results
+    if self.request.called_directly or len(shards) == 1:
+        shard_results = [
+            _run_shard(task_id, start, end, base_page_name, profile_id, public_profile_url,
+                       headless=headless, test_mode=test_mode, assigned_bm=assigned_bm)
+            for start, end in shards
+        ]
+        return finalize_pages_task(shard_results, task_id, overall_start)
 
-    # Update final task status
-    total_time = time.time() - overall_start
-    results['total_time'] = total_time
-
-    final_status = 'completed' if results['failed'] == 0 else 'completed'
-    if results['success'] == 0 and results['failed'] > 0:
-        final_status = 'failed'
-
-    update_task_status(task_id, final_status)
-
-    logger.info(f"Task {task_id} completed: {results['success']} success, {results['failed']} failed")
-    return results
+    logger.info(f"Task {task_id}: dispatching {len(shards)} shards for {num_pages} pages")
+    chord(
+        create_page_shard.s(task_id, start, end, base_page_name, profile_id, public_profile_url,
+                            headless, test_mode, assigned_bm)
+        for start, end in shards
+    )(finalize_pages_task.s(task_id, overall_start).on_error(fail_pages_task.s(task_id)))
+    return {'task_id': task_id, 'shards': len(shards)}
 
 
 @shared_task
@@ -175,11 +252,7 @@ def run_benchmark_task(base_name: str, count: int, headless: bool = True,
     start_time = time.time()
 
     try:
-        with FacebookPageGenerator(
-            headless=headless,
-            timeout=timeout,
-            test_mode=test_mode
-        ) as generator:
+        with driver_pool.acquire(headless=headless, test_mode=test_mode, timeout=timeout) as generator:
 
             for i in range(1, count + 1):
                 page_name = f"{base_name}_{i}"
@@ -216,9 +289,11 @@ def run_page_generation_sync(task_id: str) -> dict:
 
 
 def run_efficiency_test(base_name: str, count: int, headless: bool = True,
-                        timeout: int = 30) -> dict:
+                        timeout: int = 30, wait_timeout: float = None) -> dict:
     """
     Run a standalone efficiency test synchronously.
+
+    wait_timeout bounds the wait for a free pooled browser (see driver_pool.acquire).
     """
     results = {
         'pages': [],
@@ -227,11 +302,8 @@ def run_efficiency_test(base_name: str, count: int, headless: bool = True,
 
     start_time = time.time()
 
-    with FacebookPageGenerator(
-        headless=headless,
-        timeout=timeout,
-        test_mode=True
-    ) as generator:
+    with driver_pool.acquire(headless=headless, test_mode=True, timeout=timeout,
+                             wait_timeout=wait_timeout) as generator:
 
         for i in range(1, count + 1):
             page_name = f"{base_name}_{i}"
@@ -1,3 +1,424 @@
-from django.test import TestCase
+from collections import Counter
+from contextlib import contextmanager
+from unittest import mock
 
-# Create your tests here.
+from celery.exceptions import ChordError
+from django.test import SimpleTestCase, override_settings
+
+from pages import mongodb, storage
+
+from . import driver_pool, tasks
+from . import page_runner
+from .page_runner import _shard_ranges, create_pages_bulk, run_pages, share_page_to_profiles
+from .selenium_driver import InviteResult, PageResult
+from .tasks import _merge_metrics
+
+
+class ShardRangesTests(SimpleTestCase):
+    def test_covers_all_pages_without_overlap(self):
+        ranges = _shard_ranges(10, 3)
+        self.assertEqual(ranges, [(1, 5), (5, 8), (8, 11)])
+
+    def test_single_worker(self):
+        self.assertEqual(_shard_ranges(7, 1), [(1, 8)])
+
+    def test_no_more_shards_than_pages(self):
+        self.assertEqual(_shard_ranges(2, 5), [(1, 2), (2, 3)])
+
+    def test_at_least_one_worker(self):
+        self.assertEqual(_shard_ranges(4, 0), [(1, 5)])
+
+
+class MergeMetricsTests(SimpleTestCase):
+    def test_sums_counts_and_recomputes_rates(self):
+        merged = _merge_metrics([
+            {'pages_created': 3, 'total_time': 6.0, 'errors': 1, 'rate_limit_hits': 0},
+            {'pages_created': 1, 'total_time': 4.0, 'errors': 0, 'rate_limit_hits': 2},
+        ])
+        self.assertEqual(merged['pages_created'], 4)
+        self.assertEqual(merged['errors'], 1)
+        self.assertEqual(merged['rate_limit_hits'], 2)
+        self.assertEqual(merged['total_time'], 10.0)
+        self.assertEqual(merged['avg_time_per_page'], 2.5)
+        self.assertEqual(merged['success_rate'], 80.0)
+
+    def test_empty(self):
+        merged = _merge_metrics([])
+        self.assertEqual(merged['pages_created'], 0)
+        self.assertEqual(merged['avg_time_per_page'], 0)
+        self.assertEqual(merged['success_rate'], 0)
+
+
+class StubGenerator:
+    """Stands in for FacebookPageGenerator without launching Chrome"""
+
+    def __init__(self, headless=True, timeout=30, test_mode=True):
+        self.test_mode = test_mode
+        self.driver = mock.Mock(current_url='about:blank')
+        self.kill_orphans = None
+        self.stopped = False
+
+    def start(self, kill_orphans=True):
+        self.kill_orphans = kill_orphans
+
+    def stop(self):
+        self.stopped = True
+
+    def reset_metrics(self):
+        pass
+
+    def reset_to_blank(self):
+        pass
+
+
+class DriverPoolTests(SimpleTestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.object(driver_pool, 'FacebookPageGenerator', StubGenerator),
+            mock.patch.object(driver_pool, 'MAX_BROWSERS', 1),
+            # Keep the idle reaper thread from starting
+            mock.patch.object(driver_pool, '_reaper', object()),
+            mock.patch.object(driver_pool, '_idle', {}),
+            mock.patch.object(driver_pool, '_live', 0),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_borrow_and_return(self):
+        with driver_pool.acquire() as generator:
+            self.assertEqual(driver_pool._live, 1)
+        self.assertEqual(driver_pool._live, 1)
+        self.assertEqual(len(driver_pool._idle[(True, True, 30)]), 1)
+
+        # The returned generator is reused
+        with driver_pool.acquire() as again:
+            self.assertIs(again, generator)
+        self.assertEqual(driver_pool._live, 1)
+
+    def test_other_key_evicts_idle_generator(self):
+        with driver_pool.acquire(headless=True) as first:
+            pass
+        with driver_pool.acquire(headless=False) as second:
+            self.assertIsNot(second, first)
+        self.assertTrue(first.stopped)
+        self.assertEqual(driver_pool._live, 1)
+        self.assertEqual(driver_pool._idle[(True, True, 30)], [])
+
+    def test_error_in_block_quits_generator(self):
+        with self.assertRaises(ValueError):
+            with driver_pool.acquire() as generator:
+                raise ValueError
+        self.assertTrue(generator.stopped)
+        self.assertEqual(driver_pool._live, 0)
+
+    def test_dead_idle_generator_is_replaced(self):
+        with driver_pool.acquire() as dead:
+            pass
+        # A driver whose browser is gone fails on any attribute access
+        dead.driver = mock.Mock(spec=[])
+        with driver_pool.acquire() as generator:
+            self.assertIsNot(generator, dead)
+        self.assertTrue(dead.stopped)
+        self.assertEqual(driver_pool._live, 1)
+
+    def test_full_pool_times_out(self):
+        with driver_pool.acquire():
+            with self.assertRaises(TimeoutError):
+                with driver_pool.acquire(wait_timeout=0.01):
+                    pass
+        self.assertEqual(driver_pool._live, 1)
+
+    def test_kill_orphans_reaches_start(self):
+        with driver_pool.acquire(kill_orphans=True) as generator:
+            self.assertTrue(generator.kill_orphans)
+
+    def test_close_pool_quits_idle(self):
+        with driver_pool.acquire() as generator:
+            pass
+        driver_pool.close_pool()
+        self.assertTrue(generator.stopped)
+        self.assertEqual(driver_pool._live, 0)
+
+
+class RunnerStubGenerator:
+    """Generator that reports a created page for each URL in urls, in order"""
+
+    test_mode = True
+    current_profile_email = 'creator@example.com'
+    _next_allowed_ts = 0.0
+
+    def __init__(self, urls):
+        self.urls = list(urls)
+        self.shared = []
+
+    def should_rotate_profile(self):
+        return False
+
+    def create_facebook_page(self, page_name):
+        url = self.urls.pop(0)
+        if isinstance(url, Exception):
+            raise url
+        if url is None:
+            return PageResult(success=False, page_name=page_name, error='Could not click Create Page button')
+        return PageResult(success=True, page_name=page_name,
+                          page_id=url.rstrip('/').rsplit('/', 1)[-1], page_url=url)
+
+    def increment_page_count(self):
+        pass
+
+    def share_page_to_profile(self, page_id, profile_url, role, page_name, profile_name=''):
+        if isinstance(profile_url, Exception):
+            raise profile_url
+        self.shared.append(page_id)
+        return InviteResult(success=True, page_id=page_id, invitee_email=profile_url,
+                            invite_link='https://example.com/invite', role=role)
+
+
+class FlushRecorder:
+    """Stands in for a store's flush_task_writes, keeping copies of each flush"""
+
+    def __init__(self):
+        self.calls = 0
+        self.batches = []
+        self.pages = []
+        self.invites = []
+        self.counters = Counter()
+
+    def __call__(self, task_id, pages=(), invites=(), counters=None):
+        self.calls += 1
+        self.batches.append(len(pages))
+        self.pages += pages
+        self.invites += invites
+        self.counters.update(counters or {})
+
+
+NAMES = [('Test - Jane', 'female'), ('Test - Emma', 'female'), ('Test - John', 'male')]
+
+
+class RunPagesStorageTests(SimpleTestCase):
+    def test_test_mode_run_on_mongodb_stores_every_page(self):
+        urls = [f'https://facebook.com/test_{i:012x}' for i in range(3)]
+        generator = RunnerStubGenerator(urls)
+        flush = FlushRecorder()
+        with mock.patch.object(mongodb, 'flush_task_writes', flush):
+            results = run_pages(generator, mongodb, 'task-1', NAMES,
+                                public_profile_url='https://facebook.com/someone',
+                                assigned_bm='bm-1')
+
+        self.assertEqual((results['success'], results['failed']), (3, 0))
+        self.assertEqual([doc['page_url'] for doc in flush.pages], urls)
+        self.assertEqual({doc['assigned_bm'] for doc in flush.pages}, {'bm-1'})
+        self.assertEqual(len(flush.invites), 3)
+        self.assertEqual(flush.counters, {'pages_created': 3, 'shares_sent': 3})
+
+    def test_numeric_page_url_is_stored(self):
+        generator = RunnerStubGenerator(['https://www.facebook.com/61584296746538'])
+        with mock.patch.object(mongodb, 'flush_task_writes', FlushRecorder()):
+            results = run_pages(generator, mongodb, 'task-1', NAMES[:1])
+        self.assertEqual(results['success'], 1)
+
+    def test_url_rejected_by_json_storage_counts_as_failed(self):
+        generator = RunnerStubGenerator(['https://www.facebook.com/help/123'])
+        flush = FlushRecorder()
+        with mock.patch.object(storage, 'flush_task_writes', flush):
+            results = run_pages(generator, storage, 'task-1', NAMES[:1],
+                                public_profile_url='https://facebook.com/someone')
+
+        self.assertEqual((results['success'], results['failed']), (0, 1))
+        self.assertEqual(generator.shared, [])
+        self.assertEqual((flush.pages, flush.invites), ([], []))
+        self.assertEqual(flush.counters, {'pages_failed': 1})
+
+
+def test_urls(count):
+    return [f'https://facebook.com/test_{i:012x}' for i in range(count)]
+
+
+class RunPagesFlushTests(SimpleTestCase):
+    def run_pages(self, urls, names=None, **kwargs):
+        names = names or [(f'Test - {i}', 'female') for i in range(len(urls))]
+        flush = FlushRecorder()
+        with mock.patch.object(mongodb, 'flush_task_writes', flush):
+            results = run_pages(RunnerStubGenerator(urls), mongodb, 'task-1', names, **kwargs)
+        return results, flush
+
+    @mock.patch.object(page_runner, 'PAGE_FLUSH_SECONDS', 3600)
+    def test_fast_pages_are_batched(self):
+        results, flush = self.run_pages(test_urls(12))
+        self.assertEqual(results['success'], 12)
+        # 10 pages, then the remaining 2 in the final flush
+        self.assertEqual(flush.batches, [10, 2])
+        self.assertEqual(flush.counters, {'pages_created': 12})
+
+    @mock.patch.object(page_runner, 'PAGE_FLUSH_SECONDS', 0)
+    def test_slow_pages_are_written_one_by_one(self):
+        results, flush = self.run_pages(test_urls(3))
+        self.assertEqual(flush.batches[:3], [1, 1, 1])
+        self.assertEqual(sum(flush.batches), 3)
+
+    def test_failed_pages_are_counted(self):
+        urls = test_urls(2)
+        results, flush = self.run_pages([urls[0], None, urls[1]])
+        self.assertEqual((results['processed'], results['success'], results['failed']), (3, 2, 1))
+        self.assertEqual([page['success'] for page in results['pages']], [True, False, True])
+        self.assertEqual(flush.counters, {'pages_created': 2, 'pages_failed': 1})
+
+    @mock.patch.object(page_runner, 'PAGE_FLUSH_SECONDS', 3600)
+    def test_pages_created_before_an_error_are_kept(self):
+        flush = FlushRecorder()
+        generator = RunnerStubGenerator(test_urls(2) + [RuntimeError('browser died')])
+        with mock.patch.object(mongodb, 'flush_task_writes', flush):
+            with self.assertRaises(RuntimeError):
+                run_pages(generator, mongodb, 'task-1', NAMES)
+        self.assertEqual(len(flush.pages), 2)
+        self.assertEqual(flush.counters, {'pages_created': 2})
+
+    def test_cancelled_task_creates_no_pages(self):
+        with mock.patch.object(page_runner, 'is_cancelled', return_value=True):
+            results, flush = self.run_pages(test_urls(3))
+        self.assertEqual(results['processed'], 0)
+        self.assertEqual(flush.pages, [])
+
+
+class PooledStubTestCase(SimpleTestCase):
+    """Hands out self.generators from a patched driver_pool.acquire"""
+
+    def setUp(self):
+        self.generators = []
+        self.acquired = []
+        patch = mock.patch.object(driver_pool, 'acquire', self.acquire)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    @contextmanager
+    def acquire(self, **kwargs):
+        self.acquired.append(kwargs)
+        yield self.generators.pop(0)
+
+
+class CreatePagesBulkTests(PooledStubTestCase):
+    def create(self, names, **kwargs):
+        flush = FlushRecorder()
+        with mock.patch.object(mongodb, 'flush_task_writes', flush):
+            results = create_pages_bulk(mongodb, 'task-1', names, [], **kwargs)
+        return results, flush
+
+    @mock.patch.object(driver_pool, 'MAX_BROWSERS', 2)
+    def test_pages_are_split_across_browsers(self):
+        self.generators = [RunnerStubGenerator(test_urls(3)), RunnerStubGenerator(test_urls(2))]
+        names = [(f'Test - {i}', 'female') for i in range(1, 6)]
+        results, flush = self.create(names, concurrency=2)
+
+        self.assertEqual((results['processed'], results['success']), (5, 5))
+        self.assertEqual([page['name'] for page in results['pages']], [name for name, _ in names])
+        self.assertEqual(sorted(doc['sequence_num'] for doc in flush.pages), [1, 2, 3, 4, 5])
+        self.assertEqual(flush.counters, {'pages_created': 5})
+        # Parallel browsers must not kill each other as orphans
+        self.assertEqual([kwargs['kill_orphans'] for kwargs in self.acquired], [False, False])
+
+    @mock.patch.object(driver_pool, 'MAX_BROWSERS', 1)
+    def test_concurrency_is_capped_at_max_browsers(self):
+        self.generators = [RunnerStubGenerator(test_urls(3))]
+        results, _ = self.create(NAMES, concurrency=4)
+        self.assertEqual(results['success'], 3)
+        self.assertEqual(len(self.acquired), 1)
+        self.assertTrue(self.acquired[0]['kill_orphans'])
+
+    @mock.patch.object(driver_pool, 'MAX_BROWSERS', 2)
+    def test_login_error_is_reported(self):
+        generator = RunnerStubGenerator([])
+        generator.test_mode = False
+        self.generators = [generator]
+        results, flush = self.create(NAMES[:1], concurrency=2)
+        self.assertEqual(results['processed'], 0)
+        self.assertEqual(results['error'], 'No creator profiles configured')
+
+    def test_backoff_window_is_shared(self):
+        backoff = page_runner.SharedBackoff()
+        throttled, other = RunnerStubGenerator([]), RunnerStubGenerator([])
+        throttled._next_allowed_ts = 100.0
+        backoff.sync(throttled)
+        backoff.sync(other)
+        self.assertEqual(other._next_allowed_ts, 100.0)
+
+
+class ShareToProfilesTests(PooledStubTestCase):
+    @mock.patch.object(driver_pool, 'MAX_BROWSERS', 2)
+    def test_results_keep_profile_order(self):
+        self.generators = [RunnerStubGenerator([]) for _ in range(3)]
+        profiles = [(f'https://facebook.com/person{i}', f'Person {i}') for i in range(3)]
+        results = share_page_to_profiles('123', profiles, concurrency=4)
+
+        self.assertEqual([result.invitee_email for result in results], [url for url, _ in profiles])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(len(self.acquired), 3)
+
+    def test_failed_share_is_reported(self):
+        self.generators = [RunnerStubGenerator([]), RunnerStubGenerator([])]
+        error = RuntimeError('browser died')
+        results = share_page_to_profiles('123', [(error, ''), ('https://facebook.com/ok', '')])
+
+        self.assertFalse(results[0].success)
+        self.assertEqual(results[0].error, 'browser died')
+        self.assertTrue(results[1].success)
+
+
+def shard_result(success, failed, error=None):
+    result = {'processed': success + failed, 'success': success, 'failed': failed,
+              'pages': [], 'metrics': {'pages_created': success, 'errors': failed}}
+    if error:
+        result['error'] = error
+    return result
+
+
+class ChordFinalizationTests(SimpleTestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.object(tasks, 'finalize_task_counters'),
+            mock.patch.object(tasks, 'finish_task'),
+            mock.patch.object(tasks, 'clear_cancel'),
+        ]
+        self.counters, self.finish, self.clear = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def test_finalize_merges_shards(self):
+        results = tasks.finalize_pages_task([shard_result(3, 1), shard_result(2, 0)], 'task-1', 0.0)
+        self.assertEqual((results['processed'], results['success'], results['failed']), (6, 5, 1))
+        self.assertEqual(results['metrics']['pages_created'], 5)
+        self.counters.assert_called_once_with('task-1', pages_created=5, pages_failed=1)
+        self.finish.assert_called_once_with('task-1', 'completed', error_message=None)
+        self.clear.assert_called_once_with('task-1')
+
+    def test_finalize_without_successes_fails_task(self):
+        tasks.finalize_pages_task([shard_result(0, 2), shard_result(0, 0, error='login failed')],
+                                  'task-1', 0.0)
+        self.finish.assert_called_once_with('task-1', 'failed', error_message='login failed')
+
+    def test_errback_fails_task(self):
+        tasks.fail_pages_task(mock.Mock(), ChordError('worker lost'), None, 'task-1')
+        self.finish.assert_called_once_with('task-1', 'failed', error_message='Page shards failed: worker lost')
+        self.clear.assert_called_once_with('task-1')
+
+    def test_lost_shard_runs_errback(self):
+        callback = tasks.finalize_pages_task.s('task-1', 0.0).on_error(tasks.fail_pages_task.s('task-1'))
+        backend = tasks.finalize_pages_task.backend
+        with mock.patch.object(type(backend), 'fail_from_current_stack'):
+            backend.chord_error_from_stack(callback, ChordError('Dependency raised WorkerLostError'))
+        self.assertEqual(self.finish.call_args.args, ('task-1', 'failed'))
+        self.clear.assert_called_once_with('task-1')
+
+    @override_settings(SELENIUM_WORKERS=2)
+    def test_dispatch_links_errback_to_callback(self):
+        task = {'_id': 'task-1', 'num_pages': 4, 'base_page_name': 'Test'}
+        with mock.patch.object(tasks, 'get_task', return_value=task), \
+                mock.patch.object(tasks, 'claim_task', return_value=task), \
+                mock.patch.object(tasks, 'chord') as chord:
+            result = tasks.create_pages_task.apply(args=('task-1',)).get()
+
+        self.assertEqual(result, {'task_id': 'task-1', 'shards': 2})
+        callback = chord.return_value.call_args.args[0]
+        self.assertEqual(callback.task, tasks.finalize_pages_task.name)
+        self.assertEqual([errback.task for errback in callback.options['link_error']],
+                         [tasks.fail_pages_task.name])
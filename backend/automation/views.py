@@ -2,8 +2,6 @@ from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from .tasks import run_efficiency_test
-
 
 @api_view(['POST'])
 def benchmark(request):
@@ -30,6 +28,8 @@ def benchmark(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    from .tasks import run_efficiency_test
+
     try:
         results = run_efficiency_test(
             base_name=base_name,
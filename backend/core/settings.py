@@ -3,6 +3,7 @@ Django settings for core project.
 """
 
 from pathlib import Path
+import logging
 import os
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -119,6 +120,11 @@ CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes max per task
 # ===========================================
 MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
 MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'facebook_pages')
+# One client per process; size the pool for concurrent requests + task threads
+MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', '200'))
+MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', '10'))
+# Wire compression, in order of preference (zstd needs the zstandard package)
+MONGO_COMPRESSORS = os.getenv('MONGO_COMPRESSORS', 'zstd,zlib')
 
 # ===========================================
 # Selenium Configuration
@@ -128,6 +134,52 @@ SELENIUM_HEADLESS = os.getenv('SELENIUM_HEADLESS', 'False') == 'True'
 SELENIUM_TIMEOUT = int(os.getenv('SELENIUM_TIMEOUT', '30'))
 CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', None)  # None = auto-detect
 SELENIUM_TEST_MODE = os.getenv('SELENIUM_TEST_MODE', 'False') == 'True'
+# Run started tasks on a Celery worker (MongoDB storage only) instead of a
+# thread in the web process
+PAGES_USE_CELERY = os.getenv('PAGES_USE_CELERY', 'False') == 'True'
+# Parallel browser sessions per page creation task: Celery shard tasks, or
+# threads of the in-process run (capped there by SELENIUM_MAX_BROWSERS)
+SELENIUM_WORKERS = int(os.getenv('SELENIUM_WORKERS', '1'))
+# Chrome processes per process: automation.driver_pool's warm generators, shared
+# by page-creation runs and invite/health/benchmark calls
+SELENIUM_MAX_BROWSERS = int(os.getenv('SELENIUM_MAX_BROWSERS', '2'))
+
+# Step-by-step automation traces are logged at DEBUG; set AUTOMATION_LOG_LEVEL=DEBUG
+# to see them. Records are buffered and written in one batch once an INFO or
+# higher record arrives (e.g. the end-of-invite summary) or the buffer fills.
+AUTOMATION_LOG_LEVEL = os.getenv('AUTOMATION_LOG_LEVEL', 'INFO')
+
+# Task-run progress from pages.views (rotation, retries, failures). Quiet by
+# default in production; per-page lines are DEBUG.
+PAGES_LOG_LEVEL = os.getenv('PAGES_LOG_LEVEL', 'INFO' if DEBUG else 'WARNING')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+        'automation_buffer': {
+            'class': 'logging.handlers.MemoryHandler',
+            'capacity': 200,
+            'flushLevel': logging.INFO,
+            'target': 'console',
+        },
+    },
+    'loggers': {
+        'automation': {
+            'handlers': ['automation_buffer'],
+            'level': AUTOMATION_LOG_LEVEL,
+            'propagate': False,
+        },
+        'pages': {
+            'handlers': ['console'],
+            'level': PAGES_LOG_LEVEL,
+            'propagate': False,
+        },
+    },
+}
 
 # ===========================================
 # Hardcoded Creator Profile (Logged-in Profile)
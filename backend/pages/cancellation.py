@@ -0,0 +1,90 @@
+"""
+Cancellation flags for running page generation tasks.
+
+task_cancel sets the flag; the page loops check it once per iteration
+instead of re-reading the task document from storage. Runs in the web
+process (run_task_sync) register an in-memory Event for their lifetime;
+Celery workers live in another process and check a short-lived Redis key
+on the result backend.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+CANCEL_EVENTS: dict[str, threading.Event] = {}
+_lock = threading.Lock()
+
+# Seconds a Redis cancel key outlives the cancel request
+CANCEL_KEY_TTL = 3600
+
+
+def register(task_id: str):
+    """
+    Give a task run in this process its in-memory flag; call before the
+    run starts and clear_cancel once it has finished
+    """
+    with _lock:
+        CANCEL_EVENTS.setdefault(task_id, threading.Event())
+
+
+def _cancel_key(task_id: str) -> str:
+    return f"cancel:{task_id}"
+
+
+def _redis_client():
+    """Redis client of the Celery result backend, or None if there is none"""
+    try:
+        from celery import current_app
+        return current_app.backend.client
+    except Exception:
+        return None
+
+
+def request_cancel(task_id: str):
+    """
+    Flag a task as cancelled, here and for any Celery worker running it.
+
+    Only tasks registered in this process get an in-memory flag, so
+    cancelling a Celery task leaves nothing behind in CANCEL_EVENTS.
+
+    Celery tasks are not revoked: create_pages_task returns as soon as it
+    has dispatched its shards, and the shards poll the Redis flag. A task
+    still queued is skipped by claim_task, which refuses cancelled tasks.
+    """
+    event = CANCEL_EVENTS.get(task_id)
+    if event is not None:
+        event.set()
+
+    client = _redis_client()
+    if client is not None:
+        try:
+            client.setex(_cancel_key(task_id), CANCEL_KEY_TTL, '1')
+        except Exception as e:
+            logger.warning(f"Could not set Redis cancel flag for {task_id}: {e}")
+
+
+def is_cancelled(task_id: str, remote: bool = False) -> bool:
+    """
+    True once request_cancel has been called for the task.
+
+    Pass remote=True from Celery workers to also check the Redis flag.
+    """
+    event = CANCEL_EVENTS.get(task_id)
+    if event is not None and event.is_set():
+        return True
+    if remote:
+        client = _redis_client()
+        if client is not None:
+            try:
+                return bool(client.exists(_cancel_key(task_id)))
+            except Exception as e:
+                logger.warning(f"Could not read Redis cancel flag for {task_id}: {e}")
+    return False
+
+
+def clear_cancel(task_id: str):
+    """Drop the task's in-memory flag once its loop has finished"""
+    with _lock:
+        CANCEL_EVENTS.pop(task_id, None)
@@ -2,50 +2,82 @@
 MongoDB connection and operations for Facebook Pages storage.
 """
 
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.errors import ConnectionFailure
+from pymongo import MongoClient, ASCENDING, DESCENDING, ReturnDocument, InsertOne, UpdateOne
+from pymongo.errors import InvalidOperation
 from django.conf import settings
 from datetime import datetime
 from bson import ObjectId
+import importlib.util
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+STORAGE_TYPE = "mongodb"
+
 # MongoDB client singleton
 _client = None
 _db = None
 _indexes_created = False
+_index_thread = None
+# Whether MongoClient.bulk_write works here (None until first tried)
+_client_bulk_write = None
 
 
 def get_db():
     """Get MongoDB database connection"""
-    global _client, _db
+    global _client, _db, _index_thread
 
     if _db is None:
         try:
-            # Short timeout (3 sec) so it fails fast if MongoDB not available
+            # Short timeout (3 sec) so it fails fast if MongoDB not available.
+            # The client is created on first use rather than at import so it
+            # is never inherited across a Celery/gunicorn fork.
             _client = MongoClient(
                 settings.MONGO_URI,
                 serverSelectionTimeoutMS=3000,  # 3 second timeout
-                connectTimeoutMS=3000
+                connectTimeoutMS=3000,
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                retryWrites=True,
+                w=1,
+                compressors=_compressors(),
             )
             # Test connection
             _client.admin.command('ping')
             _db = _client[settings.MONGO_DB_NAME]
             logger.info(f"Connected to MongoDB: {settings.MONGO_DB_NAME}")
-            # Create indexes after connection
-            ensure_indexes()
+            # Create indexes after connection, off the request path: on a
+            # large collection the first create_index call can take a while
+            _index_thread = threading.Thread(target=ensure_indexes, name='mongo-ensure-indexes', daemon=True)
+            _index_thread.start()
         except Exception as e:
             logger.error(f"MongoDB connection failed: {e}")
+            # Don't leak the client's monitor threads; the next call retries
+            if _client is not None:
+                _client.close()
+                _client = None
             raise
 
     return _db
 
 
+def _compressors() -> str:
+    """MONGO_COMPRESSORS without zstd when the zstandard module isn't installed"""
+    names = [c.strip() for c in settings.MONGO_COMPRESSORS.split(',') if c.strip()]
+    if importlib.util.find_spec('zstandard') is None:
+        names = [c for c in names if c != 'zstd']
+    return ','.join(names)
+
+
 def ensure_indexes():
     """
     Create indexes for commonly queried fields.
     This improves query performance significantly.
+
+    create_index is a no-op for an index that already exists, so this is
+    safe to run on every start. page_id is indexed but not unique: older
+    runs may have stored the same page twice.
     """
     global _indexes_created
     if _indexes_created:
@@ -156,36 +188,25 @@ def create_task(profile_id: str, num_pages: int, page_name: str, public_profile_
     return str(result.inserted_id)
 
 
-def update_task_status(task_id: str, status: str, celery_task_id: str = None,
-                       error_message: str = None):
-    """Update task status"""
+def bulk_increment_task_counters(task_id: str, **counters):
+    """Apply several counter increments in one update, e.g. pages_created=1, shares_sent=1"""
+    if not counters:
+        return
     tasks = get_tasks_collection()
-
-    update_doc = {"status": status}
-
-    if celery_task_id:
-        update_doc["celery_task_id"] = celery_task_id
-
-    if status == "running":
-        update_doc["started_at"] = datetime.utcnow()
-    elif status in ["completed", "failed", "cancelled"]:
-        update_doc["completed_at"] = datetime.utcnow()
-
-    if error_message:
-        update_doc["error_message"] = error_message
-
     tasks.update_one(
         {"_id": ObjectId(task_id)},
-        {"$set": update_doc}
+        {"$inc": counters}
     )
 
 
-def increment_task_counter(task_id: str, field: str):
-    """Increment pages_created or pages_failed counter"""
+def finalize_task_counters(task_id: str, **counters):
+    """Overwrite task counters with final tallies, e.g. pages_created=8, pages_failed=2"""
+    if not counters:
+        return
     tasks = get_tasks_collection()
     tasks.update_one(
         {"_id": ObjectId(task_id)},
-        {"$inc": {field: 1}}
+        {"$set": counters}
     )
 
 
@@ -198,6 +219,90 @@ def get_task(task_id: str) -> dict:
     return task
 
 
+def get_task_fields(task_id: str, *fields) -> dict:
+    """Get only the given fields of a task (None if it doesn't exist)"""
+    tasks = get_tasks_collection()
+    projection = {field: 1 for field in fields}
+    projection["_id"] = 0
+    return tasks.find_one({"_id": ObjectId(task_id)}, projection)
+
+
+def get_task_status(task_id: str) -> str:
+    """Get a task's status (None if it doesn't exist)"""
+    task = get_task_fields(task_id, "status")
+    return task.get("status") if task else None
+
+
+def watch_task(task_id: str, max_await_ms: int = 15000):
+    """
+    Yield the task document now and again each time it changes, or None
+    after max_await_ms without a change; stops when the task is deleted.
+
+    Uses a change stream, so MongoDB must run as a replica set; otherwise
+    OperationFailure is raised before anything is yielded.
+    """
+    tasks = get_tasks_collection()
+    oid = ObjectId(task_id)
+    pipeline = [{"$match": {"documentKey._id": oid}}]
+    # Open the stream before reading the current document so no change is missed
+    with tasks.watch(pipeline, full_document="updateLookup", max_await_time_ms=max_await_ms) as stream:
+        task = tasks.find_one({"_id": oid})
+        while task is not None:
+            task["_id"] = str(task["_id"])
+            yield task
+            task = None
+            while task is None:
+                change = stream.try_next()
+                if change is None:
+                    yield None
+                elif change["operationType"] == "delete":
+                    return
+                else:
+                    task = change.get("fullDocument")
+
+
+def _transition_task(task_id: str, from_statuses: list, update_doc: dict) -> dict:
+    """Set fields on a task only if its status is one of from_statuses; the updated task, or None"""
+    tasks = get_tasks_collection()
+    task = tasks.find_one_and_update(
+        {"_id": ObjectId(task_id), "status": {"$in": from_statuses}},
+        {"$set": update_doc},
+        return_document=ReturnDocument.AFTER
+    )
+    if task:
+        task["_id"] = str(task["_id"])
+    return task
+
+
+def start_task_atomic(task_id: str) -> dict:
+    """Mark a pending task running in one round trip (None if it isn't pending)"""
+    return _transition_task(task_id, ["pending"], {"status": "running", "started_at": datetime.utcnow()})
+
+
+def cancel_task_atomic(task_id: str) -> dict:
+    """Mark a pending or running task cancelled in one round trip (None if it is neither)"""
+    return _transition_task(task_id, ["pending", "running"],
+                            {"status": "cancelled", "completed_at": datetime.utcnow()})
+
+
+def claim_task(task_id: str, celery_task_id: str) -> dict:
+    """Record the worker's Celery task ID unless the task was cancelled first (None then)"""
+    return _transition_task(task_id, ["pending", "running"],
+                            {"status": "running", "celery_task_id": celery_task_id})
+
+
+def finish_task(task_id: str, status: str, error_message: str = None) -> dict:
+    """
+    Move a running task to a terminal status ("completed" or "failed").
+
+    None if it is no longer running; a cancel is never overwritten.
+    """
+    update_doc = {"status": status, "completed_at": datetime.utcnow()}
+    if error_message:
+        update_doc["error_message"] = error_message
+    return _transition_task(task_id, ["running"], update_doc)
+
+
 def get_all_tasks(limit: int = 50) -> list:
     """Get all tasks, newest first"""
     tasks = get_tasks_collection()
@@ -244,24 +349,40 @@ def delete_task(task_id: str) -> bool:
 # Page Operations
 # ===========================================
 
-def store_page_details(task_id: str, page_id: str, page_name: str, page_url: str,
-                       sequence_num: int, gender: str = None) -> str:
-    """Store created page details in MongoDB"""
-    pages = get_pages_collection()
+def accepts_page_url(page_url: str) -> bool:
+    """Whether a created page with this URL is stored: MongoDB keeps every page the generator reports"""
+    return True
+
+
+def bulk_store_pages(docs: list) -> int:
+    """
+    Store several created pages in one round trip.
+
+    Each item has task_id, page_id, page_name, page_url, sequence_num and
+    optionally gender and assigned_bm.
+    """
+    if not docs:
+        return 0
+    now = datetime.utcnow()
+    page_docs = [_page_doc(doc, now) for doc in docs]
+    result = get_pages_collection().insert_many(page_docs, ordered=False)
+    return len(result.inserted_ids)
 
+
+def _page_doc(doc: dict, now: datetime) -> dict:
     page_doc = {
-        "task_id": task_id,
-        "page_id": page_id,
-        "page_name": page_name,
-        "page_url": page_url,
-        "sequence_num": sequence_num,
-        "gender": gender or "unknown",
+        "task_id": doc["task_id"],
+        "page_id": doc["page_id"],
+        "page_name": doc["page_name"],
+        "page_url": doc["page_url"],
+        "sequence_num": doc["sequence_num"],
+        "gender": doc.get("gender") or "unknown",
         "status": "created",
-        "creation_time": datetime.utcnow(),
+        "creation_time": now,
     }
-
-    result = pages.insert_one(page_doc)
-    return str(result.inserted_id)
+    if doc.get("assigned_bm"):
+        page_doc["assigned_bm"] = doc["assigned_bm"]
+    return page_doc
 
 
 def get_pages_by_task(task_id: str) -> list:
@@ -275,6 +396,38 @@ def get_pages_by_task(task_id: str) -> list:
     return result
 
 
+def get_task_with_pages(task_id: str) -> dict:
+    """
+    Get a task with its pages (ordered by sequence_num) and progress
+    percentage in one aggregation (None if the task doesn't exist).
+    """
+    tasks = get_tasks_collection()
+    done = {"$add": [{"$ifNull": ["$pages_created", 0]}, {"$ifNull": ["$pages_failed", 0]}]}
+    cursor = tasks.aggregate([
+        {"$match": {"_id": ObjectId(task_id)}},
+        # Pages store task_id as the string form of the task's ObjectId
+        {"$lookup": {
+            "from": "pages",
+            "let": {"task_id": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$task_id", "$$task_id"]}}},
+                {"$sort": {"sequence_num": 1}},
+                {"$addFields": {"_id": {"$toString": "$_id"}}},
+            ],
+            "as": "pages",
+        }},
+        {"$addFields": {
+            "_id": {"$toString": "$_id"},
+            "progress": {"$cond": [
+                {"$gt": ["$num_pages", 0]},
+                {"$round": [{"$multiply": [{"$divide": [done, "$num_pages"]}, 100]}, 1]},
+                0,
+            ]},
+        }},
+    ])
+    return next(cursor, None)
+
+
 def get_all_pages(limit: int = 100) -> list:
     """Get all pages, newest first"""
     pages = get_pages_collection()
@@ -395,6 +548,72 @@ def store_invite(page_id: str, page_name: str, invitee_email: str,
     return str(result.inserted_id)
 
 
+def bulk_store_invites(docs: list) -> int:
+    """
+    Store several page invites in one round trip.
+
+    Each item takes the same fields as store_invite.
+    """
+    if not docs:
+        return 0
+    now = datetime.utcnow()
+    invite_docs = [_invite_doc(doc, now) for doc in docs]
+    result = get_invites_collection().insert_many(invite_docs, ordered=False)
+    return len(result.inserted_ids)
+
+
+def _invite_doc(doc: dict, now: datetime) -> dict:
+    return {
+        "page_id": doc["page_id"],
+        "page_name": doc["page_name"],
+        "invitee_email": doc["invitee_email"],
+        "invite_link": doc["invite_link"],
+        "role": doc["role"],
+        "invited_by": doc.get("invited_by") or "",
+        "status": "pending",
+        "created_at": now,
+        "accepted_at": None,
+    }
+
+
+def flush_task_writes(task_id: str, pages: list = (), invites: list = (), counters: dict = None):
+    """
+    Store buffered pages and invites of a task and apply its counter
+    increments together.
+
+    Sent as one MongoClient.bulk_write across the three collections when
+    the driver and server support it (PyMongo 4.9+, MongoDB 8.0+),
+    otherwise as one write per collection.
+    """
+    global _client_bulk_write
+    counters = {field: amount for field, amount in (counters or {}).items() if amount}
+    if not (pages or invites or counters):
+        return
+
+    db = get_db()
+    if _client_bulk_write is None:
+        _client_bulk_write = hasattr(_client, "bulk_write")
+
+    if _client_bulk_write:
+        now = datetime.utcnow()
+        ops = [InsertOne(_page_doc(doc, now), namespace=f"{db.name}.pages") for doc in pages]
+        ops += [InsertOne(_invite_doc(doc, now), namespace=f"{db.name}.invites") for doc in invites]
+        if counters:
+            ops.append(UpdateOne({"_id": ObjectId(task_id)}, {"$inc": counters},
+                                 namespace=f"{db.name}.tasks"))
+        try:
+            _client.bulk_write(ops, ordered=False)
+            return
+        except InvalidOperation as e:
+            # Raised before anything is sent when the server is older than 8.0
+            logger.info(f"MongoClient.bulk_write unavailable, writing per collection: {e}")
+            _client_bulk_write = False
+
+    bulk_store_pages(list(pages))
+    bulk_store_invites(list(invites))
+    bulk_increment_task_counters(task_id, **counters)
+
+
 def get_invites_by_page(page_id: str) -> list:
     """Get all invites for a page"""
     invites = get_invites_collection()
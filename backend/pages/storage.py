@@ -10,6 +10,10 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 import threading
 
+from .validators import is_valid_page_url
+
+STORAGE_TYPE = "json_file"
+
 # IST Timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
 
@@ -109,28 +113,13 @@ def create_task(profile_id: str, num_pages: int, page_name: str, public_profile_
         return task_id
 
 
-def update_task_status(task_id: str, status: str, celery_task_id: str = None,
-                       error_message: str = None):
-    """Update task status"""
-    with _lock:
-        if task_id in _tasks:
-            _tasks[task_id]["status"] = status
-            if celery_task_id:
-                _tasks[task_id]["celery_task_id"] = celery_task_id
-            if status == "running":
-                _tasks[task_id]["started_at"] = get_ist_now()
-            elif status in ["completed", "failed", "cancelled"]:
-                _tasks[task_id]["completed_at"] = get_ist_now()
-            if error_message:
-                _tasks[task_id]["error_message"] = error_message
-            _save_data()
-
-
-def increment_task_counter(task_id: str, field: str):
-    """Increment pages_created or pages_failed counter"""
+def finalize_task_counters(task_id: str, **counters):
+    """Overwrite task counters with final tallies, e.g. pages_created=8, pages_failed=2"""
+    if not counters:
+        return
     with _lock:
         if task_id in _tasks:
-            _tasks[task_id][field] = _tasks[task_id].get(field, 0) + 1
+            _tasks[task_id].update(counters)
             _save_data()
 
 
@@ -143,6 +132,61 @@ def get_task(task_id: str) -> Optional[dict]:
         return None
 
 
+def get_task_fields(task_id: str, *fields) -> Optional[dict]:
+    """Get only the given fields of a task (None if it doesn't exist)"""
+    with _lock:
+        task = _tasks.get(task_id)
+        if task:
+            return {field: task[field] for field in fields if field in task}
+        return None
+
+
+def get_task_status(task_id: str) -> Optional[str]:
+    """Get a task's status (None if it doesn't exist)"""
+    task = get_task_fields(task_id, "status")
+    return task.get("status") if task else None
+
+
+def _transition_task(task_id: str, from_statuses: list, update_doc: dict) -> Optional[dict]:
+    """Set fields on a task only if its status is one of from_statuses; the updated task, or None"""
+    with _lock:
+        task = _tasks.get(task_id)
+        if not task or task.get("status") not in from_statuses:
+            return None
+        task.update(update_doc)
+        _save_data()
+        return dict(task)
+
+
+def start_task_atomic(task_id: str) -> Optional[dict]:
+    """Mark a pending task running (None if it isn't pending)"""
+    return _transition_task(task_id, ["pending"], {"status": "running", "started_at": get_ist_now()})
+
+
+def cancel_task_atomic(task_id: str) -> Optional[dict]:
+    """Mark a pending or running task cancelled (None if it is neither)"""
+    return _transition_task(task_id, ["pending", "running"],
+                            {"status": "cancelled", "completed_at": get_ist_now()})
+
+
+def claim_task(task_id: str, celery_task_id: str) -> Optional[dict]:
+    """Record the worker's Celery task ID unless the task was cancelled first (None then)"""
+    return _transition_task(task_id, ["pending", "running"],
+                            {"status": "running", "celery_task_id": celery_task_id})
+
+
+def finish_task(task_id: str, status: str, error_message: str = None) -> Optional[dict]:
+    """
+    Move a running task to a terminal status ("completed" or "failed").
+
+    None if it is no longer running; a cancel is never overwritten.
+    """
+    update_doc = {"status": status, "completed_at": get_ist_now()}
+    if error_message:
+        update_doc["error_message"] = error_message
+    return _transition_task(task_id, ["running"], update_doc)
+
+
 def get_all_tasks(limit: int = 50) -> List[dict]:
     """Get all tasks, newest first"""
     with _lock:
@@ -179,85 +223,27 @@ def delete_task(task_id: str) -> bool:
 # Page Operations
 # ===========================================
 
-def is_valid_page_url(page_url: str) -> bool:
-    """
-    Validate that the URL is a valid Facebook page URL.
-    Valid formats:
-    - https://www.facebook.com/profile.php?id=XXXXXXXXXX (numeric ID)
-    - https://www.facebook.com/PAGENAME (page username)
-
-    Invalid URLs (should NOT be stored):
-    - https://www.facebook.com/help/...
-    - https://www.facebook.com/ (homepage)
-    - https://www.facebook.com/latest/home...
-    - https://www.facebook.com/pages/creation/...
-    """
-    if not page_url or not isinstance(page_url, str):
-        return False
-
-    # Must be a Facebook URL
-    if "facebook.com" not in page_url:
-        return False
-
-    # Invalid patterns - these are NOT page URLs
-    invalid_patterns = [
-        "/help/",
-        "/latest/",
-        "/pages/creation",
-        "/pages/create",
-        "facebook.com/$",  # Just homepage
-    ]
-
-    for pattern in invalid_patterns:
-        if pattern in page_url:
-            return False
-
-    # Check for homepage (just facebook.com with nothing after)
-    if page_url.rstrip('/') in ["https://www.facebook.com", "https://facebook.com",
-                                 "http://www.facebook.com", "http://facebook.com"]:
-        return False
-
-    # Valid pattern 1: profile.php?id=NUMERIC_ID
-    if "profile.php?id=" in page_url:
-        # Extract the ID and verify it's numeric
-        import re
-        match = re.search(r'profile\.php\?id=(\d+)', page_url)
-        if match and len(match.group(1)) >= 8:  # FB IDs are typically 14+ digits
-            return True
-
-    # Valid pattern 2: facebook.com/PAGENAME (but not system pages)
-    # This would be for pages with custom usernames
-
-    return False
-
-
-def store_page_details(task_id: str, page_id: str, page_name: str, page_url: str,
-                       sequence_num: int, gender: str = None) -> str:
-    """Store created page details with URL validation"""
-
-    # Validate URL before storing
-    if not is_valid_page_url(page_url):
-        print(f">>> STORAGE WARNING: Invalid page URL '{page_url}' - NOT storing page '{page_name}'")
-        print(f">>> Valid URLs should be: facebook.com/profile.php?id=XXXXXXXXXX")
-        return None
-
-    with _lock:
-        doc_id = _generate_id()
-        _pages[doc_id] = {
-            "_id": doc_id,
-            "task_id": task_id,
-            "page_id": page_id,
-            "page_name": page_name,
-            "page_url": page_url,
-            "sequence_num": sequence_num,
-            "gender": gender or "unknown",
-            "status": "created",
-            "creation_time": get_ist_now(),
-        }
-        _save_data()
-        print(f">>> STORAGE: ✓ Saved page '{page_name}' (ID: {page_id}) to database")
-        print(f">>> STORAGE: URL: {page_url}")
-        return doc_id
+def accepts_page_url(page_url: str) -> bool:
+    """Whether a created page with this URL is stored (see is_valid_page_url)"""
+    return is_valid_page_url(page_url)
+
+
+def _add_page(doc: dict, now: str):
+    """Add a page record (caller holds _lock and saves)"""
+    doc_id = _generate_id()
+    _pages[doc_id] = {
+        "_id": doc_id,
+        "task_id": doc["task_id"],
+        "page_id": doc["page_id"],
+        "page_name": doc["page_name"],
+        "page_url": doc["page_url"],
+        "sequence_num": doc["sequence_num"],
+        "gender": doc.get("gender") or "unknown",
+        "status": "created",
+        "creation_time": now,
+    }
+    if doc.get("assigned_bm"):
+        _pages[doc_id]["assigned_bm"] = doc["assigned_bm"]
 
 
 def get_pages_by_task(task_id: str) -> List[dict]:
@@ -268,6 +254,18 @@ def get_pages_by_task(task_id: str) -> List[dict]:
         return pages
 
 
+def get_task_with_pages(task_id: str) -> Optional[dict]:
+    """Get a task with its pages (ordered by sequence_num) and progress percentage"""
+    task = get_task(task_id)
+    if not task:
+        return None
+    task["pages"] = get_pages_by_task(task_id)
+    total = task["num_pages"]
+    done = task.get("pages_created", 0) + task.get("pages_failed", 0)
+    task["progress"] = round((done / total) * 100, 1) if total > 0 else 0
+    return task
+
+
 def get_all_pages(limit: int = 100) -> List[dict]:
     """Get all pages, newest first"""
     with _lock:
@@ -378,6 +376,45 @@ def store_invite(page_id: str, page_name: str, invitee_email: str,
         return invite_id
 
 
+def _add_invite(doc: dict, now: str):
+    """Add an invite record (caller holds _lock and saves)"""
+    invite_id = _generate_id()
+    _invites[invite_id] = {
+        "_id": invite_id,
+        "page_id": doc["page_id"],
+        "page_name": doc["page_name"],
+        "invitee_email": doc["invitee_email"],
+        "invite_link": doc["invite_link"],
+        "role": doc["role"],
+        "invited_by": doc.get("invited_by") or "",
+        "status": "pending",  # pending, accepted, declined, expired
+        "created_at": now,
+        "accepted_at": None,
+    }
+
+
+def flush_task_writes(task_id: str, pages: list = (), invites: list = (), counters: dict = None):
+    """
+    Store buffered pages and invites of a task and apply its counter
+    increments with a single save; pages with an invalid URL are skipped.
+    """
+    valid = [doc for doc in pages if accepts_page_url(doc["page_url"])]
+    counters = {field: amount for field, amount in (counters or {}).items() if amount}
+    if not (valid or invites or counters):
+        return
+
+    with _lock:
+        now = get_ist_now()
+        for doc in valid:
+            _add_page(doc, now)
+        for doc in invites:
+            _add_invite(doc, now)
+        if counters and task_id in _tasks:
+            for field, amount in counters.items():
+                _tasks[task_id][field] = _tasks[task_id].get(field, 0) + amount
+        _save_data()
+
+
 def get_invites_by_page(page_id: str) -> List[dict]:
     """Get all invites for a page"""
     with _lock:
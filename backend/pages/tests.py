@@ -1,3 +1,247 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from pymongo.errors import InvalidOperation
+
+from . import cancellation, mongodb, storage, views
+from .validators import is_valid_page_url
+
+
+@mock.patch.object(cancellation, '_redis_client', return_value=None)
+class CancellationTests(SimpleTestCase):
+    def tearDown(self):
+        cancellation.clear_cancel('task-1')
+
+    def test_registered_task_is_cancelled(self, _):
+        cancellation.register('task-1')
+        self.assertFalse(cancellation.is_cancelled('task-1'))
+        cancellation.request_cancel('task-1')
+        self.assertTrue(cancellation.is_cancelled('task-1'))
+
+    def test_clear_cancel_drops_flag(self, _):
+        cancellation.register('task-1')
+        cancellation.request_cancel('task-1')
+        cancellation.clear_cancel('task-1')
+        self.assertFalse(cancellation.is_cancelled('task-1'))
+        self.assertNotIn('task-1', cancellation.CANCEL_EVENTS)
+
+    def test_unregistered_task_leaves_no_event(self, _):
+        # Tasks run by Celery workers are never registered in this process
+        cancellation.request_cancel('task-1')
+        self.assertNotIn('task-1', cancellation.CANCEL_EVENTS)
+
+    def test_register_keeps_existing_flag(self, _):
+        cancellation.register('task-1')
+        cancellation.request_cancel('task-1')
+        cancellation.register('task-1')
+        self.assertTrue(cancellation.is_cancelled('task-1'))
+
+    def test_remote_flag_is_read_from_redis(self, redis_client):
+        client = mock.Mock()
+        client.exists.return_value = 1
+        redis_client.return_value = client
+        self.assertFalse(cancellation.is_cancelled('task-1'))
+        self.assertTrue(cancellation.is_cancelled('task-1', remote=True))
+        client.exists.assert_called_once_with('cancel:task-1')
+
+
+class PageUrlValidationTests(SimpleTestCase):
+    def test_accepts_every_url_the_generator_reports(self):
+        for url in [
+            'https://www.facebook.com/profile.php?id=61584296746538',
+            'https://www.facebook.com/61584296746538',
+            'https://www.facebook.com/61584296746538/',
+            'https://facebook.com/test_0123456789ab',
+        ]:
+            self.assertTrue(is_valid_page_url(url), url)
+
+    def test_rejects_non_page_urls(self):
+        for url in [
+            '',
+            None,
+            'https://www.facebook.com/',
+            'https://www.facebook.com/help/123456789',
+            'https://www.facebook.com/pages/creation/?ref=1',
+            'https://www.facebook.com/latest/home',
+            'https://www.facebook.com/profile.php?id=123',
+            'https://example.com/61584296746538',
+        ]:
+            self.assertFalse(is_valid_page_url(url), url)
+
+
+class JsonStorageTestCase(SimpleTestCase):
+    """Runs storage functions against empty in-memory data that is never saved"""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(storage, '_tasks', {}),
+            mock.patch.object(storage, '_pages', {}),
+            mock.patch.object(storage, '_invites', {}),
+            mock.patch.object(storage, '_save_data'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.task_id = storage.create_task(None, 3, 'Test')
+
+
+class JsonStorageFlushTests(JsonStorageTestCase):
+    def page(self, sequence_num, page_url, **fields):
+        return dict(task_id=self.task_id, page_id=str(sequence_num), page_name=f'Test {sequence_num}',
+                    page_url=page_url, sequence_num=sequence_num, **fields)
+
+    def test_skips_invalid_urls_and_applies_counters(self):
+        storage.flush_task_writes(self.task_id, [
+            self.page(1, 'https://www.facebook.com/profile.php?id=61584296746538', assigned_bm='bm-1'),
+            self.page(2, 'https://www.facebook.com/help/123456789'),
+        ], counters={'pages_created': 1, 'pages_failed': 1, 'shares_sent': 0})
+
+        pages = storage.get_pages_by_task(self.task_id)
+        self.assertEqual([page['sequence_num'] for page in pages], [1])
+        self.assertEqual(pages[0]['assigned_bm'], 'bm-1')
+        task = storage.get_task(self.task_id)
+        self.assertEqual((task['pages_created'], task['pages_failed'], task['shares_sent']), (1, 1, 0))
+
+
+class MongoFlushTaskWritesTests(SimpleTestCase):
+    task_id = '0123456789abcdef01234567'
+    page = {'task_id': task_id, 'page_id': '61584296746538', 'page_name': 'Test - Jane',
+            'page_url': 'https://facebook.com/test_0123456789ab', 'sequence_num': 1}
+    invite = {'page_id': '61584296746538', 'page_name': 'Test - Jane',
+              'invitee_email': 'https://facebook.com/someone', 'invite_link': '', 'role': 'admin'}
+
+    def setUp(self):
+        self.client = mock.Mock()
+        db = mock.Mock()
+        db.name = 'pages_test'
+        patches = [
+            mock.patch.object(mongodb, '_client', self.client),
+            mock.patch.object(mongodb, '_db', db),
+            mock.patch.object(mongodb, '_client_bulk_write', None),
+            mock.patch.object(mongodb, 'bulk_store_pages'),
+            mock.patch.object(mongodb, 'bulk_store_invites'),
+            mock.patch.object(mongodb, 'bulk_increment_task_counters'),
+        ]
+        self.mocks = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def flush(self):
+        mongodb.flush_task_writes(self.task_id, [self.page], [self.invite],
+                                  {'pages_created': 1, 'shares_sent': 1, 'pages_failed': 0})
+
+    def assert_written_per_collection(self):
+        store_pages, store_invites, increment = self.mocks[3:]
+        store_pages.assert_called_once_with([self.page])
+        store_invites.assert_called_once_with([self.invite])
+        increment.assert_called_once_with(self.task_id, pages_created=1, shares_sent=1)
+
+    def test_one_client_bulk_write(self):
+        self.flush()
+        ops = self.client.bulk_write.call_args.args[0]
+        self.assertEqual(len(ops), 3)
+        self.assertFalse(self.mocks[3].called)
+
+    def test_falls_back_when_server_lacks_client_bulk_write(self):
+        self.client.bulk_write.side_effect = InvalidOperation('needs MongoDB 8.0')
+        self.flush()
+        self.assert_written_per_collection()
+        self.assertIs(mongodb._client_bulk_write, False)
+
+    def test_falls_back_when_driver_lacks_client_bulk_write(self):
+        del self.client.bulk_write
+        self.flush()
+        self.assert_written_per_collection()
+
+    def test_nothing_to_write(self):
+        mongodb.flush_task_writes(self.task_id, [], [], {'pages_created': 0})
+        self.assertFalse(self.client.bulk_write.called)
+
+
+class TaskTransitionTests(JsonStorageTestCase):
+    def status(self):
+        return storage.get_task_status(self.task_id)
+
+    def test_start_only_from_pending(self):
+        self.assertIsNotNone(storage.start_task_atomic(self.task_id))
+        self.assertEqual(self.status(), 'running')
+        # A second start is refused
+        self.assertIsNone(storage.start_task_atomic(self.task_id))
+
+    def test_claim_records_worker_task_id(self):
+        storage.start_task_atomic(self.task_id)
+        task = storage.claim_task(self.task_id, 'celery-1')
+        self.assertEqual((task['status'], task['celery_task_id']), ('running', 'celery-1'))
+
+    def test_claim_refused_after_cancel(self):
+        storage.cancel_task_atomic(self.task_id)
+        self.assertIsNone(storage.claim_task(self.task_id, 'celery-1'))
+        self.assertEqual(self.status(), 'cancelled')
+
+    def test_finish_running_task(self):
+        storage.start_task_atomic(self.task_id)
+        task = storage.finish_task(self.task_id, 'failed', error_message='login failed')
+        self.assertEqual((task['status'], task['error_message']), ('failed', 'login failed'))
+        self.assertIsNotNone(task['completed_at'])
+
+    def test_finish_never_overwrites_cancel(self):
+        storage.start_task_atomic(self.task_id)
+        storage.cancel_task_atomic(self.task_id)
+        self.assertIsNone(storage.finish_task(self.task_id, 'completed'))
+        self.assertEqual(self.status(), 'cancelled')
+
+    def test_cancel_only_pending_or_running(self):
+        storage.start_task_atomic(self.task_id)
+        storage.finish_task(self.task_id, 'completed')
+        self.assertIsNone(storage.cancel_task_atomic(self.task_id))
+        self.assertEqual(self.status(), 'completed')
+
+    def test_unknown_task(self):
+        self.assertIsNone(storage.start_task_atomic('missing'))
+        self.assertIsNone(storage.cancel_task_atomic('missing'))
+
+
+class MongoTaskTransitionTests(SimpleTestCase):
+    task_id = '0123456789abcdef01234567'
+
+    def setUp(self):
+        patch = mock.patch.object(mongodb, 'get_tasks_collection')
+        self.tasks = patch.start().return_value
+        self.addCleanup(patch.stop)
+
+    def status_filter(self):
+        return self.tasks.find_one_and_update.call_args.args[0]['status']
+
+    def test_finish_matches_running_only(self):
+        self.tasks.find_one_and_update.return_value = None
+        self.assertIsNone(mongodb.finish_task(self.task_id, 'completed'))
+        self.assertEqual(self.status_filter(), {'$in': ['running']})
+
+    def test_claim_matches_pending_or_running(self):
+        self.tasks.find_one_and_update.return_value = {'_id': mongodb.ObjectId(self.task_id), 'status': 'running'}
+        task = mongodb.claim_task(self.task_id, 'celery-1')
+        self.assertEqual(task['_id'], self.task_id)
+        self.assertEqual(self.status_filter(), {'$in': ['pending', 'running']})
+        update = self.tasks.find_one_and_update.call_args.args[1]['$set']
+        self.assertEqual(update, {'status': 'running', 'celery_task_id': 'celery-1'})
+
+
+@mock.patch.object(views, '_probe_celery', return_value=True)
+class CeleryAvailableTests(SimpleTestCase):
+    def setUp(self):
+        patch = mock.patch.object(views, '_celery_check', (0.0, None))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_probe_result_is_cached(self, probe):
+        self.assertTrue(views._celery_available())
+        self.assertTrue(views._celery_available())
+        probe.assert_called_once()
+
+    def test_probe_repeats_after_ttl(self, probe):
+        with mock.patch.object(views, '_CELERY_CHECK_TTL', 0):
+            views._celery_available()
+            probe.return_value = False
+            self.assertFalse(views._celery_available())
+        self.assertEqual(probe.call_count, 2)
@@ -7,11 +7,13 @@ urlpatterns = [
     path('tasks/<str:task_id>/', views.task_detail, name='task-detail'),
     path('tasks/<str:task_id>/start/', views.task_start, name='task-start'),
     path('tasks/<str:task_id>/cancel/', views.task_cancel, name='task-cancel'),
+    path('tasks/<str:task_id>/stream/', views.task_stream, name='task-stream'),
 
     # Pages
     path('pages/', views.pages_list, name='pages-list'),
     path('pages/<str:page_id>/invite/', views.invite_person, name='invite-person'),
     path('pages/<str:page_id>/invites/', views.page_invites, name='page-invites'),
+    path('pages/<str:page_id>/share/', views.share_page, name='share-page'),
 
     # Invites
     path('invites/', views.invites_list, name='invites-list'),
@@ -26,6 +28,7 @@ urlpatterns = [
 
     # Automation
     path('automation/benchmark/', views.benchmark, name='benchmark'),
+    path('automation/benchmark/<str:job_id>/', views.benchmark_status, name='benchmark-status'),
     path('automation/health/', views.health_check, name='health-check'),
     path('automation/test-invite/', views.test_invite_access, name='test-invite'),
 ]
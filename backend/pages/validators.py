@@ -0,0 +1,68 @@
+"""
+Validation helpers for the storage backends.
+"""
+
+import re
+
+
+def is_valid_page_url(page_url: str) -> bool:
+    """
+    Validate that the URL is a valid Facebook page URL.
+    Valid formats:
+    - https://www.facebook.com/profile.php?id=XXXXXXXXXX (numeric ID)
+    - https://www.facebook.com/XXXXXXXXXX (numeric ID)
+    - https://facebook.com/test_XXXXXXXXXXXX (test-mode page)
+    - https://www.facebook.com/PAGENAME (page username)
+
+    Invalid URLs (should NOT be stored):
+    - https://www.facebook.com/help/...
+    - https://www.facebook.com/ (homepage)
+    - https://www.facebook.com/latest/home...
+    - https://www.facebook.com/pages/creation/...
+    """
+    if not page_url or not isinstance(page_url, str):
+        return False
+
+    # Must be a Facebook URL
+    if "facebook.com" not in page_url:
+        return False
+
+    # Invalid patterns - these are NOT page URLs
+    invalid_patterns = [
+        "/help/",
+        "/latest/",
+        "/pages/creation",
+        "/pages/create",
+        "facebook.com/$",  # Just homepage
+    ]
+
+    for pattern in invalid_patterns:
+        if pattern in page_url:
+            return False
+
+    # Check for homepage (just facebook.com with nothing after)
+    if page_url.rstrip('/') in ["https://www.facebook.com", "https://facebook.com",
+                                 "http://www.facebook.com", "http://facebook.com"]:
+        return False
+
+    # Valid pattern 1: profile.php?id=NUMERIC_ID
+    if "profile.php?id=" in page_url:
+        # Extract the ID and verify it's numeric
+        match = re.search(r'profile\.php\?id=(\d+)', page_url)
+        if match and len(match.group(1)) >= 8:  # FB IDs are typically 14+ digits
+            return True
+
+    # Valid pattern 2: facebook.com/NUMERIC_ID, the other URL shape the
+    # generator accepts after page creation (see _FB_PAGE_URL_RE)
+    if re.search(r'facebook\.com/\d{8,}(?:[/?#]|$)', page_url):
+        return True
+
+    # Valid pattern 3: pages simulated by the generator in test mode
+    if re.search(r'facebook\.com/test_[0-9a-f]{12}$', page_url):
+        return True
+
+    # Valid pattern 4: facebook.com/PAGENAME (but not system pages)
+    # This would be for pages with custom usernames
+
+    return False
+
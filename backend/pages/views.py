@@ -6,308 +6,217 @@ Uses in-memory storage as fallback when MongoDB is not available.
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+import json
+import logging
 import threading
 import time
-import random
-
-# Try MongoDB first, fallback to in-memory storage
-try:
-    from .mongodb import (
-        create_task,
-        get_task,
-        get_all_tasks,
-        update_task_status,
-        delete_task,
-        get_pages_by_task,
-        get_all_pages,
-        store_profile,
-        get_profile,
-        get_all_profiles,
-        get_efficiency_report,
-        increment_task_counter,
-        store_page_details,
-        store_invite,
-        get_invites_by_page,
-        get_all_invites,
-        update_invite_status,
-        get_page_by_id,
-    )
-    from .mongodb import get_db
-    get_db().command('ping')
-    STORAGE_TYPE = "mongodb"
-except Exception:
-    from .storage import (
-        create_task,
-        get_task,
-        get_all_tasks,
-        update_task_status,
-        delete_task,
-        get_pages_by_task,
-        get_all_pages,
-        store_profile,
-        get_profile,
-        get_all_profiles,
-        get_efficiency_report,
-        increment_task_counter,
-        store_page_details,
-        store_invite,
-        get_invites_by_page,
-        get_all_invites,
-        update_invite_status,
-        get_page_by_id,
-    )
-    STORAGE_TYPE = "json_file"  # Data persists in pages/data.json
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from .cancellation import register, request_cancel, clear_cancel
+
+logger = logging.getLogger(__name__)
+
+# While on the JSON fallback, MongoDB is probed again after this many seconds
+STORAGE_RETRY_SECONDS = 30
+_storage_lock = threading.Lock()
+_storage_backend = None
+_storage_checked_at = 0.0
+
+
+def _storage():
+    """
+    Storage backend: MongoDB when it answers, otherwise the JSON file store
+    (data persists in pages/data.json).
+
+    Chosen on first use instead of at import, so a slow or missing MongoDB
+    doesn't delay every process start. A JSON fallback is only kept for
+    STORAGE_RETRY_SECONDS, so the process switches back to MongoDB (where
+    Celery workers write) once it comes up.
+    """
+    global _storage_backend, _storage_checked_at
+
+    backend = _storage_backend
+    if backend is not None and (backend.STORAGE_TYPE == "mongodb"
+                                or time.monotonic() - _storage_checked_at < STORAGE_RETRY_SECONDS):
+        return backend
+
+    with _storage_lock:
+        # Another request may have probed while we waited for the lock
+        if _storage_backend is backend:
+            try:
+                from . import mongodb
+                mongodb.get_db()
+                _storage_backend = mongodb
+            except Exception:
+                from . import storage
+                _storage_backend = storage
+            _storage_checked_at = time.monotonic()
+        return _storage_backend
+
 
-from automation.tasks import run_efficiency_test
-from automation.name_generator import get_page_name_for_sequence
+# Settings the handlers read on every call, resolved once at import
+SEL_HEADLESS = None  # None when SELENIUM_HEADLESS isn't set, see _headless
+SEL_TIMEOUT = 30
+SEL_TEST_MODE = False
+SEL_WORKERS = 1
+PAGES_PER_PROFILE = 3
+CREATOR_PROFILES = []
+CREATOR_EMAIL = ''
+CREATOR_PASSWORD = ''
+
+_CACHED_SETTINGS = {
+    'SELENIUM_HEADLESS', 'SELENIUM_TIMEOUT', 'SELENIUM_TEST_MODE', 'SELENIUM_WORKERS', 'PAGES_PER_PROFILE',
+    'CREATOR_PROFILES', 'CREATOR_PROFILE_EMAIL', 'CREATOR_PROFILE_PASSWORD',
+}
+
+
+def _load_settings():
+    global SEL_HEADLESS, SEL_TIMEOUT, SEL_TEST_MODE, SEL_WORKERS, PAGES_PER_PROFILE
+    global CREATOR_PROFILES, CREATOR_EMAIL, CREATOR_PASSWORD
+    SEL_HEADLESS = getattr(settings, 'SELENIUM_HEADLESS', None)
+    SEL_TIMEOUT = getattr(settings, 'SELENIUM_TIMEOUT', 30)
+    SEL_TEST_MODE = getattr(settings, 'SELENIUM_TEST_MODE', False)
+    SEL_WORKERS = getattr(settings, 'SELENIUM_WORKERS', 1)
+    PAGES_PER_PROFILE = getattr(settings, 'PAGES_PER_PROFILE', 3)
+    CREATOR_PROFILES = getattr(settings, 'CREATOR_PROFILES', [])
+    CREATOR_EMAIL = getattr(settings, 'CREATOR_PROFILE_EMAIL', '')
+    CREATOR_PASSWORD = getattr(settings, 'CREATOR_PROFILE_PASSWORD', '')
+
+
+_load_settings()
+
+# Longest a request waits for a pooled browser while page runs hold them all
+BROWSER_WAIT_SECONDS = 60
+
+
+def _headless(default: bool) -> bool:
+    """SELENIUM_HEADLESS, or the calling handler's own default when it isn't set"""
+    return default if SEL_HEADLESS is None else SEL_HEADLESS
+
+
+@receiver(setting_changed)
+def _reload_settings(setting, **kwargs):
+    """Pick up override_settings changes in tests"""
+    if setting in _CACHED_SETTINGS:
+        _load_settings()
+
+# Selenium-backed modules (automation.*) are imported inside the handlers
+# that use them, so loading the URLconf doesn't pull in selenium
 
 
 def run_task_sync(task_id: str):
     """
     Run page generation task synchronously in background thread.
 
-    MULTI-PROFILE ROTATION FLOW:
-    1. Login with first creator profile
-    2. Create pages (up to PAGES_PER_PROFILE limit, default 3-4)
-    3. After limit reached: logout → login with next profile
-    4. Continue creating remaining pages
-    5. Repeat until all pages created or all profiles exhausted
-
-    This ensures we don't hit rate limits by rotating between profiles.
+    The pages are created by SELENIUM_WORKERS threads with a pooled browser
+    each (automation.page_runner.create_pages_bulk); the page loop (profile
+    rotation, retry with the next profile, sharing, batched writes) is
+    page_runner.run_pages, which the Celery shards run too.
     """
-    from automation.selenium_driver import FacebookPageGenerator
-    from django.conf import settings
+    from automation.name_generator import get_page_names_for_sequence
+    from automation.page_runner import create_pages_bulk, creator_profiles
 
-    task = get_task(task_id)
+    task = _storage().get_task(task_id)
     if not task:
+        clear_cancel(task_id)
         return
+    register(task_id)
 
-    headless = getattr(settings, 'SELENIUM_HEADLESS', False)
-    timeout = getattr(settings, 'SELENIUM_TIMEOUT', 30)
-    test_mode = getattr(settings, 'SELENIUM_TEST_MODE', False)
+    # Format: [{'email': 'x@x.com', 'password': 'xxx', 'name': 'Profile 1'}, ...]
+    profiles = creator_profiles(CREATOR_PROFILES, CREATOR_EMAIL, CREATOR_PASSWORD, PAGES_PER_PROFILE)
 
-    # Get pages per profile before rotation (default: 3)
-    pages_per_profile = getattr(settings, 'PAGES_PER_PROFILE', 3)
+    # Page names with 70% female / 30% male distribution, generated up front
+    names_with_gender = get_page_names_for_sequence(task['base_page_name'], task['num_pages'])
 
-    # Get list of creator profiles for rotation
-    # Format: [{'email': 'x@x.com', 'password': 'xxx', 'name': 'Profile 1'}, ...]
-    creator_profiles = getattr(settings, 'CREATOR_PROFILES', [])
-
-    # Fallback to single profile if no rotation profiles configured
-    if not creator_profiles:
-        creator_email = getattr(settings, 'CREATOR_PROFILE_EMAIL', '')
-        creator_password = getattr(settings, 'CREATOR_PROFILE_PASSWORD', '')
-        if creator_email and creator_password:
-            creator_profiles = [{
-                'email': creator_email,
-                'password': creator_password,
-                'name': 'Default Profile',
-                'pages_per_session': pages_per_profile
-            }]
-
-    # Get the public profile URL to share pages to (from the task/form)
-    public_profile_url = task.get('public_profile_url', '')
+    try:
+        # Each thread waits for a free browser while SELENIUM_MAX_BROWSERS are in use
+        results = create_pages_bulk(
+            _storage(), task_id, names_with_gender, profiles, concurrency=SEL_WORKERS,
+            headless=_headless(False), test_mode=SEL_TEST_MODE, timeout=SEL_TIMEOUT,
+            pages_per_profile=PAGES_PER_PROFILE,
+            public_profile_url=task.get('public_profile_url', ''),
+            assigned_bm=task.get('assigned_bm', ''),
+        )
+
+        # Same rule as the Celery path's finalize_pages_task
+        final_status = 'completed'
+        if results['success'] == 0 and (results['failed'] > 0 or results.get('error')):
+            final_status = 'failed'
+        # A cancelled task stays cancelled
+        _storage().finish_task(task_id, final_status, error_message=results.get('error'))
+    except Exception as e:
+        _storage().finish_task(task_id, 'failed', error_message=str(e))
+    finally:
+        clear_cancel(task_id)
+
+
+# Last Celery probe result, reused for _CELERY_CHECK_TTL seconds so a POST
+# doesn't pay a broker connection and a worker ping every time
+_CELERY_LOCK = threading.Lock()
+_CELERY_CHECK_TTL = 30
+_celery_check = (0.0, None)
 
+
+def _celery_available() -> bool:
+    """True when jobs can be queued and a Celery worker is there to run them"""
+    global _celery_check
+
+    # In eager mode delay() would run the whole job inside the request
+    if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+        return False
+
+    with _CELERY_LOCK:
+        checked_at, available = _celery_check
+        if available is None or time.monotonic() - checked_at >= _CELERY_CHECK_TTL:
+            available = _probe_celery()
+            _celery_check = (time.monotonic(), available)
+        return available
+
+
+def _probe_celery() -> bool:
+    """Check the broker connection and ping for a worker"""
     try:
-        with FacebookPageGenerator(
-            headless=headless,
-            timeout=timeout,
-            test_mode=test_mode,
-            pages_per_profile=pages_per_profile
-        ) as generator:
-
-            # Set up multi-profile rotation
-            if creator_profiles and not test_mode:
-                generator.set_profiles(creator_profiles)
-                print(f">>> MULTI-PROFILE MODE: {len(creator_profiles)} profiles configured")
-                print(f">>> Pages per profile before rotation: {pages_per_profile}")
-
-                # Login with first profile
-                login_success = generator.login_with_rotation()
-                if not login_success:
-                    update_task_status(task_id, 'failed', error_message='Facebook login failed for all profiles')
-                    return
-            elif not test_mode:
-                update_task_status(task_id, 'failed', error_message='No creator profiles configured')
-                return
-
-            # Track current profile for logging
-            current_profile_email = generator.current_profile_email
-
-            # Create pages with profile rotation
-            for i in range(1, task['num_pages'] + 1):
-                current = get_task(task_id)
-                if current and current.get('status') == 'cancelled':
-                    print(">>> Task cancelled by user")
-                    break
-
-                # Check if we should rotate to next profile before creating page
-                if not test_mode and generator.should_rotate_profile():
-                    print(f">>> ROTATION: Profile {current_profile_email} reached page limit")
-                    rotation_status = generator.get_rotation_status()
-                    print(f">>> Status: {rotation_status}")
-
-                    if generator.has_more_profiles():
-                        rotated = generator.rotate_to_next_profile()
-                        if rotated:
-                            current_profile_email = generator.current_profile_email
-                            print(f">>> ROTATION: Switched to profile: {current_profile_email}")
-                        else:
-                            print(">>> ROTATION: Failed to rotate, continuing with current profile")
-                    else:
-                        print(">>> ROTATION: No more profiles available, continuing with current")
-
-                # Generate page name with 70% female / 30% male distribution
-                page_name, gender = get_page_name_for_sequence(
-                    task['base_page_name'], i, task['num_pages']
-                )
+        from celery import current_app
+        # Fail fast instead of letting publish retry against a dead broker
+        with current_app.connection_for_write() as conn:
+            conn.ensure_connection(max_retries=1)
+        # A reachable broker with no worker would leave the job queued forever
+        if not current_app.control.ping(timeout=1.0, limit=1):
+            logger.warning("No Celery worker answered the ping")
+            return False
+        return True
+    except Exception as e:
+        logger.warning(f"Celery broker unavailable: {e}")
+        return False
+
 
-                print(f">>> [{current_profile_email}] Creating page {i}/{task['num_pages']}: {page_name}")
-
-                # STEP 1: Create the page (now waits up to 120 sec for URL to stabilize)
-                result = generator.create_facebook_page(page_name)
-
-                if result.success:
-                    # Track page count for rotation
-                    generator.increment_page_count()
-
-                    # STEP 2: Store page details with the correct URL
-                    # store_page_details validates URL - returns None if invalid
-                    stored_id = store_page_details(
-                        task_id=task_id,
-                        page_id=result.page_id,
-                        page_name=result.page_name,
-                        page_url=result.page_url,
-                        sequence_num=i,
-                        gender=gender
-                    )
-
-                    if stored_id:
-                        # Page stored successfully with valid URL
-                        increment_task_counter(task_id, 'pages_created')
-                        print(f">>> ✓ Page '{page_name}' stored in database with ID: {result.page_id}")
-                    else:
-                        # URL was invalid - page not stored
-                        increment_task_counter(task_id, 'pages_failed')
-                        print(f">>> ✗ Page '{page_name}' NOT stored - invalid URL: {result.page_url}")
-                        continue  # Skip to next page, don't try to share
-
-                    # STEP 3: IMMEDIATELY share to profile (while still on the page)
-                    # This is done right after page creation to avoid searching for the page later
-                    if public_profile_url:
-                        print(f">>> Immediately sharing page '{page_name}' to profile...")
-                        invite_result = generator.share_page_to_profile(
-                            page_id=result.page_id,
-                            profile_url=public_profile_url,
-                            role='admin',
-                            page_name=result.page_name
-                        )
-
-                        if invite_result.success:
-                            store_invite(
-                                page_id=result.page_id,
-                                page_name=result.page_name,
-                                invitee_email=public_profile_url,
-                                invite_link=invite_result.invite_link,
-                                role='admin',
-                                invited_by=current_profile_email
-                            )
-                            increment_task_counter(task_id, 'shares_sent')
-                            print(f">>> Successfully shared page '{page_name}' to profile")
-                        else:
-                            increment_task_counter(task_id, 'shares_failed')
-                            print(f">>> Failed to share page '{page_name}': {invite_result.error}")
-                else:
-                    # Page creation FAILED - immediately try next profile
-                    print(f">>> FAILED to create page '{page_name}': {result.error}")
-
-                    # Check for rate limit indicators in error message
-                    error_lower = (result.error or "").lower()
-                    is_rate_limit = any(phrase in error_lower for phrase in [
-                        "too many", "rate limit", "try again later",
-                        "temporarily blocked", "slow down", "limit reached"
-                    ])
-
-                    if is_rate_limit:
-                        print(f">>> RATE LIMIT DETECTED: '{result.error}'")
-
-                    # On ANY page creation failure, try rotating to next profile
-                    if not test_mode and generator.has_more_profiles():
-                        print(f">>> Page creation failed! Switching to next profile...")
-                        rotated = generator.rotate_to_next_profile()
-                        if rotated:
-                            current_profile_email = generator.current_profile_email
-                            print(f">>> Switched to profile: {current_profile_email}")
-
-                            # RETRY creating the same page with new profile
-                            print(f">>> RETRYING page '{page_name}' with new profile...")
-                            retry_result = generator.create_facebook_page(page_name)
-
-                            if retry_result.success:
-                                generator.increment_page_count()
-                                stored_id = store_page_details(
-                                    task_id=task_id,
-                                    page_id=retry_result.page_id,
-                                    page_name=retry_result.page_name,
-                                    page_url=retry_result.page_url,
-                                    sequence_num=i,
-                                    gender=gender
-                                )
-                                if stored_id:
-                                    increment_task_counter(task_id, 'pages_created')
-                                    print(f">>> ✓ RETRY SUCCESS: Page '{page_name}' created with new profile!")
-
-                                    # Share to profile if URL provided
-                                    if public_profile_url:
-                                        invite_result = generator.share_page_to_profile(
-                                            page_id=retry_result.page_id,
-                                            profile_url=public_profile_url,
-                                            role='admin',
-                                            page_name=retry_result.page_name
-                                        )
-                                        if invite_result.success:
-                                            store_invite(
-                                                page_id=retry_result.page_id,
-                                                page_name=retry_result.page_name,
-                                                invitee_email=public_profile_url,
-                                                invite_link=invite_result.invite_link,
-                                                role='admin',
-                                                invited_by=current_profile_email
-                                            )
-                                            increment_task_counter(task_id, 'shares_sent')
-                                        else:
-                                            increment_task_counter(task_id, 'shares_failed')
-                                    continue  # Move to next page
-                                else:
-                                    increment_task_counter(task_id, 'pages_failed')
-                            else:
-                                # Retry also failed
-                                increment_task_counter(task_id, 'pages_failed')
-                                print(f">>> ✗ RETRY FAILED: Page '{page_name}' still couldn't be created")
-                        else:
-                            # Rotation failed
-                            increment_task_counter(task_id, 'pages_failed')
-                            print(f">>> No more profiles to try, marking page as failed")
-                    else:
-                        # No more profiles available or in test mode
-                        increment_task_counter(task_id, 'pages_failed')
-                        if not generator.has_more_profiles():
-                            print(f">>> No more profiles available - cannot retry")
-
-            # Log final rotation status
-            if not test_mode:
-                final_status = generator.get_rotation_status()
-                print(f">>> TASK COMPLETE. Final rotation status: {final_status}")
-
-        update_task_status(task_id, 'completed')
+def _start_with_celery(task_id: str) -> bool:
+    """Queue create_pages_task for the task; False when it must run in-process"""
+    # Opt-in (PAGES_USE_CELERY); workers only share MongoDB with us, the JSON
+    # store lives in this process
+    if not getattr(settings, 'PAGES_USE_CELERY', False):
+        return False
+    if _storage().STORAGE_TYPE != "mongodb" or not _celery_available():
+        return False
+
+    from automation.tasks import create_pages_task
+    try:
+        # Same mode and browser settings as the in-process run_task_sync
+        create_pages_task.delay(task_id, test_mode=SEL_TEST_MODE, headless=_headless(False))
     except Exception as e:
-        update_task_status(task_id, 'failed', error_message=str(e))
+        logger.warning(f"Could not queue task {task_id}, running it in-process: {e}")
+        return False
+    return True
 
 
 @api_view(['GET', 'POST'])
 def tasks_list(request):
     if request.method == 'GET':
-        tasks = get_all_tasks(limit=50)
+        tasks = _storage().get_all_tasks(limit=50)
         for task in tasks:
             total = task['num_pages']
             created = task.get('pages_created', 0)
@@ -331,14 +240,14 @@ def tasks_list(request):
         if 'facebook.com' not in public_profile_url:
             return Response({'error': 'public_profile_url must be a valid Facebook URL'}, status=status.HTTP_400_BAD_REQUEST)
 
-        task_id = create_task(
+        task_id = _storage().create_task(
             profile_id=request.data.get('profile_id', ''),
             num_pages=int(num_pages),
             page_name=page_name,
             public_profile_url=public_profile_url
         )
 
-        task = get_task(task_id)
+        task = _storage().get_task(task_id)
         task['id'] = task.pop('_id')
         task['progress'] = 0
         task['pages'] = []
@@ -347,87 +256,160 @@ def tasks_list(request):
 
 @api_view(['GET', 'DELETE'])
 def task_detail(request, task_id):
-    task = get_task(task_id)
-    if not task:
-        return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
-
     if request.method == 'GET':
-        task['pages'] = get_pages_by_task(task_id)
+        # Task, its pages and progress in a single storage call
+        task = _storage().get_task_with_pages(task_id)
+        if not task:
+            return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
         task['id'] = task.pop('_id')
-        total = task['num_pages']
-        created = task.get('pages_created', 0)
-        failed = task.get('pages_failed', 0)
-        task['progress'] = round(((created + failed) / total) * 100, 1) if total > 0 else 0
         return Response(task)
 
     elif request.method == 'DELETE':
+        if not _storage().get_task_status(task_id):
+            return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
+
         # Permanently delete the task and all associated pages/invites
-        deleted = delete_task(task_id)
+        deleted = _storage().delete_task(task_id)
         if deleted:
             return Response({'message': 'Task permanently deleted'})
         else:
             return Response({'error': 'Failed to delete task'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# task_stream: poll interval without change streams, and the longest gap
+# between messages (a keep-alive comment when nothing changed)
+TASK_STREAM_POLL_SECONDS = 2
+TASK_STREAM_KEEPALIVE_SECONDS = 15
+_TASK_STREAM_FIELDS = ('status', 'num_pages', 'pages_created', 'pages_failed',
+                       'shares_sent', 'shares_failed', 'error_message')
+_TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+def _task_updates(task_id):
+    """
+    Task documents as they change, with None for "no change yet"; ends
+    when the task is deleted. Uses a MongoDB change stream when available,
+    otherwise polls every TASK_STREAM_POLL_SECONDS.
+    """
+    storage = _storage()
+    if storage.STORAGE_TYPE == 'mongodb':
+        try:
+            yield from storage.watch_task(task_id, TASK_STREAM_KEEPALIVE_SECONDS * 1000)
+            return
+        except Exception as e:
+            # Standalone mongod: change streams need a replica set
+            logger.info(f"Change stream unavailable for task {task_id}, polling instead: {e}")
+
+    while True:
+        task = storage.get_task_fields(task_id, *_TASK_STREAM_FIELDS)
+        if not task:
+            return
+        yield task
+        time.sleep(TASK_STREAM_POLL_SECONDS)
+
+
+def _task_events(task_id):
+    """Server-sent events with the task's progress, one per change"""
+    last = None
+    last_sent = time.monotonic()
+    for task in _task_updates(task_id):
+        if task is not None:
+            snapshot = {field: task.get(field) for field in _TASK_STREAM_FIELDS}
+            total = snapshot['num_pages'] or 0
+            done = (snapshot['pages_created'] or 0) + (snapshot['pages_failed'] or 0)
+            snapshot['progress'] = round((done / total) * 100, 1) if total > 0 else 0
+            if snapshot != last:
+                last = snapshot
+                last_sent = time.monotonic()
+                yield f"data: {json.dumps(snapshot, default=str)}\n\n"
+                if snapshot['status'] in _TERMINAL_STATUSES:
+                    return
+                continue
+        if time.monotonic() - last_sent >= TASK_STREAM_KEEPALIVE_SECONDS:
+            # Writing to a closed connection is how a client disconnect surfaces
+            last_sent = time.monotonic()
+            yield ": keepalive\n\n"
+    yield "event: deleted\ndata: {}\n\n"
+
+
+@require_GET
+def task_stream(request, task_id):
+    """
+    Stream a task's progress as server-sent events instead of having the
+    client poll task_detail. Each message carries the status, counters and
+    progress; the stream ends once the task reaches a terminal status.
+    An open stream occupies a server worker thread.
+    """
+    if not _storage().get_task_status(task_id):
+        return JsonResponse({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
+
+    response = StreamingHttpResponse(_task_events(task_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @api_view(['POST'])
 def task_start(request, task_id):
-    task = get_task(task_id)
+    # Check-and-set in one step, so two concurrent starts can't both run the task
+    task = _storage().start_task_atomic(task_id)
     if not task:
-        return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
-
-    if task['status'] != 'pending':
-        return Response({'error': f"Cannot start. Status: {task['status']}"}, status=status.HTTP_400_BAD_REQUEST)
-
-    update_task_status(task_id, 'running')
+        task_status = _storage().get_task_status(task_id)
+        if not task_status:
+            return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response({'error': f"Cannot start. Status: {task_status}"}, status=status.HTTP_400_BAD_REQUEST)
 
-    # Run in background thread
-    thread = threading.Thread(target=run_task_sync, args=(task_id,))
-    thread.daemon = True
-    thread.start()
+    # Run it in a background thread, or on a Celery worker when
+    # PAGES_USE_CELERY is set and a worker is up
+    if not _start_with_celery(task_id):
+        # Registered before the thread starts so an early cancel is seen
+        register(task_id)
+        thread = threading.Thread(target=run_task_sync, args=(task_id,))
+        thread.daemon = True
+        thread.start()
 
-    task = get_task(task_id)
-    task['id'] = task.pop('_id')
-    task['progress'] = 0
-    return Response(task)
+    # Just the fields that changed; the client merges them into its copy
+    return Response({'id': task_id, 'status': task['status'], 'progress': 0})
 
 
 @api_view(['POST'])
 def task_cancel(request, task_id):
-    task = get_task(task_id)
+    task = _storage().cancel_task_atomic(task_id)
     if not task:
-        return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
-
-    if task['status'] not in ['pending', 'running']:
+        if not _storage().get_task_status(task_id):
+            return Response({'error': 'Task not found'}, status=status.HTTP_404_NOT_FOUND)
         return Response({'error': 'Cannot cancel'}, status=status.HTTP_400_BAD_REQUEST)
 
-    update_task_status(task_id, 'cancelled')
-    task = get_task(task_id)
-    task['id'] = task.pop('_id')
-    return Response(task)
+    request_cancel(task_id)
+    total = task['num_pages']
+    done = task.get('pages_created', 0) + task.get('pages_failed', 0)
+    progress = round((done / total) * 100, 1) if total > 0 else 0
+    return Response({'id': task_id, 'status': task['status'], 'progress': progress})
 
 
 @api_view(['GET'])
 def pages_list(request):
-    return Response(get_all_pages(limit=100))
+    return Response(_storage().get_all_pages(limit=100))
 
 
 @api_view(['GET', 'POST'])
 def profiles_list(request):
     if request.method == 'GET':
-        return Response(get_all_profiles())
+        return Response(_storage().get_all_profiles())
 
     email = request.data.get('email')
     password = request.data.get('password')
     if not email or not password:
         return Response({'error': 'email and password required'}, status=status.HTTP_400_BAD_REQUEST)
 
-    profile_id = store_profile(email, password, request.data.get('name'))
+    profile_id = _storage().store_profile(email, password, request.data.get('name'))
     return Response({'id': profile_id, 'email': email}, status=status.HTTP_201_CREATED)
 
 
 @api_view(['GET'])
 def efficiency_report(request):
-    return Response(get_efficiency_report())
+    return Response(_storage().get_efficiency_report())
 
 
 @api_view(['POST'])
@@ -440,24 +422,71 @@ def benchmark(request):
     if not isinstance(count, int) or count < 1 or count > 50:
         return Response({'error': 'Count must be 1-50'}, status=status.HTTP_400_BAD_REQUEST)
 
+    # Queue the run on a Celery worker and let the client poll benchmark_status
+    if _celery_available():
+        from automation.tasks import run_benchmark_task
+        try:
+            job = run_benchmark_task.delay(base_name, count, headless, timeout, True)
+            return Response({'job_id': job.id, 'status': 'PENDING'}, status=status.HTTP_202_ACCEPTED)
+        except Exception as e:
+            # The cached probe can be up to _CELERY_CHECK_TTL seconds old
+            logger.warning(f"Could not queue benchmark, running it in the request: {e}")
+
+    # No worker: run it inside the request as before
+    from automation.tasks import run_efficiency_test
+
     try:
-        results = run_efficiency_test(base_name=base_name, count=count, headless=headless, timeout=timeout)
+        results = run_efficiency_test(base_name=base_name, count=count, headless=headless, timeout=timeout,
+                                      wait_timeout=BROWSER_WAIT_SECONDS)
         return Response(results)
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+def benchmark_status(request, job_id):
+    """
+    State of a queued benchmark, with its results once finished.
+
+    GET /api/automation/benchmark/<job_id>/
+    """
+    from celery.result import AsyncResult
+
+    job = AsyncResult(job_id)
+    data = {'job_id': job_id, 'status': job.state}
+    if job.successful():
+        data['results'] = job.result
+    elif job.failed():
+        data['error'] = str(job.result)
+    return Response(data)
+
+
+# Last health result, served to rapid pollers for _HEALTH_CACHE_TTL seconds
+_HEALTH_LOCK = threading.Lock()
+_HEALTH_CACHE_TTL = 5
+_health_cache = (0.0, None)
+
+
 @api_view(['GET'])
 def health_check(request):
-    health = {'api': 'healthy', 'storage': STORAGE_TYPE, 'selenium': 'unknown'}
+    global _health_cache
 
-    try:
-        from automation.selenium_driver import FacebookPageGenerator
-        with FacebookPageGenerator(headless=True, timeout=10, test_mode=True) as gen:
-            result = gen.create_facebook_page("HealthCheck")
-            health['selenium'] = 'healthy' if result.success else f'failed: {result.error}'
-    except Exception as e:
-        health['selenium'] = f'error: {str(e)}'
+    with _HEALTH_LOCK:
+        checked_at, cached = _health_cache
+        if cached and time.monotonic() - checked_at < _HEALTH_CACHE_TTL:
+            return Response(cached)
+
+        health = {'api': 'healthy', 'storage': _storage().STORAGE_TYPE, 'selenium': 'unknown'}
+
+        try:
+            from automation import driver_pool
+            with driver_pool.acquire(headless=True, test_mode=True, timeout=10, wait_timeout=5) as gen:
+                result = gen.create_facebook_page("HealthCheck")
+                health['selenium'] = 'healthy' if result.success else f'failed: {result.error}'
+        except Exception as e:
+            health['selenium'] = f'error: {str(e)}'
+
+        _health_cache = (time.monotonic(), health)
 
     return Response(health)
 
@@ -466,6 +495,9 @@ def health_check(request):
 # Invite People Endpoints
 # ===========================================
 
+VALID_ROLES = ['admin', 'editor', 'moderator', 'advertiser', 'analyst']
+
+
 @api_view(['POST'])
 def invite_person(request, page_id):
     """
@@ -483,31 +515,30 @@ def invite_person(request, page_id):
     if not email:
         return Response({'error': 'email is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-    valid_roles = ['admin', 'editor', 'moderator', 'advertiser', 'analyst']
-    if role.lower() not in valid_roles:
+    if role.lower() not in VALID_ROLES:
         return Response(
-            {'error': f'Invalid role. Must be one of: {", ".join(valid_roles)}'},
+            {'error': f'Invalid role. Must be one of: {", ".join(VALID_ROLES)}'},
             status=status.HTTP_400_BAD_REQUEST
         )
 
     # Get page info
-    page = get_page_by_id(page_id)
+    page = _storage().get_page_by_id(page_id)
     page_name = page['page_name'] if page else f"Page {page_id}"
 
     # Send invite via Selenium
-    from automation.selenium_driver import FacebookPageGenerator
-    from django.conf import settings
+    from automation import driver_pool
 
-    headless = getattr(settings, 'SELENIUM_HEADLESS', True)
-    timeout = getattr(settings, 'SELENIUM_TIMEOUT', 30)
+    headless = _headless(True)
+    timeout = SEL_TIMEOUT
 
     try:
-        with FacebookPageGenerator(headless=headless, timeout=timeout, test_mode=True) as generator:
+        with driver_pool.acquire(headless=headless, test_mode=True, timeout=timeout,
+                                 wait_timeout=BROWSER_WAIT_SECONDS) as generator:
             result = generator.invite_people(page_id, email, role)
 
             if result.success:
                 # Store invite record
-                invite_id = store_invite(
+                invite_id = _storage().store_invite(
                     page_id=page_id,
                     page_name=page_name,
                     invitee_email=email,
@@ -535,31 +566,103 @@ def invite_person(request, page_id):
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['POST'])
+def share_page(request, page_id):
+    """
+    Share a Facebook Page to several profiles, SELENIUM_WORKERS at a time.
+
+    POST /api/pages/<page_id>/share/
+    {
+        "profiles": [
+            {"profile_url": "https://www.facebook.com/profile.php?id=61581753605988",
+             "profile_name": "Marisse Dalton"},
+            ...
+        ],
+        "role": "admin"
+    }
+    """
+    profiles = request.data.get('profiles')
+    role = request.data.get('role', 'admin')
+
+    if not profiles or not isinstance(profiles, list):
+        return Response({'error': 'profiles must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+    pairs = []
+    for profile in profiles:
+        profile_url = profile.get('profile_url', '') if isinstance(profile, dict) else ''
+        if 'facebook.com' not in profile_url:
+            return Response({'error': 'each profile needs a Facebook profile_url'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        pairs.append((profile_url, profile.get('profile_name', '')))
+
+    if role.lower() not in VALID_ROLES:
+        return Response(
+            {'error': f'Invalid role. Must be one of: {", ".join(VALID_ROLES)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    page = _storage().get_page_by_id(page_id)
+    page_name = page['page_name'] if page else f"Page {page_id}"
+
+    from automation.page_runner import share_page_to_profiles
+
+    results = share_page_to_profiles(
+        page_id, pairs, role=role, page_name=page_name, concurrency=SEL_WORKERS,
+        headless=_headless(True), test_mode=SEL_TEST_MODE, timeout=SEL_TIMEOUT,
+        email=CREATOR_EMAIL, password=CREATOR_PASSWORD, wait_timeout=BROWSER_WAIT_SECONDS,
+    )
+
+    invites = []
+    for result in results:
+        invite = {'profile_url': result.invitee_email, 'success': result.success}
+        if result.success:
+            invite['invite_id'] = _storage().store_invite(
+                page_id=page_id,
+                page_name=page_name,
+                invitee_email=result.invitee_email,
+                invite_link=result.invite_link,
+                role=role,
+                invited_by=request.data.get('invited_by', '')
+            )
+        else:
+            invite['error'] = result.error
+        invites.append(invite)
+
+    sent = sum(1 for invite in invites if invite['success'])
+    return Response({
+        'success': sent > 0,
+        'page_id': page_id,
+        'role': role,
+        'sent': sent,
+        'failed': len(invites) - sent,
+        'invites': invites,
+    }, status=status.HTTP_201_CREATED if sent else status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @api_view(['GET'])
 def page_invites(request, page_id):
     """Get all invites for a specific page"""
-    invites = get_invites_by_page(page_id)
+    invites = _storage().get_invites_by_page(page_id)
     return Response(invites)
 
 
 @api_view(['GET'])
 def invites_list(request):
     """Get all invites"""
-    invites = get_all_invites(limit=100)
+    invites = _storage().get_all_invites(limit=100)
     return Response(invites)
 
 
 @api_view(['POST'])
 def accept_invite(request, invite_id):
     """Mark an invite as accepted"""
-    update_invite_status(invite_id, 'accepted')
+    _storage().update_invite_status(invite_id, 'accepted')
     return Response({'message': 'Invite accepted', 'status': 'accepted'})
 
 
 @api_view(['POST'])
 def decline_invite(request, invite_id):
     """Mark an invite as declined"""
-    update_invite_status(invite_id, 'declined')
+    _storage().update_invite_status(invite_id, 'declined')
     return Response({'message': 'Invite declined', 'status': 'declined'})
 
 
@@ -586,21 +689,21 @@ def test_invite_access(request):
     if not profile_name:
         return Response({'success': False, 'error': 'profile_name is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-    from automation.selenium_driver import FacebookPageGenerator
-    from django.conf import settings
+    from automation import driver_pool
 
-    headless = getattr(settings, 'SELENIUM_HEADLESS', False)
-    timeout = getattr(settings, 'SELENIUM_TIMEOUT', 30)
-    creator_email = getattr(settings, 'CREATOR_PROFILE_EMAIL', '')
-    creator_password = getattr(settings, 'CREATOR_PROFILE_PASSWORD', '')
+    headless = _headless(False)
+    timeout = SEL_TIMEOUT
+    creator_email = CREATOR_EMAIL
+    creator_password = CREATOR_PASSWORD
 
     details_log = []
 
     try:
-        with FacebookPageGenerator(headless=headless, timeout=timeout, test_mode=False) as generator:
-            # Login first
+        with driver_pool.acquire(headless=headless, test_mode=False, timeout=timeout,
+                                 wait_timeout=BROWSER_WAIT_SECONDS) as generator:
+            # Login first (skipped when the pooled browser is still logged in)
             details_log.append("Step 1: Logging in to Facebook...")
-            login_success = generator.login_facebook(email=creator_email, password=creator_password)
+            login_success = driver_pool.ensure_logged_in(generator, creator_email, creator_password)
 
             if not login_success:
                 return Response({
@@ -614,8 +717,10 @@ def test_invite_access(request):
             page_url = f"https://www.facebook.com/profile.php?id={page_id}"
             details_log.append(f"Step 2: Navigating to page: {page_url}")
             generator.driver.get(page_url)
-            time.sleep(3)
-            details_log.append("Page loaded!")
+            if generator.wait_for_page_load():
+                details_log.append("Page loaded!")
+            else:
+                details_log.append("Page still loading after 10s, continuing...")
 
             # Call share_page_to_profile
             details_log.append(f"Step 3: Starting invite access flow for profile: {profile_name} ({profile_url})")
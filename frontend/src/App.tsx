@@ -112,7 +112,8 @@ function App() {
 
       // Auto-start the task immediately after creation
       try {
-        const startedTask = await taskService.startTask(task.id);
+        const update = await taskService.startTask(task.id);
+        const startedTask = { ...task, ...update };
         setTasks(prev => prev.map(t => t.id === task.id ? startedTask : t));
         setSelectedTask(startedTask);
         setSuccess(`Automation started! Creating ${task.num_pages} pages with "${task.base_page_name}"`);
@@ -130,9 +131,9 @@ function App() {
 
   const handleStartTask = async (id: string) => {
     try {
-      const task = await taskService.startTask(id);
-      setTasks(prev => prev.map(t => t.id === id ? task : t));
-      if (selectedTask?.id === id) setSelectedTask(task);
+      const update = await taskService.startTask(id);
+      setTasks(prev => prev.map(t => t.id === id ? { ...t, ...update } : t));
+      if (selectedTask?.id === id) setSelectedTask({ ...selectedTask, ...update });
     } catch (err) {
       setError('Failed to start task');
     }
@@ -140,9 +141,9 @@ function App() {
 
   const handleCancelTask = async (id: string) => {
     try {
-      const task = await taskService.cancelTask(id);
-      setTasks(prev => prev.map(t => t.id === id ? task : t));
-      if (selectedTask?.id === id) setSelectedTask(task);
+      const update = await taskService.cancelTask(id);
+      setTasks(prev => prev.map(t => t.id === id ? { ...t, ...update } : t));
+      if (selectedTask?.id === id) setSelectedTask({ ...selectedTask, ...update });
     } catch (err) {
       setError('Failed to cancel task');
     }
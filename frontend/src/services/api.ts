@@ -9,6 +9,7 @@ import {
   InviteRequest,
   InviteResponse,
   GeneratedPage,
+  TaskStatusUpdate,
 } from '../types';
 
 // Use relative URL when deployed (same origin), localhost for development
@@ -41,13 +42,13 @@ export const taskService = {
   },
 
   // Start task
-  startTask: async (id: string): Promise<PageGenerationTask> => {
+  startTask: async (id: string): Promise<TaskStatusUpdate> => {
     const response = await api.post(`/tasks/${id}/start/`);
     return response.data;
   },
 
   // Cancel task
-  cancelTask: async (id: string): Promise<PageGenerationTask> => {
+  cancelTask: async (id: string): Promise<TaskStatusUpdate> => {
     const response = await api.post(`/tasks/${id}/cancel/`);
     return response.data;
   },
@@ -70,11 +71,40 @@ export const taskService = {
   },
 };
 
+// How often to poll a queued benchmark job
+const BENCHMARK_POLL_MS = 2000;
+// Give up on a job no worker has started after this long
+const BENCHMARK_QUEUE_WAIT_MS = 2 * 60 * 1000;
+// ...and on any job after the worker's CELERY_TASK_TIME_LIMIT
+const BENCHMARK_MAX_WAIT_MS = 30 * 60 * 1000;
+
 export const automationService = {
-  // Run benchmark
+  // Run benchmark (waits for the worker job when the backend queues it)
   runBenchmark: async (data: BenchmarkRequest): Promise<BenchmarkResult> => {
     const response = await api.post('/automation/benchmark/', data);
-    return response.data;
+    if (response.status !== 202) {
+      return response.data;
+    }
+
+    const jobId = response.data.job_id;
+    const startedAt = Date.now();
+    for (;;) {
+      await new Promise((resolve) => setTimeout(resolve, BENCHMARK_POLL_MS));
+      const { data: job } = await api.get(`/automation/benchmark/${jobId}/`);
+      if (job.status === 'SUCCESS') {
+        return job.results;
+      }
+      if (job.status === 'FAILURE' || job.status === 'REVOKED') {
+        throw new Error(job.error || 'Benchmark failed');
+      }
+      const waited = Date.now() - startedAt;
+      if (job.status === 'PENDING' && waited > BENCHMARK_QUEUE_WAIT_MS) {
+        throw new Error('Benchmark was not picked up by a worker');
+      }
+      if (waited > BENCHMARK_MAX_WAIT_MS) {
+        throw new Error('Benchmark timed out');
+      }
+    }
   },
 
   // Health check
@@ -105,6 +135,23 @@ export const inviteService = {
     return response.data;
   },
 
+  // Share a page to several profiles at once
+  sharePage: async (
+    pageId: string,
+    profiles: { profile_url: string; profile_name?: string }[],
+    role = 'admin'
+  ): Promise<{
+    success: boolean;
+    page_id: string;
+    role: string;
+    sent: number;
+    failed: number;
+    invites: { profile_url: string; success: boolean; invite_id?: string; error?: string }[];
+  }> => {
+    const response = await api.post(`/pages/${pageId}/share/`, { profiles, role });
+    return response.data;
+  },
+
   // Get invites for a specific page
   getPageInvites: async (pageId: string): Promise<PageInvite[]> => {
     const response = await api.get(`/pages/${pageId}/invites/`);
@@ -34,6 +34,9 @@ export interface PageGenerationTask {
   count?: number;
 }
 
+// Returned by start/cancel: only the fields those actions change
+export type TaskStatusUpdate = Pick<PageGenerationTask, 'id' | 'status' | 'progress'>;
+
 export interface EfficiencyReport {
   total_tasks: number;
   total_pages: number;